@@ -0,0 +1,327 @@
+"""
+Exports or imports skins on many scene files without the interface.
+
+Scenes are split into shards that each run in their own mayapy process,
+and a json report with every scene's timings and failures is written at the end.
+Skins for each scene go in a sub-folder named after the scene.
+
+Run it with mayapy from the scripts folder:
+    mayapy -m weights_editor_tool.batch export a.ma b.ma --folder D:/skins --workers 4 --report D:/skins/report.json
+    mayapy -m weights_editor_tool.batch import a.ma b.ma --folder D:/skins --world-space --save
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+import argparse
+import traceback
+import subprocess
+
+# Add tool to PYTHONPATH.
+root_path = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+from weights_editor_tool.enums import SkinCompression
+from weights_editor_tool.classes.skin_file import SkinFile
+
+ExportMode = "export"
+ImportMode = "import"
+
+DefaultWorkerCount = 2
+
+
+def get_shards(scene_paths, shard_count):
+    """
+    Splits scenes into groups of about the same total file size.
+    The biggest scenes are handed out first, each to the shard with the least work so far.
+
+    Args:
+        scene_paths(string[]): Absolute paths to scene files.
+        shard_count(int): Most groups to make.
+
+    Returns:
+        A list of lists of scene paths. Empty shards are left out.
+    """
+    def get_size(scene_path):
+        try:
+            return os.path.getsize(scene_path)
+        except OSError:
+            return 0
+
+    shards = [[] for i in range(max(1, shard_count))]
+    sizes = [0] * len(shards)
+
+    for scene_path in sorted(scene_paths, key=get_size, reverse=True):
+        shard_index = sizes.index(min(sizes))
+        shards[shard_index].append(scene_path)
+        sizes[shard_index] += max(1, get_size(scene_path))
+
+    return [shard for shard in shards if shard]
+
+
+def get_scene_folder(folder, scene_path):
+    """
+    Returns:
+        The folder a scene's skins are exported to or imported from.
+    """
+    return os.path.join(folder, os.path.splitext(os.path.basename(scene_path))[0])
+
+
+def process_scenes(mode, scene_paths, folder, options):
+    """
+    Opens each scene and exports or imports all of its skins. Has to run inside Maya.
+
+    Args:
+        mode(string): Either ExportMode or ImportMode.
+        scene_paths(string[]): Absolute paths to scene files.
+        folder(string): The folder that holds a sub-folder of skins for each scene.
+        options(dict): Keyword arguments for SkinnedObj.export_all_skins() or SkinnedObj.import_all_skins().
+                       Imports also take "save" to save each scene afterwards.
+
+    Returns:
+        A list of each scene's results.
+        [{"scene": string, "open_time": float, "total_time": float, "skins": list, "error": string}...]
+    """
+    from maya import cmds
+    from weights_editor_tool.classes.skinned_obj import SkinnedObj
+
+    options = dict(options)
+    save = options.pop("save", False)
+
+    results = []
+
+    for scene_path in scene_paths:
+        result = {
+            "scene": scene_path,
+            "open_time": 0.0,
+            "total_time": 0.0,
+            "skins": [],
+            "error": None
+        }
+        results.append(result)
+
+        start = time.time()
+
+        try:
+            cmds.file(scene_path, open=True, force=True)
+            result["open_time"] = time.time() - start
+
+            scene_folder = get_scene_folder(folder, scene_path)
+
+            if mode == ExportMode:
+                result["skins"] = SkinnedObj.export_all_skins(False, export_folder=scene_folder, **options) or []
+            else:
+                if not os.path.exists(scene_folder):
+                    raise RuntimeError("There's no folder of skins for this scene: `{0}`".format(scene_folder))
+
+                result["skins"] = SkinnedObj.import_all_skins(import_folder=scene_folder, **options) or []
+
+                if save:
+                    cmds.file(save=True, force=True)
+        except Exception as err:
+            print(traceback.format_exc())
+            result["error"] = str(err)
+
+        result["total_time"] = time.time() - start
+
+    return results
+
+
+def _run_worker(job_path):
+    """
+    Runs one shard inside this mayapy process and writes its results next to the job file.
+    """
+    with open(job_path, "r") as f:
+        job = json.load(f)
+
+    import maya.standalone
+    maya.standalone.initialize()
+
+    try:
+        results = process_scenes(job["mode"], job["scenes"], job["folder"], job["options"])
+    finally:
+        maya.standalone.uninitialize()
+
+    with open(job["results_path"], "w") as f:
+        json.dump(results, f)
+
+
+def _get_failures(scene_results):
+    failures = []
+
+    for result in scene_results:
+        if result["error"]:
+            failures.append({"scene": result["scene"], "name": None, "error": result["error"]})
+
+        for skin_result in result["skins"]:
+            if skin_result.get("error") and skin_result["error"] != "Cancelled":
+                failures.append({"scene": result["scene"], "name": skin_result["name"], "error": skin_result["error"]})
+
+    return failures
+
+
+def run_batch(mode, scene_paths, folder, options, worker_count=DefaultWorkerCount, mayapy=None):
+    """
+    Shards scenes across mayapy processes and waits for all of them.
+
+    Args:
+        mode(string): Either ExportMode or ImportMode.
+        scene_paths(string[]): Absolute paths to scene files.
+        folder(string): The folder that holds a sub-folder of skins for each scene.
+        options(dict): Passed on to process_scenes().
+        worker_count(int): Most mayapy processes to run at once.
+        mayapy(string): Path to the mayapy executable. Leave as None to use the current interpreter.
+
+    Returns:
+        The report as a dictionary.
+    """
+    start = time.time()
+    job_dir = tempfile.mkdtemp(prefix="weights_editor_batch_")
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([root_path] + [
+        path
+        for path in [env.get("PYTHONPATH")]
+        if path
+    ])
+
+    workers = []
+
+    for shard_index, shard in enumerate(get_shards(scene_paths, worker_count)):
+        job = {
+            "mode": mode,
+            "scenes": shard,
+            "folder": folder,
+            "options": options,
+            "results_path": os.path.join(job_dir, "results{0}.json".format(shard_index))
+        }
+
+        job_path = os.path.join(job_dir, "job{0}.json".format(shard_index))
+        with open(job_path, "w") as f:
+            json.dump(job, f)
+
+        process = subprocess.Popen(
+            [mayapy or sys.executable, "-m", "weights_editor_tool.batch", "--worker-job", job_path],
+            env=env)
+
+        workers.append((shard_index, job, process))
+
+    scene_results = []
+
+    for shard_index, job, process in workers:
+        return_code = process.wait()
+
+        try:
+            with open(job["results_path"], "r") as f:
+                shard_results = json.load(f)
+        except (IOError, ValueError):
+            # The process died before it could write anything, so every scene in it failed.
+            shard_results = [
+                {
+                    "scene": scene_path,
+                    "open_time": 0.0,
+                    "total_time": 0.0,
+                    "skins": [],
+                    "error": "Worker exited with code {0}".format(return_code)
+                }
+                for scene_path in job["scenes"]
+            ]
+
+        for result in shard_results:
+            result["worker"] = shard_index
+
+        scene_results.extend(shard_results)
+
+    shutil.rmtree(job_dir, ignore_errors=True)
+
+    failures = _get_failures(scene_results)
+
+    return {
+        "mode": mode,
+        "folder": folder,
+        "worker_count": len(workers),
+        "total_time": time.time() - start,
+        "scenes": sorted(scene_results, key=lambda result: result["scene"]),
+        "failures": failures
+    }
+
+
+def _parse_args(args):
+    parser = argparse.ArgumentParser(
+        prog="weights_editor_tool.batch",
+        description="Exports or imports skins on many scene files.")
+
+    parser.add_argument("mode", choices=[ExportMode, ImportMode])
+    parser.add_argument("scenes", nargs="+", help="Scene files to process.")
+    parser.add_argument("--folder", required=True, help="Folder that holds a sub-folder of skins for each scene.")
+    parser.add_argument("--workers", type=int, default=DefaultWorkerCount, help="Most mayapy processes to run at once.")
+    parser.add_argument("--report", help="Where to write the json report. Prints it if left out.")
+    parser.add_argument("--mayapy", help="The mayapy executable for the workers. Defaults to this interpreter.")
+
+    export_group = parser.add_argument_group("export")
+    export_group.add_argument(
+        "--compression",
+        default=SkinCompression.Uncompressed,
+        choices=[
+            codec
+            for codec in [SkinCompression.Uncompressed, SkinCompression.Zlib, SkinCompression.Lzma, SkinCompression.ShuffleZlib]
+            if SkinFile.is_codec_available(codec)
+        ])
+    export_group.add_argument("--incremental", action="store_true", help="Skip skins that didn't change.")
+
+    import_group = parser.add_argument_group("import")
+    import_group.add_argument("--world-space", action="store_true", help="Match vertexes by world position.")
+    import_group.add_argument("--interpolate", action="store_true", help="Blend from the closest triangles.")
+    import_group.add_argument("--no-create-infs", action="store_true", help="Fail instead of creating missing influences.")
+    import_group.add_argument("--save", action="store_true", help="Save each scene after importing.")
+
+    return parser.parse_args(args)
+
+
+def main(args=None):
+    if args is None:
+        args = sys.argv[1:]
+
+    if args[:1] == ["--worker-job"]:
+        _run_worker(args[1])
+        return 0
+
+    parsed = _parse_args(args)
+
+    if parsed.mode == ExportMode:
+        options = {
+            "compression": parsed.compression,
+            "incremental": parsed.incremental
+        }
+    else:
+        options = {
+            "world_space": parsed.world_space,
+            "create_missing_infs": not parsed.no_create_infs,
+            "interpolate": parsed.interpolate,
+            "save": parsed.save
+        }
+
+    scene_paths = [os.path.abspath(scene_path) for scene_path in parsed.scenes]
+
+    report = run_batch(
+        parsed.mode, scene_paths, os.path.abspath(parsed.folder), options,
+        worker_count=parsed.workers, mayapy=parsed.mayapy)
+
+    if parsed.report:
+        with open(parsed.report, "w") as f:
+            json.dump(report, f, indent=4)
+    else:
+        print(json.dumps(report, indent=4))
+
+    print("Processed {0} scene(s) in {1:.1f}s with {2} failure(s).".format(
+        len(report["scenes"]), report["total_time"], len(report["failures"])))
+
+    return 1 if report["failures"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+"""
+Shared helpers for the benchmarks.
+
+Run any of them with mayapy from the scripts folder:
+    mayapy -m weights_editor_tool.benchmarks.bench_skin_data
+"""
+
+import os
+import sys
+import time
+import random
+
+# Add tool to PYTHONPATH.
+benchmarks_path = os.path.dirname(os.path.realpath(__file__))
+
+root_path = benchmarks_path.rsplit(os.sep, 2)[0]
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+# Initialize Maya in batch mode.
+if sys.version_info < (3, 0):
+    in_batch_mode = isinstance(sys.stdout, file)
+else:
+    from io import IOBase
+    in_batch_mode = isinstance(sys.stdout, IOBase)
+
+try:
+    if in_batch_mode:
+        import maya.standalone
+        maya.standalone.initialize()
+
+    from maya import cmds
+    from weights_editor_tool import weights_editor_utils as utils
+except ImportError:
+    # Benchmarks on synthetic skins don't need Maya and can run with any Python.
+    cmds = utils = None
+
+
+def create_skinned_sphere(subdivisions, joint_count, max_infs=4, name="benchMesh"):
+    """
+    Builds a sphere skinned to a chain of joints running through it.
+
+    Returns:
+        A tuple of the mesh and its skinCluster.
+    """
+    mesh = cmds.polySphere(name=name, sx=subdivisions, sy=subdivisions)[0]
+
+    cmds.select(clear=True)
+    jnts = [
+        cmds.joint(position=[0, -1 + 2.0 * i / max(joint_count - 1, 1), 0], name="{0}_jnt{1}".format(name, i))
+        for i in range(joint_count)
+    ]
+
+    skin_cluster = utils.build_skin_cluster(mesh, jnts, max_infs=max_infs, name="{0}_skinCluster".format(name))
+    return mesh, skin_cluster
+
+
+def time_it(func, repeat=3, setup=None):
+    """
+    Runs a function a few times.
+
+    Args:
+        func(function): What to time.
+        repeat(int): Number of runs.
+        setup(function): Runs before each run without being timed, like resetting data that func edits.
+
+    Returns:
+        The fastest run in seconds.
+    """
+    best = None
+
+    for i in range(repeat):
+        if setup is not None:
+            setup()
+
+        start = time.time()
+        func()
+        duration = time.time() - start
+
+        if best is None or duration < best:
+            best = duration
+
+    return best
+
+
+def get_deep_size(obj, seen=None):
+    """
+    Estimates the bytes an object takes in memory, including everything it contains.
+    """
+    if seen is None:
+        seen = set()
+
+    if id(obj) in seen:
+        return 0
+
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += get_deep_size(key, seen) + get_deep_size(value, seen)
+    elif isinstance(obj, (list, tuple, set)):
+        for value in obj:
+            size += get_deep_size(value, seen)
+
+    return size
+
+
+def build_skin_dict(vert_count, inf_count, infs_per_vert=4, seed=0):
+    """
+    Generates random skin weights in the old dictionary layout.
+
+    Returns:
+        {vert_index: {"weights": {inf_name: weight_value...}, "dq": float}}
+    """
+    rand = random.Random(seed)
+    inf_names = ["joint{0}".format(i) for i in range(inf_count)]
+    infs_per_vert = min(infs_per_vert, inf_count)
+
+    data = {}
+
+    for vert_index in range(vert_count):
+        infs = rand.sample(inf_names, infs_per_vert)
+        values = [rand.random() for inf in infs]
+        total = sum(values)
+
+        data[vert_index] = {
+            "weights": {
+                inf: value / total
+                for inf, value in zip(infs, values)
+            },
+            "dq": 0.0
+        }
+
+    return data
+
+
+def print_table(headers, rows):
+    widths = [
+        max(len(str(value)) for value in [header] + [row[i] for row in rows])
+        for i, header in enumerate(headers)
+    ]
+
+    line = "  ".join("{{{0}:>{1}}}".format(i, width) for i, width in enumerate(widths))
+
+    print(line.format(*headers))
+    for row in rows:
+        print(line.format(*row))
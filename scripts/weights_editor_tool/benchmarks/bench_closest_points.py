@@ -0,0 +1,91 @@
+"""
+Compares finding the closest file points through a temporary mesh against the PointGrid used by world space imports.
+"""
+
+import random
+
+from maya import cmds
+from maya.api import OpenMaya as om2
+
+from weights_editor_tool.benchmarks import base
+from weights_editor_tool.classes.point_grid import PointGrid
+
+
+Sizes = [
+    # (file point count, target point count)
+    (10000, 10000),
+    (100000, 10000),
+    (500000, 10000)
+]
+
+
+def _build_points(count, seed):
+    rand = random.Random(seed)
+    return [
+        (rand.uniform(-10, 10), rand.uniform(-10, 10), rand.uniform(-10, 10))
+        for i in range(count)
+    ]
+
+
+def _closest_by_temp_mesh(file_points, target_points):
+    """
+    The old approach of building a mesh from the file's points and asking it for the closest face.
+    """
+    mpoints = [om2.MPoint(*point) for point in file_points]
+
+    temp_mfn_mesh = om2.MFnMesh()
+    temp_mfn_mesh.addPolygon(mpoints, False, 0)
+    new_mesh = om2.MFnDagNode(temp_mfn_mesh.parent(0)).fullPathName()
+
+    try:
+        msel_list = om2.MSelectionList()
+        msel_list.add(new_mesh)
+        file_mfn_mesh = om2.MFnMesh(msel_list.getDagPath(0))
+
+        result = []
+
+        for point in target_points:
+            closest_point = file_mfn_mesh.getClosestPoint(om2.MPoint(*point), om2.MSpace.kWorld)
+            face_vertexes = file_mfn_mesh.getPolygonVertices(closest_point[1])
+
+            result.append(min(
+                face_vertexes,
+                key=lambda index: mpoints[index].distanceTo(closest_point[0])))
+
+        return result
+    finally:
+        cmds.delete(new_mesh)
+
+
+def _closest_by_grid(file_points, target_points):
+    point_grid = PointGrid(file_points)
+    return [
+        point_grid.closest_point(point)
+        for point in target_points
+    ]
+
+
+def run():
+    rows = []
+
+    for file_count, target_count in Sizes:
+        cmds.file(newFile=True, force=True)
+
+        file_points = _build_points(file_count, 0)
+        target_points = _build_points(target_count, 1)
+
+        mesh_time = base.time_it(lambda: _closest_by_temp_mesh(file_points, target_points), repeat=1)
+        grid_time = base.time_it(lambda: _closest_by_grid(file_points, target_points), repeat=1)
+
+        rows.append([
+            "{0} points / {1} queries".format(file_count, target_count),
+            "{0:.3f}s".format(mesh_time),
+            "{0:.3f}s".format(grid_time),
+            "x{0:.1f}".format(mesh_time / max(grid_time, 1e-6))
+        ])
+
+    base.print_table(["Size", "Temp mesh", "Grid", "Speed up"], rows)
+
+
+if __name__ == "__main__":
+    run()
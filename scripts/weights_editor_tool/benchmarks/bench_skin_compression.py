@@ -0,0 +1,62 @@
+"""
+Compares the compression codecs for skin files by size, encode time and decode time.
+"""
+
+import os
+import shutil
+import tempfile
+
+from weights_editor_tool.benchmarks import base
+from weights_editor_tool.benchmarks.bench_skin_file import _build_serialized_data
+from weights_editor_tool.enums import SkinCompression
+from weights_editor_tool.classes.skin_file import SkinFile
+
+
+Sizes = [
+    # (vert_count, inf_count, infs_per_vert)
+    (10000, 50, 4),
+    (100000, 100, 6)
+]
+
+Codecs = [
+    SkinCompression.Uncompressed,
+    SkinCompression.Zlib,
+    SkinCompression.Lzma,
+    SkinCompression.ShuffleZlib
+]
+
+
+def run():
+    rows = []
+    temp_dir = tempfile.mkdtemp()
+
+    try:
+        for vert_count, inf_count, infs_per_vert in Sizes:
+            data = _build_serialized_data(vert_count, inf_count, infs_per_vert)
+
+            for codec in Codecs:
+                file_path = os.path.join(temp_dir, "{0}.skin".format(codec))
+
+                try:
+                    encode_time = base.time_it(lambda: SkinFile.save(file_path, data, codec=codec), repeat=1)
+                except RuntimeError as err:
+                    rows.append(["{0} verts".format(vert_count), codec, str(err), "", ""])
+                    continue
+
+                decode_time = base.time_it(lambda: SkinFile.load(file_path))
+
+                rows.append([
+                    "{0} verts".format(vert_count),
+                    codec,
+                    "{0:.2f} MB".format(os.path.getsize(file_path) / 1048576.0),
+                    "{0:.3f}s".format(encode_time),
+                    "{0:.3f}s".format(decode_time)
+                ])
+    finally:
+        shutil.rmtree(temp_dir)
+
+    base.print_table(["Size", "Codec", "File size", "Encode", "Decode"], rows)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,75 @@
+"""
+Compares the array-backed SkinData against the old dictionary layout for memory and iteration speed.
+"""
+
+import copy
+
+from weights_editor_tool.benchmarks import base
+from weights_editor_tool.classes.skin_data import SkinData
+
+
+Sizes = [
+    # (vert_count, inf_count, infs_per_vert)
+    (10000, 50, 4),
+    (50000, 150, 6),
+    (150000, 250, 8)
+]
+
+
+def _iter_dict_weights(data):
+    total = 0.0
+    for vert_index in data:
+        for inf, value in data[vert_index]["weights"].items():
+            total += value
+    return total
+
+
+def _iter_array_weights(skin_data):
+    total = 0.0
+    for vert_index, weights in skin_data.iter_vertex_weights():
+        for inf, value in weights.items():
+            total += value
+    return total
+
+
+def _iter_dict_inf(data, inf):
+    return [
+        data[vert_index]["weights"].get(inf)
+        for vert_index in data
+    ]
+
+
+def _iter_array_inf(skin_data, inf):
+    return list(skin_data.iter_inf_weights(inf))
+
+
+def run():
+    rows = []
+
+    for vert_count, inf_count, infs_per_vert in Sizes:
+        data = base.build_skin_dict(vert_count, inf_count, infs_per_vert)
+        skin_data = SkinData.from_dict(data)
+
+        dict_bytes = base.get_deep_size(data)
+        array_bytes = skin_data.nbytes()
+
+        rows.append([
+            "{0} verts / {1} infs".format(vert_count, inf_count),
+            "{0:.1f} MB".format(dict_bytes / 1048576.0),
+            "{0:.1f} MB".format(array_bytes / 1048576.0),
+            "{0:.3f}s".format(base.time_it(lambda: _iter_dict_weights(data))),
+            "{0:.3f}s".format(base.time_it(lambda: _iter_array_weights(skin_data))),
+            "{0:.3f}s".format(base.time_it(lambda: _iter_dict_inf(data, "joint0"))),
+            "{0:.3f}s".format(base.time_it(lambda: _iter_array_inf(skin_data, "joint0"))),
+            "{0:.3f}s".format(base.time_it(lambda: copy.deepcopy(data), repeat=1)),
+            "{0:.3f}s".format(base.time_it(skin_data.copy))
+        ])
+
+    base.print_table(
+        ["Size", "Dict mem", "Array mem", "Dict iter", "Array iter",
+         "Dict 1 inf", "Array 1 inf", "Dict copy", "Array copy"],
+        rows)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,150 @@
+"""
+Compares the pickled v1 skin files against the binary v2 files for file size and load time,
+how long a full import takes to get from each file to SkinData,
+and how long v2 files take to read only a few rows for a selection.
+"""
+
+import os
+import sys
+import random
+import shutil
+import tempfile
+
+if sys.version_info < (3, 0):
+    import cPickle
+else:
+    import _pickle as cPickle
+
+from weights_editor_tool.benchmarks import base
+from weights_editor_tool.classes.skin_data import SkinData
+from weights_editor_tool.classes.skin_file import SkinFile
+
+
+Sizes = [
+    # (vert_count, inf_count, infs_per_vert)
+    (10000, 50, 4),
+    (100000, 100, 6),
+    (300000, 200, 8)
+]
+
+# Vertexes to read when timing imports onto a selection.
+SelectionCount = 200
+
+
+def _build_serialized_data(vert_count, inf_count, infs_per_vert):
+    """
+    Fakes the output of SkinnedObj.serialize().
+    """
+    verts = base.build_skin_dict(vert_count, inf_count, infs_per_vert)
+    rand = random.Random(0)
+
+    for vert_index, vert_data in verts.items():
+        vert_data["world_pos"] = [rand.uniform(-10, 10) for axis in range(3)]
+
+    return {
+        "version": 1.0,
+        "object": "benchMesh",
+        "verts": verts,
+        "triangles": [],
+        "influences": {
+            i: {"name": "joint{0}".format(i), "world_matrix": [1.0, 0.0, 0.0, 0.0] * 4}
+            for i in range(inf_count)
+        },
+        "skin_cluster": {
+            "name": "skinCluster1",
+            "vert_count": vert_count,
+            "influence_count": inf_count,
+            "max_influences": infs_per_vert,
+            "skinning_method": 0,
+            "dqs_support_non_rigid": False
+        }
+    }
+
+
+def _save_v1(file_path, data):
+    with open(file_path, "wb") as f:
+        f.write(cPickle.dumps(data))
+
+
+def _load_v1(file_path):
+    with open(file_path, "rb") as f:
+        return cPickle.loads(f.read())
+
+
+def _import_v1(file_path):
+    """
+    Same steps as a full import of a v1 file, with influences renamed row by row.
+    """
+    verts = _load_v1(file_path)["verts"]
+
+    for vert_data in verts.values():
+        weights = vert_data["weights"]
+        for inf_name in list(weights):
+            weights[inf_name.split("|")[-1]] = weights.pop(inf_name)
+
+    return SkinData.from_dict(verts)
+
+
+def _import_v2(file_path):
+    """
+    Same steps as a full import of a v2 file, with influences renamed once.
+    """
+    with SkinFile(file_path) as skin_file:
+        skin_data = skin_file.to_skin_data()
+
+    skin_data.rename_infs({inf_name: inf_name.split("|")[-1] for inf_name in skin_data.inf_names})
+    return skin_data
+
+
+def _load_v2_rows(file_path, vert_indexes):
+    with SkinFile(file_path) as skin_file:
+        return skin_file.to_dict(vert_indexes)
+
+
+def _load_v2_near(file_path, points):
+    with SkinFile(file_path) as skin_file:
+        return skin_file.to_dict(skin_file.get_indexes_near(points))
+
+
+def run():
+    rows = []
+    temp_dir = tempfile.mkdtemp()
+
+    try:
+        for vert_count, inf_count, infs_per_vert in Sizes:
+            data = _build_serialized_data(vert_count, inf_count, infs_per_vert)
+
+            selection = random.Random(0).sample(range(vert_count), SelectionCount)
+            points = [data["verts"][vert_index]["world_pos"] for vert_index in selection]
+
+            v1_path = os.path.join(temp_dir, "v1.skin")
+            v2_path = os.path.join(temp_dir, "v2.skin")
+
+            v1_save_time = base.time_it(lambda: _save_v1(v1_path, data), repeat=1)
+            v2_save_time = base.time_it(lambda: SkinFile.save(v2_path, data), repeat=1)
+
+            rows.append([
+                "{0} verts / {1} infs".format(vert_count, inf_count),
+                "{0:.1f} MB".format(os.path.getsize(v1_path) / 1048576.0),
+                "{0:.1f} MB".format(os.path.getsize(v2_path) / 1048576.0),
+                "{0:.3f}s".format(v1_save_time),
+                "{0:.3f}s".format(v2_save_time),
+                "{0:.3f}s".format(base.time_it(lambda: _load_v1(v1_path))),
+                "{0:.3f}s".format(base.time_it(lambda: SkinFile.load(v2_path))),
+                "{0:.3f}s".format(base.time_it(lambda: _import_v1(v1_path))),
+                "{0:.3f}s".format(base.time_it(lambda: _import_v2(v2_path))),
+                "{0:.3f}s".format(base.time_it(lambda: SkinFile(v2_path).close())),
+                "{0:.3f}s".format(base.time_it(lambda: _load_v2_rows(v2_path, selection))),
+                "{0:.3f}s".format(base.time_it(lambda: _load_v2_near(v2_path, points), repeat=1))
+            ])
+    finally:
+        shutil.rmtree(temp_dir)
+
+    base.print_table(
+        ["Size", "v1 size", "v2 size", "v1 save", "v2 save", "v1 load", "v2 load", "v1 import", "v2 import", "v2 open",
+         "v2 selection", "v2 selection (world)"],
+        rows)
+
+
+if __name__ == "__main__":
+    run()
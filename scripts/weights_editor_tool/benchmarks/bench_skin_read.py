@@ -0,0 +1,40 @@
+"""
+Compares reading a skinCluster with the bulk api call against the plug by plug fallback.
+"""
+
+from maya import cmds
+
+from weights_editor_tool.benchmarks import base
+from weights_editor_tool.classes.skin_data import SkinData
+
+
+Sizes = [
+    # (sphere subdivisions, joint_count, max_infs)
+    (50, 20, 4),
+    (150, 50, 4),
+    (300, 100, 8)
+]
+
+
+def run():
+    rows = []
+
+    for subdivisions, joint_count, max_infs in Sizes:
+        cmds.file(newFile=True, force=True)
+        mesh, skin_cluster = base.create_skinned_sphere(subdivisions, joint_count, max_infs)
+
+        plug_time = base.time_it(lambda: SkinData.from_dict(SkinData.get_data(skin_cluster)), repeat=1)
+        bulk_time = base.time_it(lambda: SkinData.get_bulk(skin_cluster))
+
+        rows.append([
+            "{0} verts / {1} infs".format(cmds.polyEvaluate(mesh, vertex=True), joint_count),
+            "{0:.3f}s".format(plug_time),
+            "{0:.3f}s".format(bulk_time),
+            "x{0:.1f}".format(plug_time / max(bulk_time, 1e-6))
+        ])
+
+    base.print_table(["Size", "Per plug", "Bulk", "Speed up"], rows)
+
+
+if __name__ == "__main__":
+    run()
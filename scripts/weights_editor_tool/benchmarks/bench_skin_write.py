@@ -0,0 +1,43 @@
+"""
+Compares writing a skinCluster with chunked MFnSkinCluster.setWeights calls against setting it plug by plug.
+"""
+
+from maya import cmds
+
+from weights_editor_tool.benchmarks import base
+from weights_editor_tool.classes.skinned_obj import SkinnedObj
+
+
+Sizes = [
+    # (sphere subdivisions, joint_count, max_infs)
+    (50, 20, 4),
+    (150, 50, 4),
+    (300, 100, 8)
+]
+
+
+def run():
+    rows = []
+
+    for subdivisions, joint_count, max_infs in Sizes:
+        cmds.file(newFile=True, force=True)
+        mesh, skin_cluster = base.create_skinned_sphere(subdivisions, joint_count, max_infs)
+
+        skinned_obj = SkinnedObj.create(mesh)
+        vert_indexes = list(skinned_obj.skin_data)
+
+        plug_time = base.time_it(lambda: skinned_obj.apply_current_skin_weights(vert_indexes, bulk=False), repeat=1)
+        bulk_time = base.time_it(lambda: skinned_obj.apply_current_skin_weights(vert_indexes, bulk=True))
+
+        rows.append([
+            "{0} verts / {1} infs".format(len(vert_indexes), joint_count),
+            "{0:.3f}s".format(plug_time),
+            "{0:.3f}s".format(bulk_time),
+            "x{0:.1f}".format(plug_time / max(bulk_time, 1e-6))
+        ])
+
+    base.print_table(["Size", "Per plug", "Bulk", "Speed up"], rows)
+
+
+if __name__ == "__main__":
+    run()
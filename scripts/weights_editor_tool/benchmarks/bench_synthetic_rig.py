@@ -0,0 +1,408 @@
+"""
+Times the core weight operations on synthetic rigs, without Maya.
+
+Each rig is a grid or sphere skinned to a row of joints along X, so the weights
+are local like a real rig's instead of random. Results can be saved as json,
+and compared against a saved baseline to catch regressions before a release.
+
+Run it from the scripts folder with any Python:
+    python -m weights_editor_tool.benchmarks.bench_synthetic_rig --preset quick --output before.json
+    python -m weights_editor_tool.benchmarks.bench_synthetic_rig --preset quick --baseline before.json
+    python -m weights_editor_tool.benchmarks.bench_synthetic_rig --sizes 100000 --infs 40 --sparsity 8 --topology sphere
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import bisect
+import random
+import shutil
+import argparse
+import platform
+import tempfile
+
+from weights_editor_tool.benchmarks import base
+from weights_editor_tool.math_utils import get_influence_colors, get_multi_influence_colors
+from weights_editor_tool.classes.skin_file import SkinFile
+from weights_editor_tool.classes.skin_backend import MemorySkinBackend
+
+
+GridTopology = "grid"
+SphereTopology = "sphere"
+
+Presets = {
+    # (vert_counts, inf_counts)
+    "quick": ([1000, 10000], [4, 40]),
+    "full": ([1000, 10000, 100000, 500000], [4, 40, 400])
+}
+
+Operations = [
+    "load",
+    "serialize",
+    "copy",
+    "undo_snapshot",
+    "update_weight_value",
+    "smooth",
+    "prune",
+    "prune_max_infs",
+    "mirror",
+    "colors",
+    "multi_colors",
+    "map_closest_vertexes",
+    "map_closest_triangles"
+]
+
+# Cells to set when timing update_weight_value().
+EditCount = 1000
+
+# Differences smaller than this are noise, no matter the percentage.
+MinRegression = 0.005
+
+
+def build_grid(vert_count):
+    """
+    Builds a flat grid on the XY plane, centered on X so it's symmetrical across YZ.
+
+    Returns:
+        A tuple of points and a flat list of triangles.
+    """
+    columns = max(2, int(math.ceil(math.sqrt(vert_count))))
+    rows = max(2, int(math.ceil(vert_count / float(columns))))
+
+    points = [
+        (-1.0 + 2.0 * column / (columns - 1), -1.0 + 2.0 * row / (rows - 1), 0.0)
+        for row in range(rows)
+        for column in range(columns)
+    ]
+
+    triangles = []
+    for row in range(rows - 1):
+        for column in range(columns - 1):
+            a = row * columns + column
+            triangles.extend([a, a + 1, a + columns + 1, a, a + columns + 1, a + columns])
+
+    return points, triangles
+
+
+def build_sphere(vert_count):
+    """
+    Builds a uv sphere with a radius of 1 and a vertex at each pole.
+
+    Returns:
+        A tuple of points and a flat list of triangles.
+    """
+    segments = max(3, int(math.ceil(math.sqrt(vert_count * 2))))
+    rings = max(2, int(math.ceil((vert_count - 2) / float(segments))) + 1)
+
+    points = [(0.0, 1.0, 0.0)]
+
+    for ring in range(1, rings):
+        phi = math.pi * ring / rings
+        for segment in range(segments):
+            theta = 2.0 * math.pi * segment / segments
+            points.append((math.sin(phi) * math.cos(theta), math.cos(phi), math.sin(phi) * math.sin(theta)))
+
+    points.append((0.0, -1.0, 0.0))
+    bottom = len(points) - 1
+
+    def get_index(ring, segment):
+        return 1 + (ring - 1) * segments + segment % segments
+
+    triangles = []
+
+    for segment in range(segments):
+        triangles.extend([0, get_index(1, segment + 1), get_index(1, segment)])
+        triangles.extend([bottom, get_index(rings - 1, segment), get_index(rings - 1, segment + 1)])
+
+    for ring in range(1, rings - 1):
+        for segment in range(segments):
+            a = get_index(ring, segment)
+            b = get_index(ring, segment + 1)
+            c = get_index(ring + 1, segment + 1)
+            d = get_index(ring + 1, segment)
+            triangles.extend([a, b, c, a, c, d])
+
+    return points, triangles
+
+
+def build_rig(vert_count, inf_count, infs_per_vert, topology=GridTopology, offset=0.0):
+    """
+    Generates a rig in the serialized layout of SkinnedObj.serialize().
+
+    Joints sit in a row along X, and each vertex is weighted to its closest joints
+    so neighbouring vertexes share influences.
+
+    Args:
+        vert_count(int): About how many vertexes to make. Grids and spheres round this up.
+        inf_count(int): Number of joints.
+        infs_per_vert(int): Influences on each vertex.
+        topology(string): Either GridTopology or SphereTopology.
+        offset(float): Moves every vertex by this much, so it doesn't line up exactly with another rig.
+
+    Returns:
+        The serialized data.
+    """
+    if topology == SphereTopology:
+        points, triangles = build_sphere(vert_count)
+    else:
+        points, triangles = build_grid(vert_count)
+
+    inf_names = ["joint{0}".format(i) for i in range(inf_count)]
+    joint_xs = [-1.0 + 2.0 * i / max(inf_count - 1, 1) for i in range(inf_count)]
+    infs_per_vert = max(1, min(infs_per_vert, inf_count))
+
+    verts = {}
+
+    for vert_index, point in enumerate(points):
+        point = (point[0] + offset, point[1] + offset, point[2])
+
+        # Take a window of joints around the closest one.
+        start = bisect.bisect_left(joint_xs, point[0]) - infs_per_vert // 2
+        start = max(0, min(start, inf_count - infs_per_vert))
+
+        values = [
+            1.0 / (abs(point[0] - joint_xs[i]) + 0.01)
+            for i in range(start, start + infs_per_vert)
+        ]
+        total = sum(values)
+
+        verts[vert_index] = {
+            "weights": {
+                inf_names[start + i]: value / total
+                for i, value in enumerate(values)
+            },
+            "dq": 0.0,
+            "world_pos": list(point)
+        }
+
+    return {
+        "version": 2.0,
+        "object": "benchRig",
+        "verts": verts,
+        "triangles": triangles,
+        "influences": {
+            i: {"name": inf_names[i], "world_matrix": [1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, joint_xs[i], 0, 0, 1]}
+            for i in range(inf_count)
+        },
+        "skin_cluster": {
+            "name": "skinCluster1",
+            "vert_count": len(verts),
+            "influence_count": inf_count,
+            "max_influences": infs_per_vert,
+            "skinning_method": 0,
+            "dqs_support_non_rigid": False
+        }
+    }
+
+
+def time_rig(vert_count, inf_count, infs_per_vert, topology, operations, temp_dir, repeat=3):
+    """
+    Times each operation on one rig.
+
+    Operations that edit weights run on a fresh copy each time, which isn't part of the timing.
+
+    Returns:
+        A dictionary of the rig's settings and {operation: seconds}.
+    """
+    data = build_rig(vert_count, inf_count, infs_per_vert, topology)
+    other_data = build_rig(vert_count, inf_count, infs_per_vert, topology, offset=0.001)
+
+    file_path = os.path.join(temp_dir, "rig.skin")
+    SkinFile.save(file_path, data)
+
+    backend = MemorySkinBackend.from_file(file_path)
+    skin_data = backend.get_skin_data()
+    vert_indexes = list(range(len(skin_data)))
+
+    rand = random.Random(0)
+    edit_verts = [rand.choice(vert_indexes) for i in range(EditCount)]
+    edit_infs = [rand.choice(skin_data.get_vertex_infs(vert_index)) for vert_index in edit_verts]
+    edit_values = [rand.random() for i in range(EditCount)]
+
+    inf_colors = {
+        inf: [rand.random() for i in range(3)]
+        for inf in backend.get_influences()
+    }
+
+    # Operations that edit weights get a new copy before each run.
+    work = {}
+
+    def reset():
+        work["backend"] = backend.copy()
+
+    def update_weight_values():
+        work_skin_data = work["backend"].get_skin_data()
+        locks = work["backend"].get_inf_locks()
+
+        for vert_index, inf_name, value in zip(edit_verts, edit_infs, edit_values):
+            work_skin_data.update_weight_value(vert_index, inf_name, value, locks=locks)
+
+    funcs = {
+        "load": (lambda: MemorySkinBackend.from_file(file_path), None),
+        "serialize": (lambda: backend.save(os.path.join(temp_dir, "out.skin")), None),
+        "copy": (lambda: skin_data.copy(), None),
+        "undo_snapshot": (lambda: skin_data.copy_vertexes(vert_indexes), None),
+        "update_weight_value": (update_weight_values, reset),
+        "smooth": (lambda: work["backend"].smooth_weights(vert_indexes, 0.5), reset),
+        "prune": (lambda: work["backend"].prune_weights(0.1, vert_indexes), reset),
+        "prune_max_infs": (lambda: work["backend"].prune_max_infs(max(1, infs_per_vert - 1), vert_indexes), reset),
+        "mirror": (lambda: work["backend"].mirror_weights("YZ", False, "name"), reset),
+        "colors": (
+            lambda: get_influence_colors(skin_data.iter_inf_weights(backend.get_influences()[inf_count // 2])), None),
+        "multi_colors": (lambda: get_multi_influence_colors(skin_data.iter_vertex_weights(), inf_colors), None),
+        "map_closest_vertexes": (lambda: backend.map_to_closest_vertexes(other_data["verts"]), None),
+        "map_closest_triangles": (
+            lambda: backend.map_to_closest_triangles(other_data["verts"], other_data["triangles"]), None)
+    }
+
+    timings = {}
+
+    for operation in operations:
+        func, setup = funcs[operation]
+        timings[operation] = base.time_it(func, repeat=repeat, setup=setup)
+
+    return {
+        "topology": topology,
+        "vert_count": len(skin_data),
+        "inf_count": inf_count,
+        "infs_per_vert": min(infs_per_vert, inf_count),
+        "timings": timings
+    }
+
+
+def get_rig_key(result):
+    return "{0} {1}v {2}i {3}s".format(
+        result["topology"], result["vert_count"], result["inf_count"], result["infs_per_vert"])
+
+
+def compare(baseline, report, tolerance):
+    """
+    Pairs each timing with the same one in the baseline.
+
+    Args:
+        baseline(dict): An older report.
+        report(dict): The new report.
+        tolerance(float): How much slower a timing can get, as a fraction, before it counts as a regression.
+
+    Returns:
+        A tuple of table rows and a list of regressions as (rig, operation) tuples.
+    """
+    old_results = {
+        get_rig_key(result): result["timings"]
+        for result in baseline["results"]
+    }
+
+    rows = []
+    regressions = []
+
+    for result in report["results"]:
+        rig_key = get_rig_key(result)
+        old_timings = old_results.get(rig_key, {})
+
+        for operation, new_time in sorted(result["timings"].items(), key=lambda item: Operations.index(item[0])):
+            old_time = old_timings.get(operation)
+
+            if old_time is None:
+                rows.append([rig_key, operation, "-", "{0:.4f}s".format(new_time), "-", "new"])
+                continue
+
+            change = (new_time - old_time) / old_time if old_time else 0.0
+            is_regression = change > tolerance and new_time - old_time > MinRegression
+
+            if is_regression:
+                regressions.append((rig_key, operation))
+
+            rows.append([
+                rig_key,
+                operation,
+                "{0:.4f}s".format(old_time),
+                "{0:.4f}s".format(new_time),
+                "{0:+.1f}%".format(change * 100),
+                "SLOWER" if is_regression else ""
+            ])
+
+    return rows, regressions
+
+
+def _parse_args(args):
+    parser = argparse.ArgumentParser(
+        prog="weights_editor_tool.benchmarks.bench_synthetic_rig",
+        description="Times weight operations on synthetic rigs.")
+
+    parser.add_argument("--preset", choices=sorted(Presets), default="quick", help="Sizes to use if none are given.")
+    parser.add_argument("--sizes", type=int, nargs="+", help="Vertex counts.")
+    parser.add_argument("--infs", type=int, nargs="+", help="Influence counts.")
+    parser.add_argument("--sparsity", type=int, default=4, help="Influences on each vertex.")
+    parser.add_argument("--topology", choices=[GridTopology, SphereTopology], default=GridTopology)
+    parser.add_argument("--operations", nargs="+", choices=Operations, default=Operations)
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per operation, the fastest one is kept.")
+    parser.add_argument("--output", help="Where to save the results as json.")
+    parser.add_argument("--baseline", help="Results from an earlier run to compare against.")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.1, help="How much slower a timing can get before it fails, 0.1 is 10%%.")
+
+    return parser.parse_args(args)
+
+
+def run(args=None):
+    if args is None:
+        args = sys.argv[1:]
+
+    parsed = _parse_args(args)
+
+    preset_sizes, preset_infs = Presets[parsed.preset]
+
+    report = {
+        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "repeat": parsed.repeat,
+        "results": []
+    }
+
+    temp_dir = tempfile.mkdtemp(prefix="weights_editor_bench_")
+
+    try:
+        for vert_count in parsed.sizes or preset_sizes:
+            for inf_count in parsed.infs or preset_infs:
+                result = time_rig(
+                    vert_count, inf_count, parsed.sparsity, parsed.topology, parsed.operations, temp_dir,
+                    repeat=parsed.repeat)
+
+                report["results"].append(result)
+                print("Timed {0}".format(get_rig_key(result)))
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    if parsed.output:
+        with open(parsed.output, "w") as f:
+            json.dump(report, f, indent=4)
+
+    if not parsed.baseline:
+        base.print_table(
+            ["Rig", "Operation", "Time"],
+            [
+                [get_rig_key(result), operation, "{0:.4f}s".format(result["timings"][operation])]
+                for result in report["results"]
+                for operation in parsed.operations
+            ])
+        return 0
+
+    with open(parsed.baseline, "r") as f:
+        baseline = json.load(f)
+
+    rows, regressions = compare(baseline, report, parsed.tolerance)
+    base.print_table(["Rig", "Operation", "Baseline", "Current", "Change", ""], rows)
+
+    if regressions:
+        print("{0} timing(s) are more than {1:.0f}% slower than the baseline.".format(
+            len(regressions), parsed.tolerance * 100))
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run())
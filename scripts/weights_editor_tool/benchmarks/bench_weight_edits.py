@@ -0,0 +1,49 @@
+"""
+Compares setting many cells one update_weight_value() call at a time against update_weight_values().
+"""
+
+from weights_editor_tool.benchmarks import base
+from weights_editor_tool.classes.skin_data import SkinData
+from weights_editor_tool.classes.inf_locks import InfLocks
+
+
+Sizes = [
+    # (vert_count, inf_count, infs_per_vert)
+    (10000, 50, 4),
+    (100000, 100, 6)
+]
+
+
+def _set_one_by_one(skin_data, vert_indexes, inf_names, values, locks):
+    for vert_index, inf_name, value in zip(vert_indexes, inf_names, values):
+        skin_data.update_weight_value(vert_index, inf_name, value, locks=locks)
+
+
+def run():
+    rows = []
+    locks = InfLocks()
+
+    for vert_count, inf_count, infs_per_vert in Sizes:
+        data = base.build_skin_dict(vert_count, inf_count, infs_per_vert)
+
+        vert_indexes = list(range(vert_count))
+        inf_names = ["joint{0}".format(i % inf_count) for i in range(vert_count)]
+        values = [0.3] * vert_count
+
+        scalar_time = base.time_it(
+            lambda: _set_one_by_one(SkinData.from_dict(data), vert_indexes, inf_names, values, locks), repeat=1)
+
+        batch_time = base.time_it(
+            lambda: SkinData.from_dict(data).update_weight_values(vert_indexes, inf_names, values, locks=locks), repeat=1)
+
+        rows.append([
+            "{0} cells".format(vert_count),
+            "{0:.3f}s".format(scalar_time),
+            "{0:.3f}s".format(batch_time)
+        ])
+
+    base.print_table(["Size", "One by one", "Batch"], rows)
+
+
+if __name__ == "__main__":
+    run()
@@ -1,6 +1,6 @@
-import copy
+import sys
 
-from maya import cmds
+from weights_editor_tool.weights_editor_utils import cmds
 from PySide2 import QtWidgets
 
 from weights_editor_tool.widgets import weights_table_view
@@ -14,26 +14,95 @@ class CommandEditWeights(QtWidgets.QUndoCommand):
         editor_cls (WeightsEditor)
         description (string): The label to show up to describe this action.
         obj (string): An object with a skinCluster to edit weights on.
-        old_skin_data (dict): A copy of skin data to revert to.
-        new_skin_data (dict): A copy of skin data to set to.
+        old_rows (dict): Rows of the edited vertexes to revert to. {vert_index: {"weights": {}, "dq": float}}
+        new_rows (dict): Rows of the edited vertexes to set to.
         vert_indexes (int[]): A list of indexes to operate on.
         table_selection (dict): Selection data to revert back to.
         skip_first_redo (bool): Qt forces redo to be executed right away. Enable this to skip it if it's not needed.
+        merge_key (object): Consecutive commands with the same key merge into one. None never merges.
     """
 
-    def __init__(self, editor_cls, description, obj, old_skin_data, new_skin_data, vert_indexes,
-                 table_selection, skip_first_redo=False, parent=None):
+    MergeId = 1
+
+    def __init__(self, editor_cls, description, obj, old_rows, new_rows, vert_indexes,
+                 table_selection, skip_first_redo=False, merge_key=None, parent=None):
         super(CommandEditWeights, self).__init__(description, parent=parent)
 
         self._editor_cls = editor_cls
         self._skip_first_redo = skip_first_redo
         self._obj = obj
-        self._old_skin_data = old_skin_data
-        self._new_skin_data = new_skin_data
+        self._old_rows = old_rows
+        self._new_rows = new_rows
         self._vert_indexes = vert_indexes
         self._table_selection = table_selection
+        self._merge_key = merge_key
+        self._merge_count = 1
+        self._nbytes = self._get_bytes()
+
+    @staticmethod
+    def _get_rows_bytes(vert_rows):
+        """
+        Estimates the memory of the rows. Influence names are shared with the skin data so they aren't counted.
+        """
+        float_size = sys.getsizeof(0.0)
+        size = sys.getsizeof(vert_rows)
+
+        for vert_data in vert_rows.values():
+            size += sys.getsizeof(vert_data) + sys.getsizeof(vert_data["weights"])
+            size += float_size * (len(vert_data["weights"]) + 1)
+
+        return size
+
+    @staticmethod
+    def _get_indexes_bytes(vert_indexes):
+        return sys.getsizeof(vert_indexes) + sys.getsizeof(0) * len(vert_indexes)
+
+    def _get_bytes(self):
+        size = self._get_rows_bytes(self._old_rows) + self._get_rows_bytes(self._new_rows)
+        size += self._get_indexes_bytes(self._vert_indexes)
+
+        if self._table_selection:
+            size += sys.getsizeof(self._table_selection)
+            for vert_indexes in self._table_selection.values():
+                size += self._get_indexes_bytes(vert_indexes)
+
+        return size
+
+    def nbytes(self):
+        return self._nbytes
+
+    def id(self):
+        if self._merge_key is None:
+            return -1
+        return self.MergeId
+
+    def mergeWith(self, other):
+        """
+        Folds a following edit into this one, keeping this command's old rows
+        and taking the other's new rows.
+        """
+        if other._merge_key != self._merge_key or other._obj != self._obj:
+            return False
+
+        for vert_index, vert_data in other._old_rows.items():
+            if vert_index not in self._old_rows:
+                self._old_rows[vert_index] = vert_data
+
+        self._new_rows.update(other._new_rows)
+        self._vert_indexes = sorted(set(self._vert_indexes).union(other._vert_indexes))
+        self._nbytes = self._get_bytes()
+
+        self._merge_count += other._merge_count
+        self.setText("{0} ({1} edits)".format(other.text(), self._merge_count))
+
+        return True
 
-    def _edit_weights(self, skin_data):
+    def _edit_weights(self, vert_rows, current_rows):
+        """
+        Args:
+            vert_rows(dict): Rows to set.
+            current_rows(dict): Rows the skinCluster holds right now, so only the difference gets written.
+        """
         if not self._obj or not cmds.objExists(self._obj):
             return
 
@@ -41,8 +110,9 @@ class CommandEditWeights(QtWidgets.QUndoCommand):
         old_column_count = weights_view.horizontalHeader().count()
         weights_view.begin_update()
 
-        self._editor_cls.instance.obj.skin_data = copy.deepcopy(skin_data)
-        self._editor_cls.instance.obj.apply_current_skin_weights(self._vert_indexes, normalize=True)
+        self._editor_cls.instance.obj.skin_data.set_vertexes(vert_rows)
+        self._editor_cls.instance.obj.apply_current_skin_weights(
+            self._vert_indexes, normalize=True, old_rows=current_rows)
         self._editor_cls.instance.update_vert_colors(vert_filter=self._vert_indexes)
         self._editor_cls.instance.collect_display_infs()
 
@@ -59,7 +129,7 @@ class CommandEditWeights(QtWidgets.QUndoCommand):
         if self._skip_first_redo:
             self._skip_first_redo = False
         else:
-            self._edit_weights(self._new_skin_data)
+            self._edit_weights(self._new_rows, self._old_rows)
 
     def undo(self):
-        self._edit_weights(self._old_skin_data)
+        self._edit_weights(self._old_rows, self._new_rows)
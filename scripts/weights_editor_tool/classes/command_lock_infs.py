@@ -1,4 +1,6 @@
-from maya import cmds
+import sys
+
+from weights_editor_tool.weights_editor_utils import cmds
 
 from PySide2 import QtWidgets
 
@@ -20,12 +22,16 @@ class CommandLockInfs(QtWidgets.QUndoCommand):
         self._editor_cls = editor_cls
 
         # {inf_name, default_lock_state}
+        inf_locks = self._editor_cls.instance.obj.inf_locks
         self._infs = {
-            inf: cmds.getAttr("{0}.lockInfluenceWeights".format(inf))
+            inf: inf_locks.is_locked(inf)
             for inf in infs}
 
         self._enabled = enabled
 
+    def nbytes(self):
+        return sys.getsizeof(self._infs) + sys.getsizeof(True) * len(self._infs)
+
     def lock_infs(self, use_redo_value):
         weights_view = self._editor_cls.instance.get_active_weights_view()
 
@@ -43,9 +49,7 @@ class CommandLockInfs(QtWidgets.QUndoCommand):
 
             cmds.setAttr("{0}.lockInfluenceWeights".format(inf), lock)
 
-            inf_index = self._editor_cls.instance.obj.infs.index(inf)
-
-            self._editor_cls.instance.locks[inf_index] = lock
+            self._editor_cls.instance.obj.inf_locks.set_locked(inf, lock)
 
         self._editor_cls.instance.inf_list.end_update()
         weights_view.end_update()
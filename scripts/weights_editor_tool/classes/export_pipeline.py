@@ -0,0 +1,165 @@
+import sys
+import time
+import threading
+
+if sys.version_info < (3, 0):
+    import Queue as queue
+else:
+    import queue
+
+from weights_editor_tool.enums import SkinCompression
+from weights_editor_tool.classes.skin_file import SkinFile
+
+
+class ExportPipeline:
+    """
+    Writes skin files on background threads while the main thread keeps collecting the next skin from Maya.
+
+    Only serialized data is handed over, so the workers never touch the scene.
+    Compression and disk writes let go of the GIL, which is where most of the overlap comes from.
+    The queue is bounded so a fast scene read can't pile up every skin in memory.
+
+    Args:
+        worker_count(int): Number of writer threads.
+        max_pending(int): Most skins that can wait to be written before submit() blocks.
+    """
+
+    DefaultWorkerCount = 2
+    DefaultMaxPending = 4
+
+    def __init__(self, worker_count=DefaultWorkerCount, max_pending=DefaultMaxPending):
+        self._jobs = queue.Queue(maxsize=max(1, max_pending))
+        self._results = []
+        self._lock = threading.Lock()
+        self._cancelled = False
+
+        self._workers = [
+            threading.Thread(target=self._work, name="SkinExportWorker{0}".format(i))
+            for i in range(max(1, worker_count))
+        ]
+
+        for worker in self._workers:
+            worker.daemon = True
+            worker.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.wait()
+
+    def _work(self):
+        while True:
+            job = self._jobs.get()
+
+            try:
+                if job is None:
+                    return
+
+                result = job
+                if self._cancelled:
+                    result["error"] = "Cancelled"
+                else:
+                    start = time.time()
+
+                    try:
+                        SkinFile.save(job["file_path"], job.pop("data"), codec=job["codec"])
+                    except Exception as err:
+                        result["error"] = str(err)
+
+                    result["write_time"] = time.time() - start
+
+                result.pop("data", None)
+
+                with self._lock:
+                    self._results.append(result)
+            finally:
+                self._jobs.task_done()
+
+    def submit(self, name, file_path, data, codec=SkinCompression.Uncompressed, read_time=0.0):
+        """
+        Queues serialized data to be written. Blocks while too many skins are already waiting.
+
+        Args:
+            name(string): The exported object, for the report.
+            file_path(string): An absolute path to write to.
+            data(dict): Data from SkinnedObj.serialize().
+            codec(string): A SkinCompression value to compress the file with.
+            read_time(float): Seconds it took to collect the data, for the report.
+        """
+        self._jobs.put({
+            "name": name,
+            "file_path": file_path,
+            "data": data,
+            "codec": codec,
+            "read_time": read_time,
+            "write_time": 0.0,
+            "skipped": False,
+            "error": None
+        })
+
+    def skip(self, name, file_path, codec=SkinCompression.Uncompressed, read_time=0.0):
+        """
+        Records a skin that didn't need to be written so it still shows up in the results.
+
+        Args:
+            name(string): The object that was skipped, for the report.
+            file_path(string): The file that was left as is.
+            codec(string): The SkinCompression value the file was written with.
+            read_time(float): Seconds it took to find out the skin didn't change, for the report.
+        """
+        with self._lock:
+            self._results.append({
+                "name": name,
+                "file_path": file_path,
+                "codec": codec,
+                "read_time": read_time,
+                "write_time": 0.0,
+                "skipped": True,
+                "error": None
+            })
+
+    def cancel(self):
+        """
+        Skips any skins that haven't started writing yet.
+        """
+        self._cancelled = True
+
+    def wait(self):
+        """
+        Finishes all queued writes and stops the workers.
+
+        Returns:
+            A list of results in the order they finished.
+            [{"name": string, "file_path": string, "codec": string, "read_time": float, "write_time": float,
+              "skipped": bool, "error": string}...]
+        """
+        for worker in self._workers:
+            self._jobs.put(None)
+
+        for worker in self._workers:
+            worker.join()
+
+        self._workers = []
+
+        with self._lock:
+            return list(self._results)
+
+    @staticmethod
+    def format_report(results):
+        """
+        Returns:
+            A table of each skin's timings to print out.
+        """
+        lines = ["{0:<40} {1:>10} {2:>10}  {3}".format("Object", "Read", "Write", "Status")]
+
+        for result in sorted(results, key=lambda result: result["name"]):
+            status = result["error"] or ("Skipped, unchanged" if result.get("skipped") else "OK")
+            lines.append("{0:<40} {1:>9.3f}s {2:>9.3f}s  {3}".format(
+                result["name"], result["read_time"], result["write_time"], status))
+
+        skipped_count = len([result for result in results if result.get("skipped")])
+        if skipped_count:
+            lines.append("Skipped {0} of {1} skin(s) that didn't change.".format(skipped_count, len(results)))
+
+        return "\n".join(lines)
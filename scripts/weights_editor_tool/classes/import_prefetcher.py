@@ -0,0 +1,103 @@
+import threading
+
+from weights_editor_tool.classes.skin_file import SkinFile
+
+
+class ImportPrefetcher:
+    """
+    Loads skin files on background threads ahead of the main thread applying them.
+
+    Files come back in the same order they were given, so a batch import stays predictable.
+    Workers only read files and never touch the scene.
+    Disk reads and decompression let go of the GIL, which is where most of the overlap comes from.
+    Only a few files are loaded ahead so a big folder doesn't end up in memory all at once.
+
+    Args:
+        file_paths(string[]): Absolute paths to skin files.
+        worker_count(int): Number of reader threads.
+        prefetch_count(int): Most files that can be loaded ahead of the one being applied.
+    """
+
+    DefaultWorkerCount = 2
+    DefaultPrefetchCount = 4
+
+    def __init__(self, file_paths, worker_count=DefaultWorkerCount, prefetch_count=DefaultPrefetchCount):
+        self._file_paths = list(file_paths)
+        self._results = {}  # {index: (data, error)}
+        self._next_job = 0
+        self._cancelled = False
+
+        self._condition = threading.Condition()
+        self._slots = threading.Semaphore(max(1, prefetch_count))
+
+        self._workers = [
+            threading.Thread(target=self._work, name="SkinImportWorker{0}".format(i))
+            for i in range(max(1, min(worker_count, len(self._file_paths))))
+        ]
+
+        for worker in self._workers:
+            worker.daemon = True
+            worker.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.cancel()
+
+    def __len__(self):
+        return len(self._file_paths)
+
+    def __iter__(self):
+        """
+        Yields:
+            A tuple of the file path, its data from SkinFile.load() and an error message.
+            The data is None if the file failed to load.
+        """
+        for index, file_path in enumerate(self._file_paths):
+            with self._condition:
+                while index not in self._results:
+                    self._condition.wait()
+                data, error = self._results.pop(index)
+
+            self._slots.release()
+            yield file_path, data, error
+
+    def _work(self):
+        while True:
+            self._slots.acquire()
+
+            with self._condition:
+                index = self._next_job
+                self._next_job += 1
+
+            if index >= len(self._file_paths) or self._cancelled:
+                # Pass the slot on so the other workers can stop too.
+                self._slots.release()
+                return
+
+            data = None
+            error = None
+
+            try:
+                data = SkinFile.load(self._file_paths[index])
+            except Exception as err:
+                error = str(err)
+
+            with self._condition:
+                self._results[index] = (data, error)
+                self._condition.notify_all()
+
+    def cancel(self):
+        """
+        Stops loading files that haven't started yet and waits for the workers to finish.
+        """
+        self._cancelled = True
+
+        # Free up a slot so any worker waiting on one can stop.
+        self._slots.release()
+
+        for worker in self._workers:
+            worker.join()
+
+        self._workers = []
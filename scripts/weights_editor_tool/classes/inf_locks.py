@@ -0,0 +1,126 @@
+try:
+    from weights_editor_tool.weights_editor_utils import cmds
+    from maya import OpenMaya
+    from weights_editor_tool import weights_editor_utils as utils
+except ImportError:
+    # Locks can still be filled in with from_states() outside of Maya.
+    cmds = OpenMaya = utils = None
+
+
+class InfLocks:
+    """
+    Caches the lock state of influences so weight edits never have to query Maya.
+
+    States sit in a bytearray indexed by influence id, where the ids follow the order of
+    the influence names that were collected. Attribute-changed callbacks keep the states
+    current when locks are toggled outside of the tool.
+
+    Args:
+        inf_names(string[]): Influences to collect the lock states of.
+    """
+
+    LockAttr = "lockInfluenceWeights"
+
+    def __init__(self, inf_names=None):
+        self._inf_ids = {}  # {inf_name: inf_id}
+        self._states = bytearray()
+        self._callback_ids = []
+
+        if inf_names:
+            self.collect(inf_names)
+
+    def __len__(self):
+        return len(self._states)
+
+    def __getitem__(self, inf_id):
+        return bool(self._states[inf_id])
+
+    def __setitem__(self, inf_id, locked):
+        self._states[inf_id] = bool(locked)
+
+    @classmethod
+    def from_states(cls, states):
+        """
+        Builds locks from states that are already known instead of querying the scene.
+
+        Args:
+            states(dict): {inf_name: bool}
+        """
+        inf_locks = cls()
+
+        for inf_id, inf_name in enumerate(sorted(states)):
+            inf_locks._inf_ids[inf_name] = inf_id
+            inf_locks._states.append(bool(states[inf_name]))
+
+        return inf_locks
+
+    def collect(self, inf_names):
+        """
+        Queries the lock state of each influence once.
+        Any callbacks that were added will be moved to the new influences.
+        """
+        has_callbacks = bool(self._callback_ids)
+        self.remove_callbacks()
+
+        self._inf_ids = {
+            inf_name: inf_id
+            for inf_id, inf_name in enumerate(inf_names)
+        }
+
+        self._states = bytearray(
+            bool(cmds.getAttr("{0}.{1}".format(inf_name, self.LockAttr)))
+            for inf_name in inf_names
+        )
+
+        if has_callbacks:
+            self.add_callbacks()
+
+    def add_callbacks(self):
+        """
+        Listens to each influence for lock changes done in the scene.
+        """
+        self.remove_callbacks()
+
+        for inf_name, inf_id in self._inf_ids.items():
+            self._callback_ids.append(
+                OpenMaya.MNodeMessage.addAttributeChangedCallback(
+                    utils.to_mobject(inf_name), self._lock_on_changed, inf_id))
+
+    def remove_callbacks(self):
+        for callback_id in self._callback_ids:
+            OpenMaya.MMessage.removeCallback(callback_id)
+
+        self._callback_ids = []
+
+    def _lock_on_changed(self, msg, plug, other_plug, inf_id):
+        if not msg & OpenMaya.MNodeMessage.kAttributeSet:
+            return
+
+        if OpenMaya.MFnAttribute(plug.attribute()).name() != self.LockAttr:
+            return
+
+        self._states[inf_id] = plug.asBool()
+
+    def get_inf_id(self, inf_name):
+        return self._inf_ids.get(inf_name)
+
+    def is_locked(self, inf_name):
+        """
+        Returns:
+            True if the influence is locked. Influences that weren't collected count as unlocked.
+        """
+        inf_id = self._inf_ids.get(inf_name)
+
+        if inf_id is None:
+            return False
+
+        return bool(self._states[inf_id])
+
+    def set_locked(self, inf_name, locked):
+        """
+        Updates the cached state after the tool sets a lock itself.
+        """
+        inf_id = self._inf_ids.get(inf_name)
+
+        if inf_id is not None:
+            self._states[inf_id] = bool(locked)
@@ -0,0 +1,134 @@
+from array import array
+
+from weights_editor_tool.math_utils import is_close
+
+
+class LaplacianSmoother:
+    """
+    Smooths weights over a region of vertexes with a row-normalized neighbour matrix.
+
+    Each selected vertex is a row, and its neighbours are the columns with a weight of 1 / neighbour count.
+    A pass multiplies the matrix against the weight rows of the region, so every vertex is averaged
+    from the previous pass' values. Neighbours outside of the selection are read but never changed.
+
+    Only unlocked influences that are already on a vertex are smoothed,
+    and they're scaled back to the total they had before so locked weights stay the same.
+
+    Args:
+        adjacency(MeshAdjacency): Neighbours of the whole mesh.
+        vert_indexes(int[]): Vertexes to smooth.
+    """
+
+    IndexType = "i"
+    WeightType = "d"
+
+    def __init__(self, adjacency, vert_indexes):
+        self.vert_indexes = sorted(set(vert_indexes))
+
+        self._offsets = array(self.IndexType, [0])
+        self._columns = array(self.IndexType)
+        self._values = array(self.WeightType)
+
+        for vert_index in self.vert_indexes:
+            neighbours = adjacency.get_neighbours(vert_index)
+
+            if neighbours:
+                self._columns.extend(neighbours)
+                self._values.extend([1.0 / len(neighbours)] * len(neighbours))
+
+            self._offsets.append(len(self._columns))
+
+    def get_region(self):
+        """
+        Returns:
+            A set of the selected vertexes and all of their neighbours.
+        """
+        region = set(self.vert_indexes)
+        region.update(self._columns)
+        return region
+
+    def _smooth_row(self, old_weights, row, rows, unlocked, total, strength):
+        averages = dict.fromkeys(unlocked, 0.0)
+        columns = self._columns
+        values = self._values
+
+        for i in range(self._offsets[row], self._offsets[row + 1]):
+            neighbour_weights = rows[columns[i]]
+            factor = values[i]
+
+            for inf in unlocked:
+                value = neighbour_weights.get(inf)
+                if value:
+                    averages[inf] += value * factor
+
+        total_all = sum(averages.values())
+        if not total_all:
+            return old_weights
+
+        new_weights = dict(old_weights)
+
+        for inf in unlocked:
+            average = averages[inf] * (total / total_all)
+            new_weights[inf] = old_weights[inf] + (average - old_weights[inf]) * strength
+
+        # Renormalize the unlocked influences back to their old total.
+        new_total = sum(new_weights[inf] for inf in unlocked)
+        if new_total:
+            for inf in unlocked:
+                new_weights[inf] *= total / new_total
+
+        return new_weights
+
+    def smooth(self, skin_data, strength, iterations, locks):
+        """
+        Runs the smoothing passes without touching the skin data.
+
+        Args:
+            skin_data(SkinData): Weights to read from.
+            strength(float): A value of 0-1 to blend each pass by.
+            iterations(int): Number of passes.
+            locks(InfLocks): Lock states to respect.
+
+        Returns:
+            A dictionary of the selected vertexes' new weights. {vert_index: {inf_name: weight_value...}}
+        """
+        rows = dict(skin_data.iter_vertex_weights(sorted(self.get_region())))
+
+        # Rows keep the same influences between passes,
+        # so their unlocked influences and totals only need collecting once.
+        to_smooth = []
+
+        for row, vert_index in enumerate(self.vert_indexes):
+            unlocked = [
+                inf
+                for inf in rows[vert_index]
+                if not locks.is_locked(inf)
+            ]
+
+            # Need at least 2 unlocked influences to continue
+            if len(unlocked) < 2:
+                continue
+
+            total = 0.0
+            for inf in unlocked:
+                total += rows[vert_index][inf]
+
+            to_smooth.append((row, vert_index, unlocked, total))
+
+        for i in range(iterations):
+            new_rows = {
+                vert_index: self._smooth_row(rows[vert_index], row, rows, unlocked, total, strength)
+                for row, vert_index, unlocked, total in to_smooth
+            }
+
+            rows.update(new_rows)
+
+        # Zeros are only dropped at the end since they don't add anything to the averages.
+        return {
+            vert_index: {
+                inf: weight_value
+                for inf, weight_value in rows[vert_index].items()
+                if not is_close(0.0, weight_value)
+            }
+            for vert_index in self.vert_indexes
+        }
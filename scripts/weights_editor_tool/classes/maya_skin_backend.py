@@ -0,0 +1,70 @@
+from weights_editor_tool.weights_editor_utils import cmds
+
+from weights_editor_tool import weights_editor_utils as utils
+from weights_editor_tool.widgets import status_progress_bar
+from weights_editor_tool.classes.skin_backend import SkinBackend
+from weights_editor_tool.classes.symmetry_map import InfMirrorMap
+
+
+class MayaSkinBackend(SkinBackend):
+    """
+    Runs weight operations on a SkinnedObj in the scene.
+    Weights are written with the object's skinCluster, and long loops show Maya's progress bar.
+
+    Args:
+        skinned_obj(SkinnedObj): The object to work on.
+    """
+
+    def __init__(self, skinned_obj):
+        SkinBackend.__init__(self)
+        self._skinned_obj = skinned_obj
+
+    def get_skin_data(self):
+        return self._skinned_obj.skin_data
+
+    def get_points(self):
+        return [
+            (point.x, point.y, point.z)
+            for point in self._skinned_obj._get_world_points()
+        ]
+
+    def get_adjacency(self):
+        return self._skinned_obj.get_adjacency()
+
+    def get_influences(self):
+        return self._skinned_obj.infs
+
+    def get_influence_positions(self, infs):
+        return [
+            cmds.xform(inf, q=True, ws=True, t=True)
+            for inf in infs
+        ]
+
+    def get_inf_locks(self):
+        return self._skinned_obj.inf_locks
+
+    def get_selected_vertexes(self):
+        return utils.extract_indexes(utils.get_vert_indexes(self._skinned_obj.name))
+
+    def write_weights(self, vert_indexes, normalize=False, old_rows=None):
+        self._skinned_obj.apply_current_skin_weights(vert_indexes, normalize=normalize, old_rows=old_rows)
+
+    def _iter_progress(self, caption, items):
+        items = list(items)
+        if not items:
+            return
+
+        with status_progress_bar.StatusProgressBar(caption, len(items)) as pbar:
+            for item in items:
+                try:
+                    yield item
+
+                    if pbar.was_cancelled():
+                        raise RuntimeError("User cancelled")
+                finally:
+                    pbar.next()
+
+    def get_inf_mirror_map(self, mirror_mode, inf_association=None):
+        if inf_association == "label":
+            return InfMirrorMap.by_label(self.get_influences())
+        return SkinBackend.get_inf_mirror_map(self, mirror_mode, inf_association)
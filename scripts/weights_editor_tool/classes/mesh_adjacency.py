@@ -0,0 +1,156 @@
+from array import array
+
+try:
+    from weights_editor_tool.weights_editor_utils import cmds
+    from maya import OpenMaya
+    from maya.api import OpenMaya as om2
+    from weights_editor_tool import weights_editor_utils as utils
+except ImportError:
+    # Adjacency can still be built from triangles outside of Maya.
+    cmds = OpenMaya = om2 = utils = None
+
+
+class MeshAdjacency:
+    """
+    Stores which vertexes share an edge as compressed sparse rows.
+
+    A vertex's neighbours sit between offsets[vert_index] and offsets[vert_index + 1] in the flat neighbours array.
+    Curves have no edges, so all of their rows are empty.
+
+    Args:
+        offsets(array): Start of each vertex's row, with one extra entry to end the last row.
+        neighbours(array): Neighbour indexes of all rows.
+    """
+
+    IndexType = "i"
+
+    def __init__(self, offsets=None, neighbours=None):
+        self._offsets = offsets if offsets is not None else array(self.IndexType, [0])
+        self._neighbours = neighbours if neighbours is not None else array(self.IndexType)
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    @classmethod
+    def build(cls, obj):
+        """
+        Collects the neighbours of every vertex in one pass with the api vertex iterator.
+
+        Args:
+            obj(string): A mesh or curve.
+
+        Returns:
+            A new MeshAdjacency.
+        """
+        if utils.is_curve(obj):
+            return cls(array(cls.IndexType, [0]) * (utils.get_vert_count(obj) + 1))
+
+        msel_list = om2.MSelectionList()
+        msel_list.add(obj)
+        dag_path = msel_list.getDagPath(0)
+
+        offsets = array(cls.IndexType, [0])
+        neighbours = array(cls.IndexType)
+
+        vert_iter = om2.MItMeshVertex(dag_path)
+
+        while not vert_iter.isDone():
+            neighbours.extend(sorted(vert_iter.getConnectedVertices()))
+            offsets.append(len(neighbours))
+            vert_iter.next()
+
+        return cls(offsets, neighbours)
+
+    @classmethod
+    def from_triangles(cls, vert_count, triangles):
+        """
+        Builds adjacency from triangle edges, for when there's no mesh to iterate.
+        Polygons with more than 3 sides also connect across the edges they were triangulated with.
+
+        Args:
+            vert_count(int): Number of vertexes.
+            triangles(int[]): A flat list of vertex indexes, 3 per triangle.
+
+        Returns:
+            A new MeshAdjacency.
+        """
+        rows = [set() for i in range(vert_count)]
+
+        for i in range(0, len(triangles) - 2, 3):
+            a, b, c = triangles[i], triangles[i + 1], triangles[i + 2]
+            rows[a].update([b, c])
+            rows[b].update([a, c])
+            rows[c].update([a, b])
+
+        offsets = array(cls.IndexType, [0])
+        neighbours = array(cls.IndexType)
+
+        for row in rows:
+            neighbours.extend(sorted(row))
+            offsets.append(len(neighbours))
+
+        return cls(offsets, neighbours)
+
+    def get_neighbours(self, vert_index):
+        """
+        Returns:
+            A list of vertex indexes that share an edge with the vertex.
+        """
+        return self._neighbours[self._offsets[vert_index]:self._offsets[vert_index + 1]].tolist()
+
+    def get_neighbour_count(self, vert_index):
+        return self._offsets[vert_index + 1] - self._offsets[vert_index]
+
+    def nbytes(self):
+        return sum(
+            values.itemsize * len(values)
+            for values in [self._offsets, self._neighbours]
+        )
+
+
+class AdjacencyCache:
+    """
+    Builds a mesh's adjacency the first time it's needed and drops it once the topology changes.
+
+    Args:
+        obj(string): A mesh or curve.
+    """
+
+    def __init__(self, obj):
+        self._obj = obj
+        self._adjacency = None
+        self._callback_id = None
+
+    def get(self):
+        """
+        Returns:
+            The cached MeshAdjacency, building it if needed.
+        """
+        if self._adjacency is None:
+            self._adjacency = MeshAdjacency.build(self._obj)
+            self._add_callback()
+
+        return self._adjacency
+
+    def invalidate(self):
+        self._adjacency = None
+        self.remove_callback()
+
+    def _add_callback(self):
+        if self._callback_id is not None or utils.is_curve(self._obj):
+            return
+
+        shapes = cmds.listRelatives(self._obj, shapes=True, noIntermediate=True, fullPath=True, type="mesh")
+        if not shapes:
+            return
+
+        self._callback_id = OpenMaya.MPolyMessage.addPolyTopologyChangedCallback(
+            utils.to_mobject(shapes[0]), self._topology_on_changed)
+
+    def remove_callback(self):
+        if self._callback_id is not None:
+            OpenMaya.MMessage.removeCallback(self._callback_id)
+            self._callback_id = None
+
+    def _topology_on_changed(self, *args):
+        self._adjacency = None
@@ -0,0 +1,178 @@
+import math
+
+
+class PointGrid:
+    """
+    Buckets points into a uniform grid so nearest point lookups only have to check nearby cells.
+
+    The cell size is picked so each cell holds a few points on average.
+    Flat axes are ignored when sizing cells so planar point clouds don't end up in a handful of cells.
+
+    Args:
+        points(float[][]): A list of (x, y, z) positions.
+        points_per_cell(int): Roughly how many points each cell should hold.
+    """
+
+    DefaultPointsPerCell = 4
+
+    def __init__(self, points, points_per_cell=DefaultPointsPerCell):
+        self._points = [(float(p[0]), float(p[1]), float(p[2])) for p in points]
+        self._cells = {}  # {(x, y, z): [point_index...]}
+
+        if not self._points:
+            self._cell_size = 1.0
+            self._min = (0.0, 0.0, 0.0)
+            self._max_cell = (0, 0, 0)
+            return
+
+        self._min = tuple(min(p[axis] for p in self._points) for axis in range(3))
+        max_pos = tuple(max(p[axis] for p in self._points) for axis in range(3))
+        extents = [max_pos[axis] - self._min[axis] for axis in range(3)]
+
+        self._cell_size = self.get_cell_size(extents, len(self._points), points_per_cell)
+
+        for point_index, point in enumerate(self._points):
+            self._cells.setdefault(self._get_cell(point), []).append(point_index)
+
+        self._max_cell = self._get_cell(max_pos)
+
+    def __len__(self):
+        return len(self._points)
+
+    @staticmethod
+    def get_cell_size(extents, point_count, points_per_cell=DefaultPointsPerCell):
+        """
+        Returns:
+            A cell size so that points spread over the extents fill each cell with about points_per_cell.
+        """
+        largest = max(extents)
+        if largest <= 0:
+            return 1.0
+
+        # Ignore axes that are flat compared to the others.
+        used_extents = [extent for extent in extents if extent > largest * 1e-4]
+
+        cell_count = max(1.0, point_count / float(points_per_cell))
+        volume = 1.0
+        for extent in used_extents:
+            volume *= extent
+
+        return max((volume / cell_count) ** (1.0 / len(used_extents)), largest * 1e-6)
+
+    def _get_cell(self, point):
+        size = self._cell_size
+        return (
+            int(math.floor((point[0] - self._min[0]) / size)),
+            int(math.floor((point[1] - self._min[1]) / size)),
+            int(math.floor((point[2] - self._min[2]) / size))
+        )
+
+    def _iter_shell(self, cell, radius):
+        """
+        Yields the cells inside the grid that are exactly radius cells away from a cell.
+        """
+        cx, cy, cz = cell
+        mx, my, mz = self._max_cell
+
+        min_z = max(0, cz - radius)
+        max_z = min(mz, cz + radius)
+
+        for x in range(max(0, cx - radius), min(mx, cx + radius) + 1):
+            edge_x = abs(x - cx) == radius
+
+            for y in range(max(0, cy - radius), min(my, cy + radius) + 1):
+                if edge_x or abs(y - cy) == radius:
+                    for z in range(min_z, max_z + 1):
+                        yield x, y, z
+                else:
+                    if cz - radius >= 0:
+                        yield x, y, cz - radius
+                    if cz + radius <= mz:
+                        yield x, y, cz + radius
+
+    def _clamp_cell(self, cell):
+        """
+        Moves a cell onto the grid's closest edge if it's outside of it.
+        Points past the grid are still at least as far from other cells as their clamped cell is.
+        """
+        return tuple(
+            min(max(cell[axis], 0), self._max_cell[axis])
+            for axis in range(3)
+        )
+
+    def _get_max_radius(self, cell):
+        """
+        Returns:
+            The shell radius past which there are no more cells to check.
+        """
+        return max(
+            max(cell[axis], self._max_cell[axis] - cell[axis])
+            for axis in range(3)
+        )
+
+    def closest_points(self, point, count=1):
+        """
+        Finds the nearest points to a position.
+
+        Args:
+            point(float[]): An (x, y, z) position.
+            count(int): How many of the nearest points to find.
+
+        Returns:
+            A list of (point_index, distance) sorted from nearest to farthest.
+        """
+        if not self._points:
+            return []
+
+        px, py, pz = float(point[0]), float(point[1]), float(point[2])
+        cell = self._clamp_cell(self._get_cell((px, py, pz)))
+        count = min(count, len(self._points))
+
+        cells = self._cells
+        points = self._points
+        found = []  # [(squared_distance, point_index)...]
+
+        for radius in range(self._get_max_radius(cell) + 1):
+            for shell_cell in self._iter_shell(cell, radius):
+                point_indexes = cells.get(shell_cell)
+                if not point_indexes:
+                    continue
+
+                for point_index in point_indexes:
+                    x, y, z = points[point_index]
+                    found.append(((x - px) ** 2 + (y - py) ** 2 + (z - pz) ** 2, point_index))
+
+            if len(found) >= count:
+                found.sort()
+                del found[count:]
+
+                # Anything in the next shell is at least this far away.
+                reach = radius * self._cell_size
+                if found[-1][0] <= reach * reach:
+                    break
+
+        found.sort()
+
+        return [
+            (point_index, math.sqrt(squared_distance))
+            for squared_distance, point_index in found[:count]
+        ]
+
+    def closest_point(self, point):
+        """
+        Returns:
+            The index of the nearest point.
+        """
+        return self.closest_points(point, 1)[0][0]
+
+    def batch_closest_points(self, points, count=1):
+        """
+        Runs closest_points() on many positions.
+
+        Returns:
+            A list with a result from closest_points() for each position.
+        """
+        return [
+            self.closest_points(point, count)
+            for point in points
+        ]
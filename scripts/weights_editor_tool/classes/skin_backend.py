@@ -0,0 +1,454 @@
+from array import array
+
+from weights_editor_tool.enums import SkinCompression
+from weights_editor_tool.classes.skin_data import SkinData
+from weights_editor_tool.classes.skin_file import SkinFile
+from weights_editor_tool.classes.inf_locks import InfLocks
+from weights_editor_tool.classes.mesh_adjacency import MeshAdjacency
+from weights_editor_tool.classes.laplacian_smoother import LaplacianSmoother
+from weights_editor_tool.classes.point_grid import PointGrid
+from weights_editor_tool.classes.triangle_bvh import TriangleBVH
+from weights_editor_tool.classes.symmetry_map import SymmetryCache
+from weights_editor_tool.classes.symmetry_map import InfMirrorMap
+
+
+class SkinBackend:
+    """
+    The few things weight operations need from a skinned object.
+
+    Subclasses only provide the primitives, like reading points and writing weights,
+    and the operations below work the same on any of them.
+    Operations edit the skin data in place and return which vertexes changed,
+    so the caller decides when to write them with write_weights().
+    """
+
+    def __init__(self):
+        self._symmetry_cache = SymmetryCache()
+
+    def get_skin_data(self):
+        """
+        Returns:
+            The SkinData that operations edit.
+        """
+        raise NotImplementedError
+
+    def get_points(self):
+        """
+        Returns:
+            A list of each vertex's (x, y, z) world position.
+        """
+        raise NotImplementedError
+
+    def get_adjacency(self):
+        """
+        Returns:
+            A MeshAdjacency of the object.
+        """
+        raise NotImplementedError
+
+    def get_influences(self):
+        """
+        Returns:
+            A list of influence names.
+        """
+        raise NotImplementedError
+
+    def get_influence_positions(self, infs):
+        """
+        Returns:
+            A list of the (x, y, z) world position of each influence.
+        """
+        raise NotImplementedError
+
+    def get_inf_locks(self):
+        """
+        Returns:
+            An InfLocks with the lock state of each influence.
+        """
+        raise NotImplementedError
+
+    def get_selected_vertexes(self):
+        """
+        Returns:
+            A list of selected vertex indexes.
+        """
+        raise NotImplementedError
+
+    def write_weights(self, vert_indexes, normalize=False, old_rows=None):
+        """
+        Writes the skin data's current weights of some vertexes out.
+
+        Args:
+            vert_indexes(int[]): Vertexes to write.
+            normalize(bool): Normalizes the weights after they're written.
+            old_rows(dict): Rows from SkinData.copy_vertexes() before the edit so only changes are written.
+        """
+        raise NotImplementedError
+
+    def _iter_progress(self, caption, items):
+        """
+        Goes through items while showing progress. Subclasses can show a progress bar and raise to cancel.
+        """
+        return iter(items)
+
+    def get_symmetry_map(self, mirror_mode):
+        points = array("d")
+        for point in self.get_points():
+            points.extend([point[0], point[1], point[2]])
+
+        return self._symmetry_cache.get(points, mirror_mode)
+
+    def get_inf_mirror_map(self, mirror_mode, inf_association=None):
+        """
+        Returns:
+            {inf_name: mirror_inf_name}
+        """
+        infs = self.get_influences()
+
+        if inf_association == "name":
+            return InfMirrorMap.by_name(infs)
+        elif inf_association in [None, "closestJoint"]:
+            return InfMirrorMap.by_position(infs, mirror_mode, positions=self.get_influence_positions(infs))
+        else:
+            raise NotImplementedError("This influence association isn't supported here: {0}".format(inf_association))
+
+    def prune_weights(self, value, vert_indexes):
+        """
+        Removes unlocked weights below a value and scales the rest back up so each vertex still adds up to 1.
+        A vertex is left alone if it would lose all of its unlocked weights.
+
+        Returns:
+            A set of vertex indexes that changed.
+        """
+        skin_data = self.get_skin_data()
+        inf_locks = self.get_inf_locks()
+        changed = set()
+
+        for vert_index in vert_indexes:
+            weights = skin_data.get_vertex_weights(vert_index)
+
+            locked = {}
+            kept = {}
+            unlocked_count = 0
+
+            for inf, weight_value in weights.items():
+                if inf_locks.is_locked(inf):
+                    locked[inf] = weight_value
+                    continue
+
+                unlocked_count += 1
+                if weight_value >= value:
+                    kept[inf] = weight_value
+
+            kept_total = sum(kept.values())
+            if len(kept) == unlocked_count or not kept_total:
+                continue
+
+            scale = max(0.0, 1.0 - sum(locked.values())) / kept_total
+
+            new_weights = dict(locked)
+            for inf, weight_value in kept.items():
+                new_weights[inf] = weight_value * scale
+
+            skin_data.set_vertex_weights(vert_index, new_weights)
+            changed.add(vert_index)
+
+        return changed
+
+    def prune_max_infs(self, max_inf_count, vert_indexes):
+        """
+        Removes the smallest unlocked weights until each vertex has at most this many influences.
+
+        Returns:
+            A set of vertex indexes that changed.
+        """
+        skin_data = self.get_skin_data()
+        inf_locks = self.get_inf_locks()
+        changed = set()
+
+        for vert_index in vert_indexes:
+            sorted_infs = [
+                inf for inf, value in sorted(skin_data.get_vertex_weights(vert_index).items(), key=lambda item: item[1])]
+
+            for inf in sorted_infs:
+                infs_count = skin_data.get_vertex_inf_count(vert_index)
+                if infs_count <= max_inf_count:
+                    break
+
+                if inf_locks.is_locked(inf):
+                    continue
+
+                skin_data.update_weight_value(vert_index, inf, 0, locks=inf_locks)
+                changed.add(vert_index)
+
+        return changed
+
+    def smooth_weights(self, vert_indexes, strength, iterations=1):
+        """
+        Smooths weights with the influences already on each vertex. See LaplacianSmoother.
+
+        Returns:
+            A set of vertex indexes that changed.
+        """
+        skin_data = self.get_skin_data()
+
+        # Every pass reads the previous pass' values, so new values don't interfere
+        # when calculating other indexes.
+        smoother = LaplacianSmoother(self.get_adjacency(), vert_indexes)
+        weights_to_set = smoother.smooth(skin_data, strength, iterations, self.get_inf_locks())
+
+        for vert_index, weights in weights_to_set.items():
+            skin_data.set_vertex_weights(vert_index, weights)
+
+        return set(weights_to_set)
+
+    def mirror_weights(self, mirror_mode, mirror_inverse, inf_association=None, vert_indexes=None):
+        """
+        Copies each vertex's weights from its closest vertex on the other side of a plane,
+        swapping each influence for its mirror.
+
+        Args:
+            mirror_mode(string): The mirror plane, either "XY", "YZ" or "XZ".
+            mirror_inverse(bool): False copies from the positive side to the negative side, True does the opposite.
+            inf_association(string): How influences are paired, either "name", "label" or "closestJoint".
+            vert_indexes(int[]): Vertexes to limit to. Picking a vertex on the source side picks its mirror.
+
+        Returns:
+            A sorted list of vertex indexes that received weights.
+        """
+        skin_data = self.get_skin_data()
+        symmetry_map = self.get_symmetry_map(mirror_mode)
+        inf_map = self.get_inf_mirror_map(mirror_mode, inf_association)
+
+        targets = symmetry_map.get_targets(mirror_inverse, vert_indexes or None)
+        if not targets:
+            return targets
+
+        # Every target reads its source as it was before the mirror.
+        sources = dict(skin_data.iter_vertex_weights(
+            sorted(set(symmetry_map.get_mirror_index(vert_index) for vert_index in targets))))
+
+        for vert_index in targets:
+            source_index = symmetry_map.get_mirror_index(vert_index)
+
+            weights = {}
+            for inf, weight_value in sources[source_index].items():
+                mirror_inf = inf_map.get(inf, inf)
+                weights[mirror_inf] = weights.get(mirror_inf, 0.0) + weight_value
+
+            skin_data.set_vertex_weights(vert_index, weights, dq=skin_data.get_vertex_dq(source_index))
+
+        return targets
+
+    def map_to_closest_vertexes(self, verts_data, vert_filter=None):
+        """
+        Pairs each vertex with the closest vertex of serialized data by world position.
+
+        Args:
+            verts_data(dict): {vert_index: {"world_pos": float[]...}}
+            vert_filter(int[]): Vertexes to limit to. Leave empty to use all of them.
+
+        Returns:
+            {vert_index: data_vert_index}
+        """
+        weights_data = {}
+
+        file_indexes = sorted(verts_data.keys())
+
+        point_grid = PointGrid([
+            verts_data[index]["world_pos"]
+            for index in file_indexes
+        ])
+
+        vert_filter = set(vert_filter or [])
+
+        for vert_index, point in self._iter_progress("Finding closest points", enumerate(self.get_points())):
+            # Skip calculations if index is not in the filter.
+            if vert_filter and vert_index not in vert_filter:
+                continue
+
+            weights_data[vert_index] = file_indexes[point_grid.closest_point(point)]
+
+        return weights_data
+
+    def map_to_closest_triangles(self, verts_data, triangles, vert_filter=None):
+        """
+        Blends the weights of the closest triangle of serialized data onto each vertex.
+
+        Args:
+            verts_data(dict): {vert_index: {"weights": {inf_name: weight_value...}, "dq": float, "world_pos": float[]}}
+            triangles(int[]): A flat list of the data's vertex indexes, 3 per triangle.
+            vert_filter(int[]): Vertexes to limit to. Leave empty to use all of them.
+
+        Returns:
+            {vert_index: {"weights": {inf_name: weight_value...}, "dq": float}}
+        """
+        weights_data = {}
+
+        file_indexes = sorted(verts_data.keys())
+
+        bvh = TriangleBVH(
+            [verts_data[index]["world_pos"] for index in file_indexes],
+            triangles)
+
+        vert_filter = set(vert_filter or [])
+
+        for vert_index, point in self._iter_progress("Finding closest triangles", enumerate(self.get_points())):
+            # Skip calculations if index is not in the filter.
+            if vert_filter and vert_index not in vert_filter:
+                continue
+
+            tri_index, bary = bvh.closest_triangle(point)
+
+            weights = {}
+            dq = 0.0
+
+            for point_index, factor in zip(bvh.get_triangle(tri_index), bary):
+                if not factor:
+                    continue
+
+                file_data = verts_data[file_indexes[point_index]]
+                dq += file_data["dq"] * factor
+
+                for inf, weight_value in file_data["weights"].items():
+                    weights[inf] = weights.get(inf, 0.0) + weight_value * factor
+
+            weights_data[vert_index] = {"weights": weights, "dq": dq}
+
+        return weights_data
+
+
+class MemorySkinBackend(SkinBackend):
+    """
+    Holds a skin in memory without Maya, so operations can run on skin files in a plain Python interpreter.
+
+    Writing weights only keeps them in the skin data until save() is called.
+
+    Args:
+        skin_data(SkinData): The weights.
+        points(float[][]): Each vertex's (x, y, z) world position.
+        adjacency(MeshAdjacency): Neighbours of each vertex. Leave as None to have no neighbours.
+        influences(string[]): Influence names. Leave as None to use the ones in the skin data.
+        influence_positions(dict): {inf_name: (x, y, z)}
+        inf_locks(InfLocks): Lock states. Leave as None to have everything unlocked.
+        selection(int[]): Vertexes that count as selected.
+        file_data(dict): The rest of the serialized data to save the skin back out with.
+    """
+
+    def __init__(self, skin_data, points, adjacency=None, influences=None, influence_positions=None,
+                 inf_locks=None, selection=None, file_data=None):
+        SkinBackend.__init__(self)
+
+        self._skin_data = skin_data
+        self._points = [tuple(point) for point in points]
+        self._adjacency = adjacency or MeshAdjacency(array(MeshAdjacency.IndexType, [0]) * (len(self._points) + 1))
+        self._influences = list(influences if influences is not None else skin_data.inf_names)
+        self._influence_positions = dict(influence_positions or {})
+        self._inf_locks = inf_locks or InfLocks.from_states(dict.fromkeys(self._influences, False))
+        self._selection = list(selection or [])
+        self._file_data = dict(file_data or {})
+
+    @classmethod
+    def from_file(cls, file_path):
+        """
+        Loads a skin file. Neighbours come from the file's triangles.
+
+        Returns:
+            A new MemorySkinBackend.
+        """
+        with SkinFile(file_path) as skin_file:
+            data = skin_file.to_dict()
+
+        verts = data.pop("verts")
+        vert_indexes = sorted(verts)
+
+        points = [
+            verts[vert_index].get("world_pos") or [0.0, 0.0, 0.0]
+            for vert_index in vert_indexes
+        ]
+
+        influences = []
+        influence_positions = {}
+
+        for inf_id, inf_data in sorted(data["influences"].items()):
+            influences.append(inf_data["name"])
+            influence_positions[inf_data["name"]] = tuple(inf_data["world_matrix"][12:15])
+
+        return cls(
+            SkinData.from_dict(verts),
+            points,
+            adjacency=MeshAdjacency.from_triangles(len(points), data.get("triangles") or []),
+            influences=influences,
+            influence_positions=influence_positions,
+            file_data=data)
+
+    def copy(self):
+        """
+        Returns:
+            A new MemorySkinBackend with its own copy of the weights and locks. Everything else is shared.
+        """
+        inf_locks = InfLocks.from_states({
+            inf: self._inf_locks.is_locked(inf)
+            for inf in self._influences
+        })
+
+        return self.__class__(
+            self._skin_data.copy(),
+            self._points,
+            adjacency=self._adjacency,
+            influences=self._influences,
+            influence_positions=self._influence_positions,
+            inf_locks=inf_locks,
+            selection=self._selection,
+            file_data=self._file_data)
+
+    def save(self, file_path, codec=SkinCompression.Uncompressed):
+        """
+        Writes the skin back out as a skin file.
+        """
+        verts = self._skin_data.to_dict()
+
+        for vert_index, point in enumerate(self._points):
+            verts.setdefault(vert_index, {"weights": {}, "dq": 0.0})["world_pos"] = list(point)
+
+        data = dict(self._file_data)
+        data["verts"] = verts
+        SkinFile.save(file_path, data, codec=codec)
+
+    def get_skin_data(self):
+        return self._skin_data
+
+    def get_points(self):
+        return self._points
+
+    def get_adjacency(self):
+        return self._adjacency
+
+    def get_influences(self):
+        return self._influences
+
+    def get_influence_positions(self, infs):
+        return [
+            self._influence_positions.get(inf, (0.0, 0.0, 0.0))
+            for inf in infs
+        ]
+
+    def get_inf_locks(self):
+        return self._inf_locks
+
+    def get_selected_vertexes(self):
+        return self._selection
+
+    def write_weights(self, vert_indexes, normalize=False, old_rows=None):
+        if not normalize:
+            return
+
+        for vert_index in vert_indexes:
+            weights = self._skin_data.get_vertex_weights(vert_index)
+            total = sum(weights.values())
+
+            if total:
+                self._skin_data.set_vertex_weights(vert_index, {
+                    inf: weight_value / total
+                    for inf, weight_value in weights.items()
+                })
@@ -1,35 +1,166 @@
-import copy
-
-from maya import cmds
-from maya import OpenMaya
-from maya import OpenMayaAnim
+import sys
+from array import array
+from itertools import compress
 
 from weights_editor_tool.enums import WeightOperation
-from weights_editor_tool import weights_editor_utils as utils
+from weights_editor_tool.math_utils import is_close, clamp
+from weights_editor_tool.classes.inf_locks import InfLocks
+from weights_editor_tool.classes.tracer import tracer
 
+try:
+    from weights_editor_tool.weights_editor_utils import cmds
+    from maya import OpenMaya
+    from maya import OpenMayaAnim
+    from weights_editor_tool import weights_editor_utils as utils
+except ImportError:
+    # Outside of Maya there's no skinCluster to read, but all of the weight math still works.
+    cmds = OpenMaya = OpenMayaAnim = utils = None
 
-class SkinData:
 
-    def __init__(self, data):
-        self.data = data
+class SkinData:
+    """
+    Stores skin weights as compressed sparse rows instead of a dictionary per vertex.
+
+    A vertex's weights sit between offsets[vert_index] and offsets[vert_index + 1]
+    in the flat inf_ids and weights arrays, and each inf id points to a name in inf_names.
+    Edited rows are kept in a small overlay until compact() folds them back into the arrays.
+
+    Indexing still returns {"weights": {inf_name: weight_value...}, "dq": float},
+    but it's a copy, so edits need to be set back with __setitem__ or set_vertex_weights().
+
+    Args:
+        inf_names(string[]): Influence names that inf ids point to.
+        offsets(array): Start of each vertex's row, with one extra entry to end the last row.
+        inf_ids(array): Influence ids of all rows.
+        weights(array): Weight values of all rows.
+        dq(array): Dual-quaternion blend weight of each vertex.
+    """
+
+    OffsetType = "i"
+    InfIdType = "i"
+    WeightType = "d"
+
+    # Edits to buffer before they're folded back into the arrays.
+    MinEditsBeforeCompact = 1024
+
+    def __init__(self, inf_names=None, offsets=None, inf_ids=None, weights=None, dq=None):
+        self.inf_names = list(inf_names or [])
+        self._inf_lookup = {inf_name: inf_id for inf_id, inf_name in enumerate(self.inf_names)}
+        self._offsets = offsets if offsets is not None else array(self.OffsetType, [0])
+        self._inf_ids = inf_ids if inf_ids is not None else array(self.InfIdType)
+        self._weights = weights if weights is not None else array(self.WeightType)
+        self._dq = dq if dq is not None else array(self.WeightType)
+        self._edits = {}  # {vert_index: {inf_name: weight_value...}}
+
+    def __len__(self):
+        return len(self._dq)
 
     def __iter__(self):
-        for vert_index in self.data:
+        for vert_index in range(len(self)):
             yield vert_index
 
+    def __contains__(self, vert_index):
+        return 0 <= vert_index < len(self)
+
     def __getitem__(self, vert_index):
-        return self.data[vert_index]
+        return {
+            "weights": self.get_vertex_weights(vert_index),
+            "dq": self.get_vertex_dq(vert_index)
+        }
 
     def __setitem__(self, vert_index, value):
-        self.data[vert_index] = value
+        self.set_vertex_weights(vert_index, value["weights"], dq=value.get("dq"))
 
     @classmethod
     def create_empty(cls):
-        return cls(None)
+        return cls()
 
     @classmethod
+    @tracer.traced()
     def get(cls, skin_cluster):
-        return cls(cls.get_data(skin_cluster))
+        try:
+            return cls.get_bulk(skin_cluster)
+        except RuntimeError:
+            # Fall back to reading plug by plug, which also copes with odd skinCluster setups.
+            return cls.from_dict(cls.get_data(skin_cluster))
+
+    @classmethod
+    @tracer.traced()
+    def get_bulk(cls, skin_cluster):
+        """
+        Reads the whole weight matrix with a single MFnSkinCluster.getWeights() call
+        and all dual-quaternion values with a single getBlendWeights() call,
+        then strips the zero weights out of the flat buffer row by row.
+
+        Returns:
+            A new SkinData.
+        """
+        mfn_skin_cluster = utils.to_mfn_skin_cluster(skin_cluster)
+        shape_path = utils.get_skin_geometry_path(mfn_skin_cluster)
+        components = utils.create_vert_components(shape_path)
+
+        inf_names = [
+            inf_path.partialPathName()
+            for inf_path in mfn_skin_cluster.influenceObjects()
+        ]
+
+        flat_weights, inf_count = mfn_skin_cluster.getWeights(shape_path, components)
+        blend_weights = mfn_skin_cluster.getBlendWeights(shape_path, components)
+
+        vert_count = len(blend_weights)
+        if len(flat_weights) != vert_count * inf_count:
+            raise RuntimeError("Weight count doesn't match the vertex count on `{0}`.".format(skin_cluster))
+
+        flat_weights = array(cls.WeightType, flat_weights)
+        dq = array(cls.WeightType, blend_weights)
+
+        if not inf_count:
+            return cls(inf_names, array(cls.OffsetType, [0]) * (vert_count + 1), dq=dq)
+
+        offsets = array(cls.OffsetType, [0])
+        inf_ids = array(cls.InfIdType)
+        weights = array(cls.WeightType)
+        inf_range = range(inf_count)
+
+        for start in range(0, len(flat_weights), inf_count):
+            row = flat_weights[start:start + inf_count]
+            inf_ids.extend(compress(inf_range, row))
+            weights.extend(filter(None, row))
+            offsets.append(len(inf_ids))
+
+        return cls(inf_names, offsets, inf_ids, weights, dq)
+
+    @classmethod
+    @tracer.traced()
+    def from_dict(cls, data):
+        """
+        Builds skin data from the old dictionary layout.
+        Any vertex that's missing from the dictionary will have no weights.
+
+        Args:
+            data(dict): {vert_index: {"weights": {inf_name: weight_value...}, "dq": float}}
+        """
+        skin_data = cls()
+
+        if not data:
+            return skin_data
+
+        vert_count = max(data) + 1
+        skin_data._dq = array(cls.WeightType, [0.0]) * vert_count
+
+        for vert_index in range(vert_count):
+            vert_data = data.get(vert_index)
+
+            if vert_data is not None:
+                for inf_name, weight_value in vert_data["weights"].items():
+                    skin_data._inf_ids.append(skin_data._get_or_add_inf_id(inf_name))
+                    skin_data._weights.append(weight_value)
+
+                skin_data._dq[vert_index] = vert_data.get("dq") or 0.0
+
+            skin_data._offsets.append(len(skin_data._inf_ids))
+
+        return skin_data
 
     @staticmethod
     def get_data(skin_cluster):
@@ -87,85 +218,618 @@ class SkinData:
 
         return skin_weights
 
+    def _check_vert_index(self, vert_index):
+        if not 0 <= vert_index < len(self):
+            raise KeyError(vert_index)
+
+    def _get_or_add_inf_id(self, inf_name):
+        inf_id = self._inf_lookup.get(inf_name)
+
+        if inf_id is None:
+            inf_id = len(self.inf_names)
+            self.inf_names.append(inf_name)
+            self._inf_lookup[inf_name] = inf_id
+
+        return inf_id
+
+    def get_inf_id(self, inf_name):
+        """
+        Returns:
+            The influence's id in the arrays, or None if no vertex ever used it.
+        """
+        return self._inf_lookup.get(inf_name)
+
+    @tracer.traced()
+    def rename_infs(self, new_names):
+        """
+        Renames influences once for all rows instead of going through each vertex.
+        If some influences end up with the same name, their weights are added together.
+
+        Args:
+            new_names(dict): {old_name: new_name}. Influences that aren't in it keep their names.
+        """
+        self.compact()
+
+        inf_names = [new_names.get(inf_name, inf_name) for inf_name in self.inf_names]
+        unique_names = []
+        inf_lookup = {}
+
+        for inf_name in inf_names:
+            if inf_name not in inf_lookup:
+                inf_lookup[inf_name] = len(unique_names)
+                unique_names.append(inf_name)
+
+        if len(unique_names) != len(inf_names):
+            new_ids = [inf_lookup[inf_name] for inf_name in inf_names]
+            old_offsets = self._offsets
+            old_inf_ids = self._inf_ids
+            old_weights = self._weights
+
+            self._offsets = array(self.OffsetType, [0])
+            self._inf_ids = array(self.InfIdType)
+            self._weights = array(self.WeightType)
+
+            for vert_index in range(len(self)):
+                row = {}
+                for i in range(old_offsets[vert_index], old_offsets[vert_index + 1]):
+                    new_id = new_ids[old_inf_ids[i]]
+                    row[new_id] = row.get(new_id, 0.0) + old_weights[i]
+
+                self._inf_ids.extend(row.keys())
+                self._weights.extend(row.values())
+                self._offsets.append(len(self._inf_ids))
+
+        self.inf_names = unique_names
+        self._inf_lookup = inf_lookup
+
+    def to_dict(self):
+        """
+        Returns:
+            The old dictionary layout.
+            {vert_index: {"weights": {inf_name: weight_value...}, "dq": float}}
+        """
+        return {
+            vert_index: self[vert_index]
+            for vert_index in self
+        }
+
+    @tracer.traced()
+    def compact(self):
+        """
+        Folds all edited rows back into the arrays.
+        Untouched runs of rows are copied over in bulk.
+        """
+        if not self._edits:
+            return
+
+        old_offsets = self._offsets
+        old_inf_ids = self._inf_ids
+        old_weights = self._weights
+
+        offsets = array(self.OffsetType, [0])
+        inf_ids = array(self.InfIdType)
+        weights = array(self.WeightType)
+
+        vert_count = len(self)
+        next_vert_index = 0
+
+        for edit_index in sorted(self._edits) + [vert_count]:
+            # Copy all untouched rows up to this edit.
+            if edit_index > next_vert_index:
+                start = old_offsets[next_vert_index]
+                end = old_offsets[edit_index]
+                shift = len(inf_ids) - start
+
+                inf_ids.extend(old_inf_ids[start:end])
+                weights.extend(old_weights[start:end])
+
+                row_ends = old_offsets[next_vert_index + 1:edit_index + 1]
+                if shift:
+                    row_ends = array(self.OffsetType, [offset + shift for offset in row_ends])
+                offsets.extend(row_ends)
+
+            if edit_index == vert_count:
+                break
+
+            for inf_name, weight_value in self._edits[edit_index].items():
+                inf_ids.append(self._get_or_add_inf_id(inf_name))
+                weights.append(weight_value)
+
+            offsets.append(len(inf_ids))
+            next_vert_index = edit_index + 1
+
+        self._offsets = offsets
+        self._inf_ids = inf_ids
+        self._weights = weights
+        self._edits = {}
+
+    def nbytes(self):
+        """
+        Returns:
+            An estimate of how many bytes the weights take in memory.
+        """
+        size = sum(
+            values.itemsize * len(values)
+            for values in [self._offsets, self._inf_ids, self._weights, self._dq]
+        )
+
+        for weights in self._edits.values():
+            size += sys.getsizeof(weights) + sys.getsizeof(0.0) * len(weights)
+
+        return size
+
+    @tracer.traced()
     def copy(self):
-        return self.__class__(copy.deepcopy(self.data))
+        skin_data = self.__class__(
+            self.inf_names,
+            self._offsets[:],
+            self._inf_ids[:],
+            self._weights[:],
+            self._dq[:])
+
+        skin_data._edits = {
+            vert_index: dict(weights)
+            for vert_index, weights in self._edits.items()
+        }
+
+        return skin_data
+
+    def update_hash(self, hasher):
+        """
+        Feeds the weights into a hashlib object, so unchanged skins can be spotted without comparing them.
+
+        Args:
+            hasher(hashlib object): Anything with an update() method that takes bytes.
+        """
+        skin_data = self
+
+        if self._edits:
+            skin_data = self.copy()
+            skin_data.compact()
+
+        hasher.update("|".join(skin_data.inf_names).encode("utf-8"))
+
+        for values in [skin_data._offsets, skin_data._inf_ids, skin_data._weights, skin_data._dq]:
+            hasher.update(values)
 
     def copy_vertex(self, vert_index):
-        return copy.deepcopy(self.data[vert_index])
+        return self[vert_index]
+
+    @tracer.traced()
+    def copy_vertexes(self, vert_indexes):
+        """
+        Copies only the rows of some vertexes, for when a full copy would be wasteful.
+
+        Returns:
+            {vert_index: {"weights": {inf_name: weight_value...}, "dq": float}}
+        """
+        return {
+            vert_index: self[vert_index]
+            for vert_index in vert_indexes
+        }
+
+    def set_vertexes(self, vert_rows):
+        """
+        Sets back rows from copy_vertexes().
+        """
+        for vert_index, vert_data in vert_rows.items():
+            self[vert_index] = vert_data
+
+    @staticmethod
+    def diff_vertexes(old_rows, new_rows):
+        """
+        Compares two sets of rows from copy_vertexes() and keeps only the values that differ.
+        An influence that was removed from a vertex comes back with a weight of 0.
+
+        Returns:
+            A tuple of changed weights and changed dual-quaternions.
+            ({vert_index: {inf_name: weight_value...}}, {vert_index: float})
+        """
+        changed_weights = {}
+        changed_dq = {}
+
+        for vert_index, new_data in new_rows.items():
+            old_data = old_rows.get(vert_index)
+
+            if old_data is None:
+                changed_weights[vert_index] = dict(new_data["weights"])
+                changed_dq[vert_index] = new_data["dq"]
+                continue
+
+            old_weights = old_data["weights"]
+            new_weights = new_data["weights"]
+
+            vert_changes = {
+                inf_name: weight_value
+                for inf_name, weight_value in new_weights.items()
+                if old_weights.get(inf_name) != weight_value
+            }
+
+            for inf_name in old_weights:
+                if inf_name not in new_weights:
+                    vert_changes[inf_name] = 0.0
+
+            if vert_changes:
+                changed_weights[vert_index] = vert_changes
+
+            if old_data["dq"] != new_data["dq"]:
+                changed_dq[vert_index] = new_data["dq"]
+
+        return changed_weights, changed_dq
+
+    def get_vertex_weights(self, vert_index):
+        """
+        Returns:
+            A new dictionary of the vertex's weights. {inf_name: weight_value...}
+        """
+        self._check_vert_index(vert_index)
+
+        weights = self._edits.get(vert_index)
+        if weights is not None:
+            return dict(weights)
+
+        start = self._offsets[vert_index]
+        end = self._offsets[vert_index + 1]
+        inf_names = self.inf_names
+
+        return {
+            inf_names[inf_id]: weight_value
+            for inf_id, weight_value in zip(self._inf_ids[start:end], self._weights[start:end])
+        }
+
+    def get_vertex_dq(self, vert_index):
+        self._check_vert_index(vert_index)
+        return self._dq[vert_index]
 
     def get_vertex_infs(self, vert_index):
         try:
-            return list(self.data[vert_index]["weights"].keys())
+            return list(self.get_vertex_weights(vert_index).keys())
         except KeyError:
             return []
 
-    def calculate_new_value(self, input_value, vert_index, inf, weight_operation):
-        old_value = self.data[vert_index]["weights"].get(inf) or 0.0
+    def get_vertex_inf_count(self, vert_index):
+        self._check_vert_index(vert_index)
+
+        weights = self._edits.get(vert_index)
+        if weights is not None:
+            return len(weights)
+
+        return self._offsets[vert_index + 1] - self._offsets[vert_index]
+
+    def get_weight(self, vert_index, inf_name, default=None):
+        """
+        Gets a single weight value without building the vertex's whole dictionary.
+        """
+        self._check_vert_index(vert_index)
+
+        weights = self._edits.get(vert_index)
+        if weights is not None:
+            return weights.get(inf_name, default)
+
+        inf_id = self._inf_lookup.get(inf_name)
+        if inf_id is None:
+            return default
+
+        start = self._offsets[vert_index]
+        end = self._offsets[vert_index + 1]
+        row_inf_ids = self._inf_ids[start:end]
+
+        if inf_id not in row_inf_ids:
+            return default
+
+        return self._weights[start + row_inf_ids.index(inf_id)]
 
+    def set_vertex_weights(self, vert_index, weights, dq=None):
+        """
+        Replaces all weights of a vertex.
+
+        Args:
+            vert_index(int)
+            weights(dict): {inf_name: weight_value...}
+            dq(float): The new dual-quaternion value, or None to leave it as is.
+        """
+        self._check_vert_index(vert_index)
+
+        self._edits[vert_index] = dict(weights)
+
+        if dq is not None:
+            self._dq[vert_index] = dq
+
+        self._compact_if_needed()
+
+    def _compact_if_needed(self):
+        if len(self._edits) > max(self.MinEditsBeforeCompact, len(self) // 8):
+            self.compact()
+
+    def _set_edited_rows(self, rows):
+        """
+        Takes ownership of rows that were already copied, and only checks for compacting once at the end.
+        """
+        self._edits.update(rows)
+        self._compact_if_needed()
+
+    def iter_vertex_weights(self, vert_indexes=None):
+        """
+        Yields each vertex with its weights.
+
+        Args:
+            vert_indexes(int[]): Vertexes to go through, or None for all of them.
+
+        Yields:
+            (vert_index, {inf_name: weight_value...})
+        """
+        if vert_indexes is None:
+            vert_indexes = range(len(self))
+
+        offsets = self._offsets
+        all_inf_ids = self._inf_ids
+        all_weights = self._weights
+        inf_names = self.inf_names
+
+        for vert_index in vert_indexes:
+            weights = self._edits.get(vert_index)
+
+            if weights is not None:
+                yield vert_index, dict(weights)
+            else:
+                self._check_vert_index(vert_index)
+                start = offsets[vert_index]
+                end = offsets[vert_index + 1]
+
+                yield vert_index, {
+                    inf_names[inf_id]: weight_value
+                    for inf_id, weight_value in zip(all_inf_ids[start:end], all_weights[start:end])
+                }
+
+    def iter_inf_weights(self, inf_name, vert_indexes=None):
+        """
+        Yields each vertex with its weight from one influence.
+
+        Args:
+            inf_name(string)
+            vert_indexes(int[]): Vertexes to go through, or None for all of them.
+
+        Yields:
+            (vert_index, weight_value) where the value is None if the influence isn't on the vertex.
+        """
+        if vert_indexes is None:
+            vert_indexes = range(len(self))
+
+        offsets = self._offsets
+        all_inf_ids = self._inf_ids
+        all_weights = self._weights
+        inf_id = self._inf_lookup.get(inf_name)
+
+        for vert_index in vert_indexes:
+            weights = self._edits.get(vert_index)
+
+            if weights is not None:
+                yield vert_index, weights.get(inf_name)
+            elif inf_id is None:
+                self._check_vert_index(vert_index)
+                yield vert_index, None
+            else:
+                self._check_vert_index(vert_index)
+                start = offsets[vert_index]
+                end = offsets[vert_index + 1]
+                row_inf_ids = all_inf_ids[start:end]
+
+                if inf_id in row_inf_ids:
+                    yield vert_index, all_weights[start + row_inf_ids.index(inf_id)]
+                else:
+                    yield vert_index, None
+
+    def get_inf_vertexes(self, inf_names):
+        """
+        Returns:
+            A list of vertex indexes that have weights from any of the influences.
+        """
+        inf_names = set(inf_names)
+        inf_ids = set(
+            self._inf_lookup[inf_name]
+            for inf_name in inf_names
+            if inf_name in self._inf_lookup
+        )
+
+        vert_indexes = []
+
+        for vert_index in range(len(self)):
+            weights = self._edits.get(vert_index)
+
+            if weights is not None:
+                is_effected = not inf_names.isdisjoint(weights)
+            else:
+                start = self._offsets[vert_index]
+                end = self._offsets[vert_index + 1]
+                is_effected = not inf_ids.isdisjoint(self._inf_ids[start:end])
+
+            if is_effected:
+                vert_indexes.append(vert_index)
+
+        return vert_indexes
+
+    @staticmethod
+    def _apply_weight_operation(old_value, input_value, weight_operation):
         if weight_operation == WeightOperation.Absolute:
-            return old_value, input_value
+            return input_value
         elif weight_operation == WeightOperation.Relative:
-            return old_value, utils.clamp(0.0, 1.0, old_value + input_value)
+            return clamp(0.0, 1.0, old_value + input_value)
         elif weight_operation == WeightOperation.Percentage:
-            return old_value, utils.clamp(0.0, 1.0, old_value * input_value)
+            return clamp(0.0, 1.0, old_value * input_value)
         else:
             raise NotImplementedError("Weight operation hasn't been implemented")
 
-    def update_weight_value(self, vert_index, inf_name, new_value):
-        """
-        Updates weight_data with an influence's value while distributing the difference
-        to the rest of its influences. The sum should always be 1.0.
+    def calculate_new_value(self, input_value, vert_index, inf, weight_operation):
+        old_value = self.get_weight(vert_index, inf) or 0.0
+        return old_value, self._apply_weight_operation(old_value, input_value, weight_operation)
 
-        Args:
-            vert_index(int)
-            inf_name(string): Influence to update.
-            new_value(float): A number between 0 and 1.0.
+    @staticmethod
+    def _distribute_weight(weight_data, inf_name, new_value, locks):
         """
-        if new_value < 0 or new_value > 1:
-            raise ValueError("Value needs to be within 0.0 to 1.0.")
+        Sets an influence's value on a vertex's weights in place while distributing the difference
+        to the rest of its influences.
 
+        Returns:
+            False if the influence is locked and nothing was changed.
+        """
         # Ignore if trying to set to a locked influence
-        is_inf_locked = cmds.getAttr("{0}.lockInfluenceWeights".format(inf_name))
-        if is_inf_locked:
-            return
-
-        weight_data = self.data[vert_index]["weights"]
+        if locks.is_locked(inf_name):
+            return False
 
         # Add in influence with 0 weight if it's not already in
         if inf_name not in weight_data:
             weight_data[inf_name] = 0
 
         # Get total of all unlocked weights
+        unlocked = [
+            inf
+            for inf in weight_data
+            if not locks.is_locked(inf)
+        ]
+
         total = 0
-        unlock_count = 0
-        for inf in weight_data:
-            is_locked = cmds.getAttr("{0}.lockInfluenceWeights".format(inf))
-            if not is_locked:
-                total += weight_data[inf]
-                unlock_count += 1
-
-        if unlock_count > 1:
+        for inf in unlocked:
+            total += weight_data[inf]
+
+        if len(unlocked) > 1:
             # New value must not exceed total
             new_value = min(new_value, total)
 
             # Distribute weights
             dif = (total - new_value) / (total - weight_data[inf_name])
 
-            for inf in weight_data:
-                is_locked = cmds.getAttr("{0}.lockInfluenceWeights".format(inf))
-                if is_locked:
-                    continue
-
+            for inf in unlocked:
                 if inf == inf_name:
                     weight_data[inf] = new_value
                 else:
                     weight_data[inf] *= dif
 
         for key in list(weight_data.keys()):
-            if utils.is_close(0.0, weight_data[key]):
+            if is_close(0.0, weight_data[key]):
                 weight_data.pop(key)
 
         # Force weight to be 1 if there's only one influence left
         if len(weight_data) == 1:
             key = list(weight_data.keys())[0]
             weight_data[key] = 1.0
+
+        return True
+
+    def _get_batch_locks(self, vert_indexes, inf_names, locks):
+        if locks is not None:
+            return locks
+
+        batch_infs = set(inf_names)
+        for vert_index in set(vert_indexes):
+            batch_infs.update(self.get_vertex_infs(vert_index))
+
+        return InfLocks(sorted(batch_infs))
+
+    def update_weight_value(self, vert_index, inf_name, new_value, locks=None):
+        """
+        Updates weight_data with an influence's value while distributing the difference
+        to the rest of its influences. The sum should always be 1.0.
+
+        Args:
+            vert_index(int)
+            inf_name(string): Influence to update.
+            new_value(float): A number between 0 and 1.0.
+            locks(InfLocks): Cached lock states to check against.
+                             If None then the vertex's influences are queried from the scene.
+        """
+        if new_value < 0 or new_value > 1:
+            raise ValueError("Value needs to be within 0.0 to 1.0.")
+
+        weight_data = self.get_vertex_weights(vert_index)
+
+        if locks is None:
+            locks = InfLocks(list(weight_data) + [inf_name])
+
+        if self._distribute_weight(weight_data, inf_name, new_value, locks):
+            self.set_vertex_weights(vert_index, weight_data)
+
+    @tracer.traced()
+    def update_weight_values(self, vert_indexes, inf_names, new_values, locks=None):
+        """
+        Batch version of update_weight_value() that gives the same results as calling it on each cell in order.
+        Each vertex's row is only fetched and set once no matter how many of its cells are edited.
+
+        Args:
+            vert_indexes(int[]): Vertex of each cell.
+            inf_names(string[]): Influence of each cell.
+            new_values(float[]): Value of each cell, between 0 and 1.0.
+            locks(InfLocks): Cached lock states to check against.
+                             If None then the influences are queried from the scene once.
+
+        Returns:
+            A set of vertex indexes that changed.
+        """
+        for new_value in new_values:
+            if new_value < 0 or new_value > 1:
+                raise ValueError("Value needs to be within 0.0 to 1.0.")
+
+        locks = self._get_batch_locks(vert_indexes, inf_names, locks)
+
+        rows = {}
+        changed = set()
+
+        for vert_index, inf_name, new_value in zip(vert_indexes, inf_names, new_values):
+            weight_data = rows.get(vert_index)
+            if weight_data is None:
+                weight_data = rows[vert_index] = self.get_vertex_weights(vert_index)
+
+            if self._distribute_weight(weight_data, inf_name, new_value, locks):
+                changed.add(vert_index)
+
+        self._set_edited_rows({
+            vert_index: rows[vert_index]
+            for vert_index in changed
+        })
+
+        return changed
+
+    @tracer.traced()
+    def edit_weight_values(self, vert_indexes, inf_names, input_value, weight_operation, locks=None):
+        """
+        Runs a weight operation over many cells, giving the same results as calling
+        calculate_new_value() then update_weight_value() on each cell in order.
+        Cells whose value would barely change are skipped.
+
+        Args:
+            vert_indexes(int[]): Vertex of each cell.
+            inf_names(string[]): Influence of each cell.
+            input_value(float): Value to run the operation with.
+            weight_operation(enums.WeightOperation)
+            locks(InfLocks): Cached lock states to check against.
+                             If None then the influences are queried from the scene once.
+
+        Returns:
+            A set of vertex indexes that changed.
+        """
+        locks = self._get_batch_locks(vert_indexes, inf_names, locks)
+
+        rows = {}
+        changed = set()
+
+        for vert_index, inf_name in zip(vert_indexes, inf_names):
+            weight_data = rows.get(vert_index)
+            if weight_data is None:
+                weight_data = rows[vert_index] = self.get_vertex_weights(vert_index)
+
+            old_value = weight_data.get(inf_name) or 0.0
+            new_value = self._apply_weight_operation(old_value, input_value, weight_operation)
+            if is_close(old_value, new_value):
+                continue
+
+            if new_value < 0 or new_value > 1:
+                raise ValueError("Value needs to be within 0.0 to 1.0.")
+
+            if self._distribute_weight(weight_data, inf_name, new_value, locks):
+                changed.add(vert_index)
+
+        self._set_edited_rows({
+            vert_index: rows[vert_index]
+            for vert_index in changed
+        })
+
+        return changed
@@ -0,0 +1,573 @@
+import sys
+import json
+import zlib
+import mmap
+import struct
+from array import array
+
+if sys.version_info < (3, 0):
+    import cPickle
+else:
+    import _pickle as cPickle
+
+try:
+    import lzma
+except ImportError:
+    lzma = None
+
+from weights_editor_tool import constants
+from weights_editor_tool.enums import SkinCompression
+from weights_editor_tool.classes.point_grid import PointGrid
+from weights_editor_tool.classes.skin_data import SkinData
+
+
+class SkinFile:
+    """
+    Reads and writes .skin files.
+
+    Version 2 files are a small header followed by contiguous arrays, laid out like SkinData's rows:
+        magic, version, metadata size, metadata as json, then each array padded to 8 bytes.
+
+    The metadata holds the object's info, influences and skinCluster settings,
+    along with the influence names and where each array starts in the file.
+    Arrays are stored little-endian and read straight out of a memory-mapped file,
+    so each one is only unpacked once it's needed.
+
+    Rows of some vertexes can be read on their own, so importing onto a selection doesn't need the whole file.
+    Version 1 files are a pickled dictionary and are loaded whole.
+
+    Arrays can be compressed with any of the SkinCompression codecs, which is saved in the metadata.
+    Compressed arrays have to be decompressed whole, so reading a few rows is only cheap without compression.
+
+    Args:
+        file_path(string): An absolute path to a .skin file.
+    """
+
+    Magic = b"WESKIN"
+    Version = int(constants.EXPORT_VERSION)
+    HeaderFormat = "<6sHI"
+
+    # {name: typecode}
+    ArrayTypes = {
+        "offsets": "i",
+        "inf_ids": "i",
+        "weights": "d",
+        "dq": "d",
+        "world_pos": "d",
+        "triangles": "i"
+    }
+
+    Alignment = 8
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.version = None
+        self.metadata = {}
+        self.inf_names = []
+
+        self._file = None
+        self._mmap = None
+        self._arrays = {}  # {name: array}
+        self._legacy_data = None
+
+        self._open()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @classmethod
+    def is_v2(cls, file_path):
+        with open(file_path, "rb") as f:
+            return f.read(len(cls.Magic)) == cls.Magic
+
+    def _open(self):
+        if not self.is_v2(self.file_path):
+            with open(self.file_path, "rb") as f:
+                self._legacy_data = cPickle.loads(f.read())
+
+            self.version = self._legacy_data.get("version", 1)
+            return
+
+        self._file = open(self.file_path, "rb")
+
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+            header_size = struct.calcsize(self.HeaderFormat)
+            magic, self.version, metadata_size = struct.unpack(self.HeaderFormat, self._mmap[:header_size])
+
+            if self.version > self.Version:
+                raise RuntimeError("This skin file was saved with a newer version ({0}) of the tool.".format(self.version))
+
+            self.metadata = json.loads(self._mmap[header_size:header_size + metadata_size].decode("utf-8"))
+            self.inf_names = self.metadata["inf_names"]
+        except Exception:
+            self.close()
+            raise
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def get_vert_count(self):
+        if self._legacy_data is not None:
+            return len(self._legacy_data["verts"])
+        return self.metadata["vert_count"]
+
+    def get_array(self, name):
+        """
+        Unpacks one of the file's arrays and caches it.
+
+        Returns:
+            An array, which is empty if the file doesn't have it.
+        """
+        values = self._arrays.get(name)
+        if values is not None:
+            return values
+
+        typecode = self.ArrayTypes[name]
+        values = array(typecode)
+
+        layout = self.metadata["arrays"].get(name)
+        if layout is not None:
+            start, count = layout[:2]
+            size = layout[2] if len(layout) > 2 else count * values.itemsize
+            data = self._mmap[start:start + size]
+            self._frombytes(values, self.decode(self.get_codec(), data, values.itemsize))
+
+        self._arrays[name] = values
+        return values
+
+    def get_codec(self):
+        return self.metadata.get("codec", SkinCompression.Uncompressed)
+
+    @staticmethod
+    def _frombytes(values, data):
+        if sys.version_info < (3, 0):
+            values.fromstring(data)
+        else:
+            values.frombytes(data)
+
+        if sys.byteorder != "little":
+            values.byteswap()
+
+    def _read_values(self, name, start, count):
+        """
+        Unpacks a run of values from one of the file's arrays without unpacking the rest of it.
+        """
+        values = self._arrays.get(name)
+        if values is None and self.get_codec() != SkinCompression.Uncompressed:
+            values = self.get_array(name)
+
+        if values is not None:
+            return values[start:start + count].tolist()
+
+        values = array(self.ArrayTypes[name])
+        layout = self.metadata["arrays"].get(name)
+
+        if layout is not None and count:
+            position = layout[0] + start * values.itemsize
+            self._frombytes(values, self._mmap[position:position + count * values.itemsize])
+
+        return values.tolist()
+
+    def _read_rows(self, vert_indexes):
+        """
+        Reads only the rows of some vertexes straight from the mapped file.
+
+        Returns:
+            {vert_index: {"weights": {inf_name: weight_value...}, "dq": float, "world_pos": float[]}}
+        """
+        inf_names = self.inf_names
+        has_world_pos = bool(self.metadata["arrays"].get("world_pos", [0, 0, 0])[1])
+        verts = {}
+
+        for vert_index in vert_indexes:
+            start, end = self._read_values("offsets", vert_index, 2)
+            inf_ids = self._read_values("inf_ids", start, end - start)
+            weights = self._read_values("weights", start, end - start)
+
+            vert_data = {
+                "weights": {
+                    inf_names[inf_id]: weight_value
+                    for inf_id, weight_value in zip(inf_ids, weights)
+                },
+                "dq": self._read_values("dq", vert_index, 1)[0]
+            }
+
+            if has_world_pos:
+                vert_data["world_pos"] = self._read_values("world_pos", vert_index * 3, 3)
+
+            verts[vert_index] = vert_data
+
+        return verts
+
+    def _read_all_rows(self):
+        # Lists are quicker to slice and index than arrays when building every row.
+        offsets = self.get_array("offsets").tolist()
+        inf_names = [self.inf_names[inf_id] for inf_id in self.get_array("inf_ids")]
+        weights = self.get_array("weights").tolist()
+        dq = self.get_array("dq").tolist()
+        world_pos = self.get_array("world_pos").tolist()
+
+        verts = {}
+
+        for vert_index in range(self.get_vert_count()):
+            start = offsets[vert_index]
+            end = offsets[vert_index + 1]
+
+            vert_data = {
+                "weights": dict(zip(inf_names[start:end], weights[start:end])),
+                "dq": dq[vert_index]
+            }
+
+            if world_pos:
+                vert_data["world_pos"] = world_pos[vert_index * 3:vert_index * 3 + 3]
+
+            verts[vert_index] = vert_data
+
+        return verts
+
+    def to_dict(self, vert_indexes=None):
+        """
+        Args:
+            vert_indexes(int[]): Only reads these vertexes. Leave as None to read all of them.
+
+        Returns:
+            The file in the same layout as SkinnedObj.serialize().
+        """
+        if self._legacy_data is not None:
+            if vert_indexes is None:
+                return self._legacy_data
+
+            data = dict(self._legacy_data)
+            data["verts"] = {
+                vert_index: self._legacy_data["verts"][vert_index]
+                for vert_index in vert_indexes
+                if vert_index in self._legacy_data["verts"]
+            }
+            return data
+
+        if vert_indexes is None:
+            verts = self._read_all_rows()
+        else:
+            vert_count = self.get_vert_count()
+            verts = self._read_rows(sorted(set(
+                vert_index
+                for vert_index in vert_indexes
+                if 0 <= vert_index < vert_count
+            )))
+
+        return {
+            "version": self.version,
+            "object": self.metadata["object"],
+            "verts": verts,
+            "triangles": self.get_array("triangles").tolist(),
+            "influences": {
+                int(inf_id): inf_data
+                for inf_id, inf_data in self.metadata["influences"].items()
+            },
+            "skin_cluster": self.metadata["skin_cluster"]
+        }
+
+    def to_skin_data(self):
+        """
+        Reads every vertex's weights straight into SkinData without building a dictionary per vertex.
+        The file's arrays are handed over as they are, so they aren't cached here afterwards.
+
+        Returns:
+            A new SkinData.
+        """
+        if self._legacy_data is not None:
+            return SkinData.from_dict({
+                int(vert_index): vert_data
+                for vert_index, vert_data in self._legacy_data["verts"].items()
+            })
+
+        skin_data = SkinData(
+            self.inf_names,
+            self.get_array("offsets"),
+            self.get_array("inf_ids"),
+            self.get_array("weights"),
+            self.get_array("dq"))
+
+        for name in ["offsets", "inf_ids", "weights", "dq"]:
+            self._arrays.pop(name, None)
+
+        return skin_data
+
+    def get_world_positions(self):
+        """
+        Returns:
+            A flat array of every vertex's x, y, z position.
+        """
+        if self._legacy_data is None:
+            return self.get_array("world_pos")
+
+        verts = self._legacy_data["verts"]
+        world_pos = array(self.ArrayTypes["world_pos"])
+        for vert_index in sorted(verts):
+            world_pos.extend(verts[vert_index]["world_pos"])
+        return world_pos
+
+    def get_indexes_near(self, points, points_per_cell=PointGrid.DefaultPointsPerCell):
+        """
+        Collects only the file's vertexes in the grid cells around some points, without reading any rows.
+        Cells grow around any point whose closest vertex might still be outside of them.
+
+        Args:
+            points(float[][]): A list of (x, y, z) positions.
+            points_per_cell(int): Roughly how many of the file's vertexes each cell should hold.
+
+        Returns:
+            A sorted list of vertex indexes that holds the closest one to every point.
+        """
+        world_pos = self.get_world_positions()
+        vert_count = len(world_pos) // 3
+
+        if not points or not vert_count:
+            return []
+
+        axes = [world_pos[axis::3] for axis in range(3)]
+        file_min = [min(values) for values in axes]
+        file_max = [max(values) for values in axes]
+        extents = [file_max[axis] - file_min[axis] for axis in range(3)]
+
+        cell_size = PointGrid.get_cell_size(extents, vert_count, points_per_cell)
+        max_radius = int(max(extents) / cell_size) + 1
+
+        def get_cell(point):
+            return tuple(
+                int((point[axis] - file_min[axis]) // cell_size)
+                for axis in range(3)
+            )
+
+        found = set()
+        remaining = list(points)
+        radius = 1
+
+        while remaining:
+            if radius >= max_radius:
+                return list(range(vert_count))
+
+            cells = set()
+            for point in remaining:
+                cx, cy, cz = get_cell(point)
+                for x in range(cx - radius, cx + radius + 1):
+                    for y in range(cy - radius, cy + radius + 1):
+                        for z in range(cz - radius, cz + radius + 1):
+                            cells.add((x, y, z))
+
+            min_x, min_y, min_z = file_min
+            indexes = [
+                vert_index
+                for vert_index, x, y, z in zip(range(vert_count), axes[0], axes[1], axes[2])
+                if (int((x - min_x) // cell_size), int((y - min_y) // cell_size), int((z - min_z) // cell_size)) in cells
+            ]
+
+            # A vertex past `radius` cells is farther than `radius` cell sizes away.
+            point_grid = PointGrid([world_pos[i * 3:i * 3 + 3] for i in indexes])
+            reach = radius * cell_size
+            missed = []
+
+            for point in remaining:
+                closest = point_grid.closest_points(point)
+                if closest and closest[0][1] <= reach:
+                    found.add(indexes[closest[0][0]])
+                else:
+                    missed.append(point)
+
+            remaining = missed
+            radius *= 2
+
+        return sorted(found)
+
+    @classmethod
+    def load(cls, file_path):
+        """
+        Reads a v1 or v2 file.
+
+        Returns:
+            The file in the same layout as SkinnedObj.serialize().
+        """
+        with cls(file_path) as skin_file:
+            return skin_file.to_dict()
+
+    @classmethod
+    def _pack(cls, data):
+        """
+        Splits serialized data into the metadata and arrays.
+        """
+        verts = data["verts"]
+        vert_indexes = sorted(verts)
+        if vert_indexes != list(range(len(vert_indexes))):
+            raise RuntimeError("Vertexes need to be numbered from 0 without gaps to be saved.")
+
+        inf_names = []
+        inf_lookup = {}
+
+        arrays = {
+            name: array(typecode)
+            for name, typecode in cls.ArrayTypes.items()
+        }
+        arrays["offsets"].append(0)
+
+        for vert_index in vert_indexes:
+            vert_data = verts[vert_index]
+
+            for inf_name, weight_value in vert_data["weights"].items():
+                inf_id = inf_lookup.get(inf_name)
+                if inf_id is None:
+                    inf_id = inf_lookup[inf_name] = len(inf_names)
+                    inf_names.append(inf_name)
+
+                arrays["inf_ids"].append(inf_id)
+                arrays["weights"].append(weight_value)
+
+            arrays["offsets"].append(len(arrays["inf_ids"]))
+            arrays["dq"].append(vert_data.get("dq") or 0.0)
+
+            if "world_pos" in vert_data:
+                arrays["world_pos"].extend(vert_data["world_pos"])
+
+        arrays["triangles"].extend(data.get("triangles") or [])
+
+        metadata = {
+            "object": data["object"],
+            "vert_count": len(vert_indexes),
+            "inf_names": inf_names,
+            "influences": {
+                str(inf_id): inf_data
+                for inf_id, inf_data in data["influences"].items()
+            },
+            "skin_cluster": data["skin_cluster"]
+        }
+
+        return metadata, arrays
+
+    @staticmethod
+    def _shuffle(data, itemsize):
+        """
+        Groups the nth byte of every value together, which lines up the similar exponent bytes of floats.
+        """
+        return b"".join(data[i::itemsize] for i in range(itemsize))
+
+    @staticmethod
+    def _unshuffle(data, itemsize):
+        count = len(data) // itemsize
+        result = bytearray(len(data))
+
+        for i in range(itemsize):
+            result[i::itemsize] = data[i * count:(i + 1) * count]
+
+        return bytes(result)
+
+    @staticmethod
+    def is_codec_available(codec):
+        """
+        Returns:
+            False if this version of Python can't use the compression, like lzma in Python 2.
+        """
+        if codec == SkinCompression.Lzma:
+            return lzma is not None
+        return True
+
+    @classmethod
+    def encode(cls, codec, data, itemsize):
+        """
+        Compresses an array's bytes.
+
+        Args:
+            codec(string): A SkinCompression value.
+            data(bytes)
+            itemsize(int): Byte size of each of the array's values.
+        """
+        if codec == SkinCompression.Uncompressed:
+            return data
+        elif codec == SkinCompression.Zlib:
+            return zlib.compress(data, 6)
+        elif codec == SkinCompression.Lzma:
+            if lzma is None:
+                raise RuntimeError("lzma compression isn't available in this version of Python.")
+            return lzma.compress(data)
+        elif codec == SkinCompression.ShuffleZlib:
+            return zlib.compress(cls._shuffle(data, itemsize), 6)
+        else:
+            raise NotImplementedError("Unknown compression `{0}`".format(codec))
+
+    @classmethod
+    def decode(cls, codec, data, itemsize):
+        """
+        Reverses encode().
+        """
+        if codec == SkinCompression.Uncompressed:
+            return data
+        elif codec == SkinCompression.Zlib:
+            return zlib.decompress(data)
+        elif codec == SkinCompression.Lzma:
+            if lzma is None:
+                raise RuntimeError("This skin file uses lzma compression, which isn't available in this version of Python.")
+            return lzma.decompress(data)
+        elif codec == SkinCompression.ShuffleZlib:
+            return cls._unshuffle(zlib.decompress(data), itemsize)
+        else:
+            raise NotImplementedError("Unknown compression `{0}`".format(codec))
+
+    @classmethod
+    def save(cls, file_path, data, codec=SkinCompression.Uncompressed):
+        """
+        Writes a v2 file.
+
+        Args:
+            file_path(string): An absolute path to write to.
+            data(dict): Data from SkinnedObj.serialize().
+            codec(string): A SkinCompression value to compress the arrays with.
+        """
+        metadata, arrays = cls._pack(data)
+        names = sorted(arrays)
+
+        encoded = {}
+        for name in names:
+            values = arrays[name]
+            if sys.byteorder != "little":
+                values.byteswap()
+
+            raw = values.tostring() if sys.version_info < (3, 0) else values.tobytes()
+            encoded[name] = cls.encode(codec, raw, values.itemsize)
+
+        metadata["codec"] = codec
+
+        # Array positions depend on the metadata's size, which depends on the positions,
+        # so reserve enough digits for them before laying the arrays out.
+        header_size = struct.calcsize(cls.HeaderFormat)
+        metadata["arrays"] = {name: [10 ** 15, len(arrays[name]), len(encoded[name])] for name in names}
+        reserved_size = len(json.dumps(metadata).encode("utf-8"))
+
+        position = cls._align(header_size + reserved_size)
+        for name in names:
+            metadata["arrays"][name] = [position, len(arrays[name]), len(encoded[name])]
+            position = cls._align(position + len(encoded[name]))
+
+        metadata_bytes = json.dumps(metadata).encode("utf-8")
+        metadata_bytes += b" " * (reserved_size - len(metadata_bytes))
+
+        with open(file_path, "wb") as f:
+            f.write(struct.pack(cls.HeaderFormat, cls.Magic, cls.Version, len(metadata_bytes)))
+            f.write(metadata_bytes)
+
+            for name in names:
+                start = metadata["arrays"][name][0]
+                f.write(b"\0" * (start - f.tell()))
+                f.write(encoded[name])
+
+    @classmethod
+    def _align(cls, position):
+        return (position + cls.Alignment - 1) // cls.Alignment * cls.Alignment
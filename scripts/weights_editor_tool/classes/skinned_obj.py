@@ -1,14 +1,12 @@
-import sys
 import os
+import json
+import time
+import hashlib
 import random
 import glob
+from array import array
 
-if sys.version_info < (3, 0):
-    import cPickle
-else:
-    import _pickle as cPickle
-
-from maya import cmds
+from weights_editor_tool.weights_editor_utils import cmds
 from maya import OpenMaya
 from maya.api import OpenMaya as om2
 
@@ -16,15 +14,28 @@ from PySide2 import QtGui
 from PySide2 import QtWidgets
 
 from weights_editor_tool import constants
-from weights_editor_tool.enums import ColorTheme
+from weights_editor_tool.enums import ColorTheme, SkinCompression
+from weights_editor_tool.math_utils import get_influence_colors, get_multi_influence_colors
 from weights_editor_tool import weights_editor_utils as utils
 from weights_editor_tool.widgets import status_progress_bar
 from weights_editor_tool.classes.skin_data import SkinData
+from weights_editor_tool.classes.skin_file import SkinFile
+from weights_editor_tool.classes.export_pipeline import ExportPipeline
+from weights_editor_tool.classes.import_prefetcher import ImportPrefetcher
+from weights_editor_tool.classes.inf_locks import InfLocks
+from weights_editor_tool.classes.mesh_adjacency import AdjacencyCache
+from weights_editor_tool.classes.point_grid import PointGrid
+from weights_editor_tool.classes.maya_skin_backend import MayaSkinBackend
+from weights_editor_tool.classes.tracer import tracer
 
 
 class SkinnedObj:
 
     last_browsing_path = None
+    apply_chunk_size = 10000
+
+    # Keeps the hash of each skin that `Export all` wrote, so unchanged skins can be skipped next time.
+    export_cache_name = "skin_export_cache.json"
 
     def __init__(self, obj):
         self.name = obj
@@ -33,6 +44,10 @@ class SkinnedObj:
         self.vert_count = 0
         self.infs = []
         self.inf_colors = {}
+        self.inf_locks = InfLocks()
+        self._sync_inf_locks = False
+        self._adjacency_cache = AdjacencyCache(obj)
+        self.backend = MayaSkinBackend(self)
 
         if self.is_valid():
             self.vert_count = utils.get_vert_count(self.name)
@@ -71,9 +86,29 @@ class SkinnedObj:
             return picked_path[0]
 
     @staticmethod
-    def _find_influence_by_name(long_name):
+    def get_influence_lookup():
+        """
+        Collects every transform in the scene with one query, so a batch import can match influences without
+        running cmds.ls() for each name.
+
+        Returns:
+            {short_name: [unique_name...]}
+        """
+        inf_lookup = {}
+
+        for obj in cmds.ls(type="transform"):
+            inf_lookup.setdefault(obj.split("|")[-1], []).append(obj)
+
+        return inf_lookup
+
+    @staticmethod
+    def _find_influence_by_name(long_name, inf_lookup=None):
         short_name = long_name.split("|")[-1]
-        objs = cmds.ls(short_name)
+
+        if inf_lookup is None:
+            objs = cmds.ls(short_name)
+        else:
+            objs = inf_lookup.get(short_name)
 
         if objs:
             if long_name in objs:
@@ -107,57 +142,6 @@ class SkinnedObj:
         else:
             raise NotImplementedError("This object's type is not supported: {0}".format(self.name))
 
-    def _map_to_closest_vertexes(self, verts_data, vert_filter=[]):
-        weights_data = {}
-
-        file_points = [
-            om2.MPoint(*verts_data[index]["world_pos"])
-            for index in sorted(verts_data.keys())
-        ]
-
-        # Build a temporary new mesh from the file's positions so that it's exposed to the api.
-        temp_mfn_mesh = om2.MFnMesh()
-        temp_mfn_mesh.addPolygon(file_points, False, 0)
-        new_mesh = om2.MFnDagNode(temp_mfn_mesh.parent(0)).fullPathName()
-        file_mfn_mesh = self._to_mfn_mesh(new_mesh)
-
-        try:
-            mesh_points = self._get_world_points()
-
-            with status_progress_bar.StatusProgressBar("Finding closest points", len(mesh_points)) as pbar:
-                for vert_index, point in enumerate(mesh_points):
-                    try:
-                        # Skip calculations if index is not in the filter.
-                        if vert_filter and vert_index not in vert_filter:
-                            continue
-
-                        # Get the closest face.
-                        closest_point = file_mfn_mesh.getClosestPoint(point, om2.MSpace.kWorld)
-                        face_index = closest_point[1]
-
-                        # Get face's vertexes and get the closest vertex.
-                        face_vertexes = file_mfn_mesh.getPolygonVertices(face_index)
-
-                        vert_distances = [
-                            (index, file_points[index].distanceTo(closest_point[0]))
-                            for index in face_vertexes
-                        ]
-
-                        closest_index = min(vert_distances, key=lambda dist: dist[1])[0]
-                        weights_data[vert_index] = closest_index
-
-                        if pbar.was_cancelled():
-                            raise RuntimeError("User cancelled")
-                    finally:
-                        pbar.next()
-        finally:
-            if cmds.objExists(new_mesh):
-                cmds.undoInfo(stateWithoutFlush=False)
-                cmds.delete(new_mesh)
-                cmds.undoInfo(stateWithoutFlush=True)
-
-        return weights_data
-
     def is_valid(self):
         return self.name is not None and cmds.objExists(self.name)
 
@@ -167,6 +151,7 @@ class SkinnedObj:
     def short_name(self):
         return self.name.split("|")[-1]
 
+    @tracer.traced()
     def update_skin_data(self):
         self.skin_cluster = None
         self.skin_data = SkinData.create_empty()
@@ -178,6 +163,38 @@ class SkinnedObj:
                 self.skin_data = SkinData.get(self.skin_cluster)
                 self.collect_influence_colors()
                 self.infs = self.get_all_infs()
+                self.collect_inf_locks()
+
+    def collect_inf_locks(self):
+        """
+        Re-collects the lock states of the current influences.
+        They're kept in sync with the scene if add_callbacks() was called.
+        """
+        self.inf_locks.collect(self.infs)
+
+        if self._sync_inf_locks:
+            self.inf_locks.add_callbacks()
+
+    def add_callbacks(self):
+        """
+        Keeps the lock states in sync with the scene until remove_callbacks() is called.
+        Only the object that the tool is working on needs this, so other instances don't leave callbacks behind.
+        """
+        self._sync_inf_locks = True
+        self.inf_locks.add_callbacks()
+
+    def remove_callbacks(self):
+        self._sync_inf_locks = False
+        self.inf_locks.remove_callbacks()
+        self._adjacency_cache.remove_callback()
+
+    @tracer.traced()
+    def get_adjacency(self):
+        """
+        Returns:
+            The object's MeshAdjacency, which is built once and rebuilt after topology changes.
+        """
+        return self._adjacency_cache.get()
 
     def is_skin_corrupt(self):
         """
@@ -201,62 +218,129 @@ class SkinnedObj:
         Args:
             infs(string[]): List of influences to select from.
         """
-        infs_set = set(infs)
-        effected_verts = set()
-
-        for vert_index in self.skin_data:
-            vert_infs = self.skin_data[vert_index]["weights"].keys()
+        if utils.is_curve(self.name):
+            component = "cv"
+        else:
+            component = "vtx"
 
-            is_effected = infs_set.intersection(vert_infs)
-            if is_effected:
-                if utils.is_curve(self.name):
-                    effected_verts.add("{0}.cv[{1}]".format(self.name, vert_index))
-                else:
-                    effected_verts.add("{0}.vtx[{1}]".format(self.name, vert_index))
+        effected_verts = [
+            "{0}.{1}[{2}]".format(self.name, component, vert_index)
+            for vert_index in self.skin_data.get_inf_vertexes(infs)
+        ]
 
-        cmds.select(list(effected_verts))
+        cmds.select(effected_verts)
 
-    def flood_weights_to_closest(self):
+    @staticmethod
+    def _get_bone_segments(infs, use_bone_segments):
         """
-        Each vertex will be assigned a full weight to its closest joint.
+        Collects a segment for each influence to measure distances against.
+        Influences without child joints, or all of them if use_bone_segments is off, get a segment with no length.
+
+        Returns:
+            A list of (inf_name, start_pos, end_pos).
         """
-        influences = self.get_influence_ids()
+        segments = []
 
-        inf_positions = {
-            key: cmds.xform(inf, q=True, ws=True, t=True)
-            for key, inf in influences.items()
-        }
+        for inf in infs:
+            start_pos = tuple(cmds.xform(inf, q=True, ws=True, t=True))
 
-        verts = cmds.ls("{}.vtx[*]".format(self.name), flatten=True)
+            children = []
+            if use_bone_segments:
+                children = cmds.listRelatives(inf, children=True, type="joint", fullPath=True) or []
 
-        vert_inf_mappings = {}
+            if children:
+                for child in children:
+                    segments.append((inf, start_pos, tuple(cmds.xform(child, q=True, ws=True, t=True))))
+            else:
+                segments.append((inf, start_pos, start_pos))
 
-        for vert_index, plug, in enumerate(verts):
-            vert_pos = cmds.pointPosition(plug, world=True)
-            vert_point = OpenMaya.MPoint(*vert_pos)
+        return segments
 
-            closest_inf_index = None
-            closest_inf_dist = 0
+    @staticmethod
+    def _get_closest_segments(points, segments):
+        """
+        Returns:
+            A list of the closest segment's index for each point.
+        """
+        # Cache what each distance check needs so the inner loop is only arithmetic.
+        segment_data = []
+
+        for start_pos, end_pos in segments:
+            direction = [end_pos[axis] - start_pos[axis] for axis in range(3)]
+            length_sq = sum(value * value for value in direction)
+            segment_data.append((start_pos[0], start_pos[1], start_pos[2],
+                                 direction[0], direction[1], direction[2], length_sq))
+
+        closest = []
+
+        for point in points:
+            px, py, pz = point[0], point[1], point[2]
+            closest_index = 0
+            closest_dist = None
+
+            for index, (sx, sy, sz, dx, dy, dz, length_sq) in enumerate(segment_data):
+                vx = px - sx
+                vy = py - sy
+                vz = pz - sz
+
+                if length_sq:
+                    # Project onto the segment, clamped to its ends.
+                    t = (vx * dx + vy * dy + vz * dz) / length_sq
+                    if t > 1.0:
+                        t = 1.0
+                    elif t < 0.0:
+                        t = 0.0
+                    vx -= dx * t
+                    vy -= dy * t
+                    vz -= dz * t
+
+                dist = vx * vx + vy * vy + vz * vz
+                if closest_dist is None or dist < closest_dist:
+                    closest_index = index
+                    closest_dist = dist
+
+            closest.append(closest_index)
+
+        return closest
+
+    @tracer.traced()
+    def flood_weights_to_closest(self, use_bone_segments=False):
+        """
+        Each vertex will be assigned a full weight to its closest joint.
 
-            for inf_index in inf_positions:
-                inf_point = OpenMaya.MPoint(*inf_positions[inf_index])
-                dist = vert_point.distanceTo(inf_point)
-                if closest_inf_index is None or dist < closest_inf_dist:
-                    closest_inf_index = inf_index
-                    closest_inf_dist = dist
+        Args:
+            use_bone_segments(bool): Measures distances to the bones between joints and their children instead of to joint pivots.
+        """
+        infs = self.get_all_infs()
+        if not infs:
+            return
 
-            vert_inf_mappings[vert_index] = closest_inf_index
+        segments = self._get_bone_segments(infs, use_bone_segments)
+        mesh_points = self._get_world_points()
 
-        cmds.setAttr("{0}.nw".format(self.skin_cluster), 0)
-        cmds.skinPercent(self.skin_cluster, verts, prw=100, nrm=0)
+        if use_bone_segments:
+            closest_segments = self._get_closest_segments(
+                mesh_points,
+                [(start_pos, end_pos) for inf, start_pos, end_pos in segments])
+        else:
+            # Every segment is a pivot, so a grid can skip most of them.
+            point_grid = PointGrid([start_pos for inf, start_pos, end_pos in segments])
+            closest_segments = [
+                point_grid.closest_point(point)
+                for point in mesh_points
+            ]
 
-        for vert_index, inf_index in vert_inf_mappings.items():
-            weight_plug = "{0}.weightList[{1}].weights[{2}]".format(self.skin_cluster, vert_index, inf_index)
-            cmds.setAttr(weight_plug, 1)
+        self.skin_data = SkinData.from_dict({
+            vert_index: {
+                "weights": {segments[segment_index][0]: 1.0},
+                "dq": self.skin_data.get_vertex_dq(vert_index)
+            }
+            for vert_index, segment_index in enumerate(closest_segments)
+        })
 
-        cmds.setAttr("{0}.nw".format(self.skin_cluster), 1)
-        cmds.skinCluster(self.skin_cluster, e=True, forceNormalizeWeights=True)
+        self.apply_current_skin_weights(list(range(len(mesh_points))), display_progress=True)
 
+    @tracer.traced()
     def prune_weights(self, value):
         """
         Runs prune weights on selected vertexes on supplied object.
@@ -276,32 +360,52 @@ class SkinnedObj:
 
         return True
 
+    @tracer.traced()
     def prune_max_infs(self, max_inf_count, vert_filter=[]):
         if not vert_filter:
             OpenMaya.MGlobal.displayError("No vertexes are selected.")
             return False
 
-        for vert_index in self.skin_data:
-            if vert_filter and vert_index not in vert_filter:
-                continue
+        self.backend.prune_max_infs(max_inf_count, vert_filter)
 
-            sorted_infs = [
-                inf for inf, value in sorted(self.skin_data[vert_index]["weights"].items(), key=lambda item: item[1])]
+        return True
 
-            for inf in sorted_infs:
-                infs_count = len(self.skin_data[vert_index]["weights"])
-                if infs_count <= max_inf_count:
-                    break
+    @staticmethod
+    def can_mirror_in_memory(surface_association, inf_association=None):
+        """
+        Checks if mirror_skin_weights() can mirror with these options without going through copySkinWeights.
+        """
+        return surface_association == "closestPoint" and inf_association in [None, "label", "name", "closestJoint"]
 
-                locked = cmds.getAttr("{0}.lockInfluenceWeights".format(inf))
-                if locked:
-                    continue
+    def get_mirror_targets(self, mirror_mode, mirror_inverse, vert_filter=[]):
+        """
+        Gets which vertexes an in-memory mirror would change.
 
-                self.skin_data.update_weight_value(vert_index, inf, 0)
+        Args:
+            mirror_mode(string): The mirror plane, either "XY", "YZ" or "XZ".
+            mirror_inverse(bool): False copies from the positive side to the negative side, True does the opposite.
+            vert_filter(int[]): Vertexes to limit to. Picking a vertex on the source side picks its mirror.
 
-        return True
+        Returns:
+            A sorted list of vertex indexes.
+        """
+        return self.backend.get_symmetry_map(mirror_mode).get_targets(mirror_inverse, vert_filter or None)
 
+    @tracer.traced()
     def mirror_skin_weights(self, mirror_mode, mirror_inverse, surface_association, inf_association=None, vert_filter=[]):
+        """
+        Mirrors weights across a plane.
+
+        With a closest point surface association, it runs on the skin data with a cached vertex symmetry map
+        and only writes the vertexes that receive weights. Other options go through copySkinWeights.
+
+        Returns:
+            True if the skin data was updated in memory, or False if it needs to be re-collected.
+        """
+        if self.can_mirror_in_memory(surface_association, inf_association):
+            self._mirror_skin_weights_in_memory(mirror_mode, mirror_inverse, inf_association, vert_filter)
+            return True
+
         objs = self.name
         if vert_filter:
             objs = [
@@ -319,6 +423,18 @@ class SkinnedObj:
             surfaceAssociation=surface_association,
             influenceAssociation=[inf_association, "closestJoint"])
 
+        return False
+
+    def _mirror_skin_weights_in_memory(self, mirror_mode, mirror_inverse, inf_association, vert_filter):
+        targets = self.get_mirror_targets(mirror_mode, mirror_inverse, vert_filter)
+        if not targets:
+            return
+
+        old_rows = self.skin_data.copy_vertexes(targets)
+        self.backend.mirror_weights(mirror_mode, mirror_inverse, inf_association, vert_filter)
+        self.apply_current_skin_weights(targets, old_rows=old_rows)
+
+    @tracer.traced()
     def display_influence(self, influence, color_style=ColorTheme.Max, vert_filter=[]):
         """
         Colors a mesh to visualize skin data.
@@ -328,52 +444,12 @@ class SkinnedObj:
             color_style(int): 0=Max theme, 1=Maya theme.
             vert_filter(int[]): List of vertex indexes to only operate on.
         """
-        if color_style == ColorTheme.Max:
-            # Max
-            low_rgb = [0, 0, 1]
-            mid_rgb = [0, 1, 0]
-            end_rgb = [1, 0, 0]
-            no_rgb = [0.05, 0.05, 0.05]
-            full_rgb = [1, 1, 1]
-        elif color_style == ColorTheme.Maya:
-            # Maya
-            low_rgb = [0.5, 0, 0]
-            mid_rgb = [1, 0.5, 0]
-            end_rgb = [1, 1, 0]
-            no_rgb = [0, 0, 0]
-            full_rgb = [1, 1, 1]
-        else:
-            low_rgb = [0, 0, 0]
-            mid_rgb = [0, 0, 0]
-            end_rgb = [0, 0, 0]
-            no_rgb = [0, 0, 0]
-            full_rgb = [0, 0, 0]
-
-        vert_colors = []
-        vert_indexes = []
-
-        for vert_index in self.skin_data:
-            if vert_filter and vert_index not in vert_filter:
-                continue
-
-            weights_data = self.skin_data[vert_index]["weights"]
-
-            if influence in weights_data:
-                weight_value = weights_data[influence]
-                rgb = utils.get_weight_color(
-                    weight_value,
-                    start_color=low_rgb,
-                    mid_color=mid_rgb,
-                    end_color=end_rgb,
-                    full_color=full_rgb)
-            else:
-                rgb = no_rgb
-
-            vert_colors.append(rgb)
-            vert_indexes.append(vert_index)
+        vert_colors, vert_indexes = get_influence_colors(
+            self.skin_data.iter_inf_weights(influence, vert_filter or None), color_style)
 
         utils.apply_vert_colors(self.name, vert_colors, vert_indexes)
 
+    @tracer.traced()
     def display_multi_color_influence(self, vert_filter=[]):
         """
         Mimics Softimage and displays all influences at once with their own unique color.
@@ -388,26 +464,12 @@ class SkinnedObj:
         if self.inf_colors is None:
             self.collect_influence_colors()
 
-        vert_colors = []
-        vert_indexes = []
-
-        for vert_index in self.skin_data:
-            if vert_filter and vert_index not in vert_filter:
-                continue
-
-            final_color = [0, 0, 0]
-
-            for inf, weight in self.skin_data[vert_index]["weights"].items():
-                inf_color = self.inf_colors.get(inf)
-                final_color[0] += inf_color[0] * weight
-                final_color[1] += inf_color[1] * weight
-                final_color[2] += inf_color[2] * weight
-
-            vert_colors.append(final_color)
-            vert_indexes.append(vert_index)
+        vert_colors, vert_indexes = get_multi_influence_colors(
+            self.skin_data.iter_vertex_weights(vert_filter or None), self.inf_colors)
 
         utils.apply_vert_colors(self.name, vert_colors, vert_indexes)
 
+    @tracer.traced()
     def display_max_influences(self, max_inf_count, vert_filter=[]):
         """
         Displays verts that are over the supplied maximum inflluence count.
@@ -422,11 +484,8 @@ class SkinnedObj:
         vert_colors = []
         vert_indexes = []
 
-        for vert_index in self.skin_data:
-            if vert_filter and vert_index not in vert_filter:
-                continue
-
-            inf_count = len(self.skin_data[vert_index]["weights"])
+        for vert_index in vert_filter or self.skin_data:
+            inf_count = self.skin_data.get_vertex_inf_count(vert_index)
 
             if inf_count > max_inf_count:  # Over the count.
                 final_color = [1, 0, 0]
@@ -438,68 +497,8 @@ class SkinnedObj:
 
         utils.apply_vert_colors(self.name, vert_colors, vert_indexes)
 
-    def average_by_neighbours(self, vert_index, strength):
-        """
-        Averages weights of surrounding vertexes.
-
-        Args:
-            vert_index(int)
-            strength(int): A value of 0-1
-
-        Returns:
-            A dictionary of the new weights. {int_name:weight_value...}
-        """
-        old_weights = self.skin_data[vert_index]["weights"]
-        new_weights = {}
-
-        # Collect unlocked infs and total value of unlocked weights
-        unlocked = []
-        total = 0.0
-
-        for inf in old_weights:
-            is_locked = cmds.getAttr("{0}.lockInfluenceWeights".format(inf))
-            if is_locked:
-                new_weights[inf] = old_weights[inf]
-            else:
-                unlocked.append(inf)
-                total += old_weights[inf]
-
-        # Need at least 2 unlocked influences to continue
-        if len(unlocked) < 2:
-            return old_weights
-
-        # Add together weight of each influence from neighbours
-        neighbours = utils.get_vert_neighbours(self.name, vert_index)
-
-        for index in neighbours:
-            for inf, value in self.skin_data[index]["weights"].items():
-                # Ignore if locked
-                if inf not in unlocked:
-                    continue
-
-                # Add weight
-                if inf not in new_weights:
-                    new_weights[inf] = 0.0
-
-                new_weights[inf] += value
-
-        # Get sum of all new weight values
-        total_all = sum([
-            new_weights[inf]
-            for inf in new_weights
-            if inf in unlocked
-        ])
-
-        # Average values
-        if total_all:
-            for inf in new_weights:
-                if inf in unlocked:
-                    new_weight = new_weights[inf] * (total / total_all)
-                    new_weights[inf] = old_weights[inf] + (new_weight - old_weights[inf]) * strength
-
-        return new_weights
-
-    def smooth_weights(self, vert_indexes, strength, normalize_weights=True):
+    @tracer.traced()
+    def smooth_weights(self, vert_indexes, strength, normalize_weights=True, iterations=1):
         """
         Runs an algorithm to smooth weights on supplied vertex indexes.
 
@@ -507,19 +506,11 @@ class SkinnedObj:
             vert_indexes(int[])
             strength(int): A value of 0-1
             normalize_weights(bool)
+            iterations(int): Number of smoothing passes.
         """
-        # Don't set new weights right away so new values don't interfere
-        # when calculating other indexes.
-        weights_to_set = {}
-        for vert_index in vert_indexes:
-            new_weights = self.average_by_neighbours(vert_index, strength)
-            weights_to_set[vert_index] = new_weights
-
-        # Set weights
-        for vert_index, weights in weights_to_set.items():
-            self.skin_data[vert_index]["weights"] = weights
-
-        self.apply_current_skin_weights(vert_indexes, normalize=normalize_weights)
+        old_rows = self.skin_data.copy_vertexes(vert_indexes)
+        self.backend.smooth_weights(vert_indexes, strength, iterations)
+        self.apply_current_skin_weights(vert_indexes, normalize=normalize_weights, old_rows=old_rows)
 
     def hide_vert_colors(self):
         if self.is_valid():
@@ -554,13 +545,14 @@ class SkinnedObj:
             cmds.rename(dif_color_sets[0], constants.COLOR_SET)
 
     def has_skin_data(self):
-        if self.skin_data is not None and self.skin_data.data:
+        if self.skin_data is not None and len(self.skin_data) > 0:
             return True
         return False
 
     def get_influence_ids(self):
         return utils.get_influence_ids(self.skin_cluster)
 
+    @tracer.traced()
     def collect_influence_colors(self, sat=250, brightness=150):
         """
         Generates a unique color for each influence.
@@ -590,7 +582,8 @@ class SkinnedObj:
 
         self.inf_colors = inf_colors
 
-    def apply_current_skin_weights(self, vert_indexes, normalize=False, display_progress=False):
+    @tracer.traced()
+    def apply_current_skin_weights(self, vert_indexes, normalize=False, display_progress=False, bulk=True, old_rows=None):
         """
         Sets skin weights with the supplied data.
 
@@ -598,6 +591,163 @@ class SkinnedObj:
             vert_indexes(int[]): List of vertex indexes to only operate on.
             normalize(bool): Forces weights to be normalized.
             display_progress(bool): Displays a progress bar if enabled.
+            bulk(bool): Writes chunks of vertexes through MFnSkinCluster.setWeights
+                        instead of setting one attribute at a time.
+            old_rows(dict): Rows from SkinData.copy_vertexes() that the skinCluster currently holds.
+                            If supplied, only the weights and dual-quaternions that differ are written.
+        """
+        cmds.setAttr("{0}.nw".format(self.skin_cluster), 0)
+
+        try:
+            if old_rows is not None:
+                changed_weights, changed_dq = SkinData.diff_vertexes(
+                    old_rows, self.skin_data.copy_vertexes(vert_indexes))
+
+                if bulk:
+                    self._set_changed_skin_weights_bulk(changed_weights, changed_dq)
+                else:
+                    self._set_changed_skin_weights_by_plugs(changed_weights, changed_dq)
+            elif bulk:
+                self._set_skin_weights_bulk(vert_indexes, display_progress)
+            else:
+                self._set_skin_weights_by_plugs(vert_indexes, display_progress)
+        finally:
+            # Re-enable weights normalizing
+            cmds.setAttr("{0}.nw".format(self.skin_cluster), 1)
+
+        if normalize:
+            cmds.skinCluster(self.skin_cluster, e=True, forceNormalizeWeights=True)
+
+    def _set_skin_weights_bulk(self, vert_indexes, display_progress):
+        """
+        Builds one component object and one flat weight array per chunk of vertexes,
+        then writes weights and dual-quaternions with a single api call each.
+        Every influence is written, so there's no need to prune the old weights first.
+        """
+        mfn_skin_cluster = utils.to_mfn_skin_cluster(self.skin_cluster)
+        shape_path = utils.get_skin_geometry_path(mfn_skin_cluster)
+
+        inf_indexes = {
+            inf_path.partialPathName(): i
+            for i, inf_path in enumerate(mfn_skin_cluster.influenceObjects())
+        }
+
+        inf_count = len(inf_indexes)
+        all_inf_indexes = om2.MIntArray(list(range(inf_count)))
+
+        # Components come back sorted, so keep rows in the same order.
+        vert_indexes = sorted(set(vert_indexes))
+
+        chunks = [
+            vert_indexes[i:i + self.apply_chunk_size]
+            for i in range(0, len(vert_indexes), self.apply_chunk_size)
+        ]
+
+        if display_progress and chunks:
+            pbar = status_progress_bar.StatusProgressBar("Setting skin weights", len(chunks))
+            pbar.start()
+
+        try:
+            for chunk in chunks:
+                values = array("d", [0.0]) * (len(chunk) * inf_count)
+                dq_values = array("d")
+
+                for row, (vert_index, weights) in enumerate(self.skin_data.iter_vertex_weights(chunk)):
+                    row_start = row * inf_count
+
+                    for inf_name, weight_value in weights.items():
+                        if inf_name not in inf_indexes:
+                            raise RuntimeError("Influence `{0}` isn't in `{1}`.".format(inf_name, self.skin_cluster))
+                        values[row_start + inf_indexes[inf_name]] = weight_value
+
+                    dq_values.append(self.skin_data.get_vertex_dq(vert_index))
+
+                components = utils.create_vert_components(shape_path, chunk)
+                mfn_skin_cluster.setWeights(shape_path, components, all_inf_indexes, om2.MDoubleArray(values), False)
+                mfn_skin_cluster.setBlendWeights(shape_path, components, om2.MDoubleArray(dq_values))
+
+                if display_progress:
+                    if pbar.was_cancelled():
+                        break
+                    pbar.next()
+        finally:
+            if display_progress and chunks:
+                pbar.end()
+
+    def _set_changed_skin_weights_bulk(self, changed_weights, changed_dq):
+        """
+        Writes only the influences that changed, as one block of the changed vertexes by the changed influences.
+        Influences outside of the block are left untouched on the skinCluster.
+        """
+        if not changed_weights and not changed_dq:
+            return
+
+        mfn_skin_cluster = utils.to_mfn_skin_cluster(self.skin_cluster)
+        shape_path = utils.get_skin_geometry_path(mfn_skin_cluster)
+
+        if changed_weights:
+            all_inf_indexes = {
+                inf_path.partialPathName(): i
+                for i, inf_path in enumerate(mfn_skin_cluster.influenceObjects())
+            }
+
+            inf_names = sorted(set(
+                inf_name
+                for weights in changed_weights.values()
+                for inf_name in weights
+            ))
+
+            for inf_name in inf_names:
+                if inf_name not in all_inf_indexes:
+                    raise RuntimeError("Influence `{0}` isn't in `{1}`.".format(inf_name, self.skin_cluster))
+
+            vert_indexes = sorted(changed_weights)
+            values = array("d")
+
+            for vert_index in vert_indexes:
+                weights = self.skin_data.get_vertex_weights(vert_index)
+                values.extend(weights.get(inf_name, 0.0) for inf_name in inf_names)
+
+            mfn_skin_cluster.setWeights(
+                shape_path,
+                utils.create_vert_components(shape_path, vert_indexes),
+                om2.MIntArray([all_inf_indexes[inf_name] for inf_name in inf_names]),
+                om2.MDoubleArray(values),
+                False)
+
+        if changed_dq:
+            vert_indexes = sorted(changed_dq)
+
+            mfn_skin_cluster.setBlendWeights(
+                shape_path,
+                utils.create_vert_components(shape_path, vert_indexes),
+                om2.MDoubleArray([changed_dq[vert_index] for vert_index in vert_indexes]))
+
+    def _set_changed_skin_weights_by_plugs(self, changed_weights, changed_dq):
+        """
+        Sets only the weight attributes that changed, removing the ones that went to 0.
+        """
+        inf_ids = {
+            inf_name: inf_id
+            for inf_id, inf_name in self.get_influence_ids().items()
+        }
+
+        for vert_index, weights in changed_weights.items():
+            for inf_name, weight_value in weights.items():
+                weight_attr = "{0}.weightList[{1}].weights[{2}]".format(
+                    self.skin_cluster, vert_index, inf_ids[inf_name])
+
+                if weight_value:
+                    cmds.setAttr(weight_attr, weight_value)
+                else:
+                    cmds.removeMultiInstance(weight_attr, b=True)
+
+        for vert_index, dq_value in changed_dq.items():
+            cmds.setAttr("{0}.bw[{1}]".format(self.skin_cluster, vert_index), dq_value)
+
+    def _set_skin_weights_by_plugs(self, vert_indexes, display_progress):
+        """
+        Prunes the vertexes, then sets their weights and dual-quaternions one attribute at a time.
         """
         # Get influence info to map with
         inf_data = self.get_influence_ids()
@@ -615,7 +765,6 @@ class SkinnedObj:
             for index in vert_indexes
         ]
 
-        cmds.setAttr("{0}.nw".format(self.skin_cluster), 0)
         cmds.skinPercent(self.skin_cluster, selected_vertexes, prw=100, nrm=0)
 
         if display_progress:
@@ -627,13 +776,13 @@ class SkinnedObj:
             for vert_index in vert_indexes:
                 weight_list_attr = "{0}.weightList[{1}]".format(self.skin_cluster, vert_index)
 
-                for inf_name, weight_value in self.skin_data[vert_index]["weights"].items():
+                for inf_name, weight_value in self.skin_data.get_vertex_weights(vert_index).items():
                     index = inf_names.index(inf_name)
                     weight_attr = ".weights[{0}]".format(inf_ids[index])
                     cmds.setAttr("{0}{1}".format(weight_list_attr, weight_attr), weight_value)
 
                 # Apply dual-quarternions
-                dq_value = self.skin_data[vert_index]["dq"]
+                dq_value = self.skin_data.get_vertex_dq(vert_index)
                 cmds.setAttr("{0}.bw[{1}]".format(self.skin_cluster, vert_index), dq_value)
 
                 if display_progress:
@@ -644,17 +793,12 @@ class SkinnedObj:
             if display_progress:
                 pbar.end()
 
-        # Re-enable weights normalizing
-        cmds.setAttr("{0}.nw".format(self.skin_cluster), 1)
-
-        if normalize:
-            cmds.skinCluster(self.skin_cluster, e=True, forceNormalizeWeights=True)
-
+    @tracer.traced()
     def serialize(self):
         if not self.has_valid_skin():
             raise RuntimeError("Unable to detect a skinCluster on '{}'.".format(self.name))
 
-        skin_data = self.skin_data.copy()
+        skin_data = self.skin_data.to_dict()
         mesh_points = self._get_world_points()
 
         with status_progress_bar.StatusProgressBar("Saving vert positions", len(mesh_points)) as pbar:
@@ -681,10 +825,16 @@ class SkinnedObj:
 
                 pbar.next()
 
+        # Triangles let world space imports blend between the file's vertexes.
+        triangles = []
+        if cmds.listRelatives(self.name, shapes=True, type="mesh"):
+            triangles = list(self._to_mfn_mesh(self.name).getTriangles()[1])
+
         return {
             "version": constants.EXPORT_VERSION,
             "object": self.name,
-            "verts": skin_data.data,
+            "verts": skin_data,
+            "triangles": triangles,
             "influences": influence_data,
             "skin_cluster": {
                 "name": self.skin_cluster,
@@ -696,7 +846,75 @@ class SkinnedObj:
             }
         }
 
-    def import_skin(self, file_path=None, world_space=False, create_missing_infs=True):
+    @tracer.traced()
+    def get_export_hash(self):
+        """
+        Hashes everything serialize() would write without building its dictionaries.
+        It covers the weights, the influences and their positions, the geometry's positions and triangles,
+        and the skinCluster's settings.
+
+        Returns:
+            A hex string that changes when the exported file would.
+        """
+        if not self.has_valid_skin():
+            raise RuntimeError("Unable to detect a skinCluster on '{}'.".format(self.name))
+
+        hasher = hashlib.sha1()
+        hasher.update(str(constants.EXPORT_VERSION).encode("utf-8"))
+
+        self.skin_data.update_hash(hasher)
+
+        points = array("d")
+        for pnt in self._get_world_points():
+            points.extend([pnt.x, pnt.y, pnt.z])
+        hasher.update(points)
+
+        if cmds.listRelatives(self.name, shapes=True, type="mesh"):
+            triangles = array("i", self._to_mfn_mesh(self.name).getTriangles()[1])
+            hasher.update(triangles)
+
+        influence_data = [
+            [inf_id, inf, cmds.xform(inf, q=True, ws=True, m=True)]
+            for inf_id, inf in sorted(self.get_influence_ids().items())
+        ]
+
+        skin_cluster_data = [
+            self.skin_cluster,
+            cmds.getAttr("{}.maxInfluences".format(self.skin_cluster)),
+            cmds.getAttr("{}.skinningMethod".format(self.skin_cluster)),
+            cmds.getAttr("{}.dqsSupportNonRigid".format(self.skin_cluster))
+        ]
+
+        hasher.update(json.dumps([self.name, influence_data, skin_cluster_data]).encode("utf-8"))
+
+        return hasher.hexdigest()
+
+    def _get_file_vertexes_to_read(self, skin_file, vert_filter, world_space, interpolate):
+        """
+        Picks which rows of a skin file an import needs, so importing onto a selection doesn't read the whole file.
+
+        Returns:
+            A list of the file's vertex indexes, or None to read all of them.
+        """
+        if not vert_filter:
+            return None
+
+        if not world_space:
+            return vert_filter
+
+        # Triangles point at the file's vertexes by position, so they need all rows.
+        if interpolate:
+            return None
+
+        mesh_points = self._get_world_points()
+        return skin_file.get_indexes_near([
+            mesh_points[vert_index]
+            for vert_index in vert_filter
+        ])
+
+    @tracer.traced()
+    def import_skin(self, file_path=None, world_space=False, create_missing_infs=True, interpolate=False,
+                    skin_data=None, inf_lookup=None):
         """
         Imports skin weights from a file.
 
@@ -704,11 +922,17 @@ class SkinnedObj:
             file_path(string): An absolute path to save weights to.
             world_space(bool): False=loads by point order, True=loads by world positions
             create_missing_infs(bool): Create any missing influences so the skin can still import.
+            interpolate(bool): Only used with world_space.
+                               Blends weights from the closest triangle in the file instead of snapping to the closest vertex.
+            skin_data(dict): The file's data if it was already loaded with SkinFile.load(). The file isn't read again.
+            inf_lookup(dict): Scene transforms from get_influence_lookup() to match influences with.
+                              Leave as None to query the scene for each influence.
+                              Any influences that get created are added to it.
         """
         if not self.is_valid():
             raise RuntimeError("Need to pick an object first.")
 
-        if file_path is None:
+        if file_path is None and skin_data is None:
             file_path = self._launch_file_picker(1, "Import skin", ok_caption="Import")
             if not file_path:
                 return False
@@ -721,23 +945,37 @@ class SkinnedObj:
             if not self.has_valid_skin():
                 raise RuntimeError("A skinCluster must already exist when importing weights onto vertexes")
 
-        with open(file_path, "rb") as f:
-            skin_data = cPickle.loads(f.read())
+        # Filled when the whole file is imported by point order, which doesn't need a dictionary per vertex.
+        file_skin_data = None
 
-            # Keys need to be converted to ints.
-            skin_data["verts"] = {
-                int(key): value
-                for key, value in skin_data["verts"].items()
-            }
+        if skin_data is None:
+            with SkinFile(file_path) as skin_file:
+                if not vert_filter and not world_space:
+                    file_skin_data = skin_file.to_skin_data()
+                    skin_data = skin_file.to_dict(vert_indexes=[])
+                else:
+                    skin_data = skin_file.to_dict(self._get_file_vertexes_to_read(skin_file, vert_filter, world_space, interpolate))
+
+        # Keys need to be converted to ints.
+        skin_data["verts"] = {
+            int(key): value
+            for key, value in skin_data["verts"].items()
+        }
 
         # Rename influences to match scene.
+        if file_skin_data is not None:
+            file_skin_data.rename_infs({
+                old_name: self._find_influence_by_name(old_name, inf_lookup) or old_name.split("|")[-1]
+                for old_name in file_skin_data.inf_names
+            })
+
         with status_progress_bar.StatusProgressBar("Matching influences", len(skin_data["verts"])) as pbar:
             infs = {}
 
             for index in skin_data["verts"]:
                 for old_name in list(skin_data["verts"][index]["weights"]):
                     if old_name not in infs:
-                        infs[old_name] = self._find_influence_by_name(old_name) or old_name.split("|")[-1]
+                        infs[old_name] = self._find_influence_by_name(old_name, inf_lookup) or old_name.split("|")[-1]
                     skin_data["verts"][index]["weights"][infs[old_name]] = skin_data["verts"][index]["weights"].pop(old_name)
 
                 if pbar.was_cancelled():
@@ -745,8 +983,15 @@ class SkinnedObj:
 
                 pbar.next()
 
-        if world_space:
-            closest_vertexes = self._map_to_closest_vertexes(skin_data["verts"], vert_filter)
+        if world_space and interpolate and not skin_data.get("triangles"):
+            OpenMaya.MGlobal.displayWarning(
+                "The file has no triangles to interpolate with, so it will use the closest vertexes instead.")
+            interpolate = False
+
+        if world_space and interpolate:
+            weights_data = self.backend.map_to_closest_triangles(skin_data["verts"], skin_data["triangles"], vert_filter)
+        elif world_space:
+            closest_vertexes = self.backend.map_to_closest_vertexes(skin_data["verts"], vert_filter)
 
             weights_data = {
                 source_index: skin_data["verts"][file_index]
@@ -766,7 +1011,7 @@ class SkinnedObj:
         for inf_id, inf_data in skin_data["influences"].items():
             inf_name = inf_data["name"]
             inf_short_name = inf_name.split("|")[-1]
-            inf = self._find_influence_by_name(inf_name)
+            inf = self._find_influence_by_name(inf_name, inf_lookup)
 
             if inf is None:
                 if not create_missing_infs:
@@ -775,6 +1020,9 @@ class SkinnedObj:
                 # Create new joint if influence is missing
                 inf = cmds.createNode("joint", name=inf_short_name, skipSelect=True)
                 cmds.xform(inf, ws=True, m=inf_data["world_matrix"])
+
+                if inf_lookup is not None:
+                    inf_lookup.setdefault(inf.split("|")[-1], []).append(inf)
                 OpenMaya.MGlobal.displayWarning("Created '{}' because it was missing.".format(inf_short_name))
 
             skin_jnts.append(inf)
@@ -800,25 +1048,38 @@ class SkinnedObj:
                 name=skin_data["skin_cluster"]["name"])
 
         # Define all verts to apply weights to.
-        vert_indexes = [
-            vert_index
-            for vert_index in weights_data
-            if not vert_filter or vert_index in vert_filter
-        ]
+        if file_skin_data is not None:
+            vert_indexes = list(range(len(file_skin_data)))
+        else:
+            vert_indexes = [
+                vert_index
+                for vert_index in weights_data
+                if not vert_filter or vert_index in vert_filter
+            ]
+
+        if file_skin_data is not None:
+            self.skin_data = file_skin_data
+        elif vert_filter:
+            for vert_index in vert_indexes:
+                self.skin_data[vert_index] = weights_data[vert_index]
+        else:
+            self.skin_data = SkinData.from_dict(weights_data)
 
-        self.skin_data.data = weights_data
         self.collect_influence_colors()
         self.infs = self.get_all_infs()
+        self.collect_inf_locks()
         self.apply_current_skin_weights(vert_indexes, display_progress=True)
 
         return True
 
-    def export_skin(self, file_path=None):
+    @tracer.traced()
+    def export_skin(self, file_path=None, compression=SkinCompression.Uncompressed):
         """
         Exports skin weights to a file.
 
         Args:
             file_path(string): An absolute path to save weights to.
+            compression(string): A SkinCompression value to compress the file with.
         """
         if not self.is_valid():
             raise RuntimeError("Need to pick a skinned object first.")
@@ -837,19 +1098,48 @@ class SkinnedObj:
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
 
-        with open(file_path, "wb") as f:
-            f.write(cPickle.dumps(skin_data))
+        SkinFile.save(file_path, skin_data, codec=compression)
 
         return file_path
 
     @classmethod
-    def export_all_skins(cls, delete_skin_cluster, export_folder=None):
+    def _load_export_cache(cls, export_folder):
+        """
+        Returns:
+            {object_name: {"hash": string, "codec": string}}
+        """
+        cache_path = os.path.join(export_folder, cls.export_cache_name)
+        if not os.path.exists(cache_path):
+            return {}
+
+        try:
+            with open(cache_path, "r") as f:
+                return json.load(f)
+        except (IOError, ValueError):
+            # A broken cache only means everything gets written again.
+            return {}
+
+    @classmethod
+    def _save_export_cache(cls, export_folder, export_cache):
+        with open(os.path.join(export_folder, cls.export_cache_name), "w") as f:
+            json.dump(export_cache, f, indent=4, sort_keys=True)
+
+    @classmethod
+    @tracer.traced()
+    def export_all_skins(cls, delete_skin_cluster, export_folder=None, compression=SkinCompression.Uncompressed,
+                         incremental=False):
         """
         Fetches all skinClusters in the scene and exports them all to a specified folder.
 
         Args:
             delete_skin_cluster(bool): If enabled, deletes the skinCluster after it's exported.
             export_folder(str): An absolute path to an existing folder to export the skins to. If None, a file picker will launch.
+            compression(string): A SkinCompression value to compress the files with.
+            incremental(bool): Skips skins that haven't changed since the last export to this folder.
+                               Each skin's hash is kept in a cache file next to the skin files.
+
+        Returns:
+            A list of each skin's results from ExportPipeline.wait(), which ExportPipeline.format_report() can print out.
         """
         if export_folder is None:
             export_folder = cls._launch_file_picker(3, "Pick a folder to export all skinClusters to", ok_caption="Export")
@@ -861,20 +1151,84 @@ class SkinnedObj:
             OpenMaya.MGlobal.displayWarning("There are no skinClusters in the scene to export.")
             return
 
-        for skin_cluster in skin_clusters:
-            meshes = cmds.ls(cmds.listHistory(skin_cluster) or [], type="mesh")
-            if not meshes:
-                continue
+        if not os.path.exists(export_folder):
+            os.makedirs(export_folder)
+
+        export_cache = cls._load_export_cache(export_folder)
+        export_hashes = {}  # {object_name: hash}
+
+        # Reading from the scene has to stay on the main thread, so only the file writes go to the pipeline.
+        pipeline = ExportPipeline()
+
+        try:
+            with status_progress_bar.StatusProgressBar("Exporting skins", len(skin_clusters)) as pbar:
+                for skin_cluster in skin_clusters:
+                    try:
+                        if pbar.was_cancelled():
+                            pipeline.cancel()
+                            break
+
+                        meshes = cmds.ls(cmds.listHistory(skin_cluster) or [], type="mesh")
+                        if not meshes:
+                            continue
+
+                        transform = cmds.listRelatives(meshes[0], parent=True)[0]
+                        export_path = "{}/{}.skin".format(export_folder, transform)
+
+                        start = time.time()
+                        skinned_obj = cls.create(transform)
+
+                        try:
+                            is_unchanged = False
+
+                            if incremental:
+                                export_hashes[transform] = skinned_obj.get_export_hash()
+
+                                cached = export_cache.get(transform, {})
+                                is_unchanged = (
+                                    os.path.exists(export_path) and
+                                    cached.get("hash") == export_hashes[transform] and
+                                    cached.get("codec") == compression)
+                            else:
+                                # Hashing would read the mesh twice, so the file gets written without one
+                                # and the next incremental export writes it again.
+                                export_cache.pop(transform, None)
+
+                            if is_unchanged:
+                                pipeline.skip(transform, export_path, compression, time.time() - start)
+                            else:
+                                skin_data = skinned_obj.serialize()
+                                pipeline.submit(transform, export_path, skin_data, compression, time.time() - start)
+                        finally:
+                            skinned_obj.remove_callbacks()
+
+                        if delete_skin_cluster:
+                            cmds.delete(transform, ch=True)
+                    finally:
+                        pbar.next()
+        finally:
+            results = pipeline.wait()
 
-            transform = cmds.listRelatives(meshes[0], parent=True)[0]
-            export_path = "{}/{}.skin".format(export_folder, transform)
-            skinned_obj = cls.create(transform)
-            skinned_obj.export_skin(export_path)
-            if delete_skin_cluster:
-                cmds.delete(transform, ch=True)
+            # Only remember skins that made it to disk, so failed ones are tried again.
+            for result in results:
+                if result["name"] in export_hashes and not result["error"]:
+                    export_cache[result["name"]] = {
+                        "hash": export_hashes[result["name"]],
+                        "codec": result["codec"]
+                    }
+
+            cls._save_export_cache(export_folder, export_cache)
+
+        errors = [result for result in results if result["error"] and result["error"] != "Cancelled"]
+        if errors:
+            OpenMaya.MGlobal.displayWarning(
+                "Failed to export {0} skin(s): {1}".format(len(errors), ", ".join(result["name"] for result in errors)))
+
+        return results
 
     @classmethod
-    def import_all_skins(cls, world_space, create_missing_infs, import_folder=None):
+    @tracer.traced()
+    def import_all_skins(cls, world_space, create_missing_infs, import_folder=None, interpolate=False):
         """
         Fetches all skin files from the supplied folder and tries to import them all into the scene.
         It tries to load by name using the skin's file name.
@@ -883,6 +1237,11 @@ class SkinnedObj:
             world_space(bool): False=loads by point order, True=loads by world positions
             create_missing_infs(bool): Create any missing influences so the skin can still import.
             import_folder(string): An absolute path to a folder that contains skin files.
+            interpolate(bool): Only used with world_space. Blends weights from the closest triangle in each file.
+
+        Returns:
+            A list of each skin's results in the order they were imported.
+            [{"name": string, "file_path": string, "apply_time": float, "error": string}...]
         """
         if import_folder is None:
             import_folder = cls._launch_file_picker(3, "Pick a folder with skin files to import them", ok_caption="Import")
@@ -894,11 +1253,61 @@ class SkinnedObj:
             OpenMaya.MGlobal.displayWarning("The folder contains no skin files to import with.")
             return
 
+        # Skip files without an object before loading anything.
+        transforms = {}
+
         for skin_path in skin_files:
             transform = os.path.basename(skin_path).split(".")[0]
             if not cmds.objExists(transform):
                 OpenMaya.MGlobal.displayWarning("Unable to find the object to import weights onto: `{0}`".format(transform))
                 continue
 
-            skinned_obj = SkinnedObj.create(transform)
-            skinned_obj.import_skin(file_path=skin_path, world_space=world_space, create_missing_infs=create_missing_infs)
+            transforms[skin_path] = transform
+
+        if not transforms:
+            return []
+
+        # Match influences against one scene query instead of querying each name of each file.
+        inf_lookup = cls.get_influence_lookup()
+
+        results = []
+
+        # Applying weights has to stay on the main thread, so the next files are loaded while the current one applies.
+        with ImportPrefetcher(sorted(transforms)) as prefetcher:
+            with status_progress_bar.StatusProgressBar("Importing skins", len(prefetcher)) as pbar:
+                for skin_path, skin_data, error in prefetcher:
+                    try:
+                        if pbar.was_cancelled():
+                            break
+
+                        result = {
+                            "name": transforms[skin_path],
+                            "file_path": skin_path,
+                            "apply_time": 0.0,
+                            "error": error
+                        }
+                        results.append(result)
+
+                        if error is not None:
+                            OpenMaya.MGlobal.displayWarning("Unable to read `{0}`: {1}".format(skin_path, error))
+                            continue
+
+                        start = time.time()
+                        skinned_obj = SkinnedObj.create(transforms[skin_path])
+
+                        try:
+                            skinned_obj.import_skin(
+                                file_path=skin_path, world_space=world_space, create_missing_infs=create_missing_infs,
+                                interpolate=interpolate, skin_data=skin_data, inf_lookup=inf_lookup)
+                        except Exception as err:
+                            # Keep going so one bad skin doesn't stop the rest of the batch.
+                            result["error"] = str(err)
+                            OpenMaya.MGlobal.displayWarning("Unable to import `{0}`: {1}".format(skin_path, err))
+                        finally:
+                            skinned_obj.remove_callbacks()
+
+                        result["apply_time"] = time.time() - start
+                    finally:
+                        pbar.next()
+
+        return results
@@ -0,0 +1,287 @@
+import re
+from array import array
+
+try:
+    from weights_editor_tool.weights_editor_utils import cmds
+except ImportError:
+    # Only pairing influences by label or position needs the scene.
+    cmds = None
+
+from weights_editor_tool.classes.point_grid import PointGrid
+
+
+class SymmetryMap:
+    """
+    Pairs each vertex with the closest vertex on the other side of a mirror plane.
+
+    Vertexes sitting on the plane are paired with themselves.
+
+    Args:
+        points(float[]): A flat list of x, y, z positions.
+        mirror_mode(string): The mirror plane, either "XY", "YZ" or "XZ".
+        tolerance(float): How close to the plane a vertex has to be to count as centered.
+    """
+
+    IndexType = "i"
+    PointType = "d"
+
+    DefaultTolerance = 1e-4
+
+    # The axis each plane flips.
+    PlaneAxes = {
+        "XY": 2,
+        "YZ": 0,
+        "XZ": 1
+    }
+
+    def __init__(self, points, mirror_mode, tolerance=DefaultTolerance):
+        self.points = array(self.PointType, points)
+        self.mirror_mode = mirror_mode
+        self.axis = self.PlaneAxes[mirror_mode]
+        self.tolerance = tolerance
+
+        positions = [
+            self.points[i:i + 3]
+            for i in range(0, len(self.points), 3)
+        ]
+
+        point_grid = PointGrid(positions)
+
+        self._mirror_indexes = array(self.IndexType)
+
+        for vert_index, position in enumerate(positions):
+            if self.get_side(vert_index) == 0:
+                self._mirror_indexes.append(vert_index)
+                continue
+
+            mirrored = list(position)
+            mirrored[self.axis] *= -1
+            self._mirror_indexes.append(point_grid.closest_point(mirrored))
+
+    def __len__(self):
+        return len(self._mirror_indexes)
+
+    def get_mirror_index(self, vert_index):
+        return self._mirror_indexes[vert_index]
+
+    def get_side(self, vert_index):
+        """
+        Returns:
+            1 if the vertex is on the plane's positive side, -1 if it's on the negative side, or 0 if it's centered.
+        """
+        value = self.points[vert_index * 3 + self.axis]
+
+        if value > self.tolerance:
+            return 1
+        elif value < -self.tolerance:
+            return -1
+        return 0
+
+    def get_targets(self, mirror_inverse, vert_indexes=None):
+        """
+        Collects which vertexes receive weights from their mirror.
+        Picking a vertex from the source side picks its mirror instead.
+
+        Args:
+            mirror_inverse(bool): False copies from the positive side to the negative side, True does the opposite.
+            vert_indexes(int[]): Vertexes to limit to. Leave as None to use all of them.
+
+        Returns:
+            A sorted list of vertex indexes.
+        """
+        target_side = 1 if mirror_inverse else -1
+
+        if vert_indexes is None:
+            vert_indexes = range(len(self))
+
+        targets = set()
+
+        for vert_index in vert_indexes:
+            side = self.get_side(vert_index)
+
+            if side == target_side:
+                targets.add(vert_index)
+            elif side == -target_side:
+                mirror_index = self._mirror_indexes[vert_index]
+                if self.get_side(mirror_index) == target_side:
+                    targets.add(mirror_index)
+
+        return sorted(targets)
+
+
+class SymmetryCache:
+    """
+    Keeps a SymmetryMap for each mirror plane of an object.
+    A map is rebuilt whenever the positions it was built from no longer match.
+    """
+
+    def __init__(self):
+        self._maps = {}  # {mirror_mode: SymmetryMap}
+
+    def get(self, points, mirror_mode):
+        """
+        Args:
+            points(float[]): A flat list of the object's current x, y, z positions.
+            mirror_mode(string): The mirror plane, either "XY", "YZ" or "XZ".
+
+        Returns:
+            A SymmetryMap for the plane.
+        """
+        points = array(SymmetryMap.PointType, points)
+        symmetry_map = self._maps.get(mirror_mode)
+
+        if symmetry_map is None or symmetry_map.points != points:
+            symmetry_map = SymmetryMap(points, mirror_mode)
+            self._maps[mirror_mode] = symmetry_map
+
+        return symmetry_map
+
+    def invalidate(self):
+        self._maps.clear()
+
+
+class InfMirrorMap:
+    """
+    Finds which influence each influence mirrors to.
+    Influences without a match mirror to themselves.
+    """
+
+    # Pairs of side tokens to swap in names.
+    # Short tokens only match when they aren't part of a longer word, like `l_arm` or `arm_L`.
+    NameTokens = [
+        ("l", "r"),
+        ("L", "R"),
+        ("lf", "rt"),
+        ("LF", "RT"),
+        ("left", "right"),
+        ("Left", "Right"),
+        ("LEFT", "RIGHT")
+    ]
+
+    # Joint side attribute values.
+    SideLeft = 1
+    SideRight = 2
+
+    # Joint type attribute value that uses the otherType string instead.
+    TypeOther = 18
+
+    @staticmethod
+    def _get_token_pattern(token):
+        if len(token) <= 2:
+            return r"(?<![a-zA-Z]){0}(?![a-zA-Z])".format(token)
+        return token
+
+    @classmethod
+    def _swap_name(cls, name, left, right):
+        """
+        Returns:
+            The name with its first side token swapped to the other side, or None if it has no token.
+        """
+        for old, new in [(left, right), (right, left)]:
+            pattern = cls._get_token_pattern(old)
+            if re.search(pattern, name):
+                return re.sub(pattern, new, name, count=1)
+
+    @classmethod
+    def by_name(cls, infs):
+        """
+        Pairs influences whose names only differ by a side token.
+
+        Args:
+            infs(string[]): Influence names.
+
+        Returns:
+            {inf_name: mirror_inf_name}
+        """
+        short_names = {
+            inf.split("|")[-1]: inf
+            for inf in infs
+        }
+
+        inf_map = {}
+
+        for inf in infs:
+            inf_map[inf] = inf
+            short_name = inf.split("|")[-1]
+
+            for left, right in cls.NameTokens:
+                mirror_name = cls._swap_name(short_name, left, right)
+                if mirror_name in short_names:
+                    inf_map[inf] = short_names[mirror_name]
+                    break
+
+        return inf_map
+
+    @classmethod
+    def _get_label(cls, inf):
+        if not cmds.attributeQuery("side", node=inf, exists=True):
+            return None, None
+
+        side = cmds.getAttr("{0}.side".format(inf))
+        joint_type = cmds.getAttr("{0}.type".format(inf))
+
+        if joint_type == cls.TypeOther:
+            joint_type = cmds.getAttr("{0}.otherType".format(inf))
+
+        return side, joint_type
+
+    @classmethod
+    def by_label(cls, infs):
+        """
+        Pairs left and right joints that share the same type label.
+
+        Args:
+            infs(string[]): Influence names.
+
+        Returns:
+            {inf_name: mirror_inf_name}
+        """
+        inf_map = {}
+        sides = {}  # {(side, joint_type): inf_name}
+
+        for inf in infs:
+            inf_map[inf] = inf
+
+            side, joint_type = cls._get_label(inf)
+            if side in [cls.SideLeft, cls.SideRight]:
+                sides[(side, joint_type)] = inf
+
+        for (side, joint_type), inf in sides.items():
+            other_side = cls.SideRight if side == cls.SideLeft else cls.SideLeft
+            inf_map[inf] = sides.get((other_side, joint_type), inf)
+
+        return inf_map
+
+    @classmethod
+    def by_position(cls, infs, mirror_mode, positions=None):
+        """
+        Pairs each influence with the closest influence to its mirrored position.
+
+        Args:
+            infs(string[]): Influence names.
+            mirror_mode(string): The mirror plane, either "XY", "YZ" or "XZ".
+            positions(float[][]): World positions of each influence. Leave as None to query them from the scene.
+
+        Returns:
+            {inf_name: mirror_inf_name}
+        """
+        if not infs:
+            return {}
+
+        axis = SymmetryMap.PlaneAxes[mirror_mode]
+
+        if positions is None:
+            positions = [
+                cmds.xform(inf, q=True, ws=True, t=True)
+                for inf in infs
+            ]
+
+        point_grid = PointGrid(positions)
+        inf_map = {}
+
+        for inf, position in zip(infs, positions):
+            mirrored = list(position)
+            mirrored[axis] *= -1
+            inf_map[inf] = infs[point_grid.closest_point(mirrored)]
+
+        return inf_map
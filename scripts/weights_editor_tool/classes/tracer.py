@@ -0,0 +1,314 @@
+import os
+import json
+import time
+import functools
+import threading
+import collections
+
+
+# Python 2 doesn't have perf_counter.
+_timer = getattr(time, "perf_counter", time.time)
+
+
+class Span:
+    """
+    One timed operation and the operations that ran inside of it.
+
+    Args:
+        name(string): What the operation is called.
+        args(dict): Extra values to show with it, like a vertex count.
+        parent(Span): The span this one ran inside of.
+    """
+
+    def __init__(self, name, args=None, parent=None):
+        self.name = name
+        self.args = args or {}
+        self.parent = parent
+        self.thread_id = threading.current_thread().ident
+        self.start = _timer()
+        self.end = None
+        self.children = []
+
+        # Counter increments while this span was open, including from its children.
+        self.counts = {}
+
+    def duration(self):
+        return (self.end if self.end is not None else _timer()) - self.start
+
+    def self_duration(self):
+        """
+        Returns:
+            The time spent in this span that isn't in any of its children.
+        """
+        return self.duration() - sum(child.duration() for child in self.children)
+
+
+class _SpanContext:
+
+    def __init__(self, tracer, name, args):
+        self._tracer = tracer
+        self._name = name
+        self._args = args
+
+    def __enter__(self):
+        return self._tracer._open_span(self._name, self._args)
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._tracer._close_span()
+
+
+class _NullContext:
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+class CountedModule:
+    """
+    Stands in for a module and counts calls to its public functions while the tracer is recording.
+    Anything else is handed back from the module as it is.
+
+    Args:
+        tracer(Tracer): The tracer to add counts to.
+        module(module): The module to wrap.
+        prefix(string): What to start the counter names with.
+    """
+
+    def __init__(self, tracer, module, prefix):
+        self._tracer = tracer
+        self._module = module
+        self._prefix = prefix
+        self._wrappers = {}  # {attr_name: (func, wrapper)}
+
+    def __getattr__(self, attr_name):
+        attr = getattr(self._module, attr_name)
+
+        if not self._tracer.is_enabled() or attr_name.startswith("_") or not callable(attr) or isinstance(attr, type):
+            return attr
+
+        func, wrapper = self._wrappers.get(attr_name, (None, None))
+
+        # Re-wrap if the module's function was replaced since.
+        if func is not attr:
+            wrapper = self._tracer._wrap_counted(attr, "{0}.{1}".format(self._prefix, attr_name))
+            self._wrappers[attr_name] = (attr, wrapper)
+
+        return wrapper
+
+
+class Tracer:
+    """
+    Records how long operations take while it's enabled, so slow spots can be found
+    without a profiler attached.
+
+    Spans can nest, and the last top-level spans are kept with their breakdown.
+    Counters, like how many Maya commands ran, are added to every open span.
+    When disabled, spans cost about as much as a function call.
+
+    Args:
+        history_size(int): Most top-level spans to keep.
+    """
+
+    DefaultHistorySize = 100
+
+    def __init__(self, history_size=DefaultHistorySize):
+        self._enabled = False
+        self._history = collections.deque(maxlen=history_size)
+        self._finished_count = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._origin = _timer()
+        self._null_context = _NullContext()
+
+    def is_enabled(self):
+        return self._enabled
+
+    def set_enabled(self, enabled):
+        self._enabled = enabled
+
+    def count_calls(self, module, prefix):
+        """
+        Wraps a module, like maya.cmds, so calls made through the wrapper are counted while recording.
+        The module itself isn't changed, so only code that imports the wrapper is counted.
+        The counters are named "{prefix}.{function_name}".
+
+        Returns:
+            A CountedModule.
+        """
+        return CountedModule(self, module, prefix)
+
+    def _wrap_counted(self, func, counter_name):
+        def wrapper(*args, **kwargs):
+            self.count(counter_name)
+            return func(*args, **kwargs)
+
+        wrapper.__name__ = getattr(func, "__name__", counter_name)
+        wrapper.__doc__ = getattr(func, "__doc__", None)
+        return wrapper
+
+    def _get_stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _open_span(self, name, args):
+        stack = self._get_stack()
+        parent = stack[-1] if stack else None
+
+        span = Span(name, args, parent)
+        if parent is not None:
+            parent.children.append(span)
+
+        stack.append(span)
+        return span
+
+    def _close_span(self):
+        stack = self._get_stack()
+        if not stack:
+            return
+
+        span = stack.pop()
+        span.end = _timer()
+
+        if span.parent is not None:
+            for counter_name, value in span.counts.items():
+                span.parent.counts[counter_name] = span.parent.counts.get(counter_name, 0) + value
+        else:
+            with self._lock:
+                self._history.append(span)
+                self._finished_count += 1
+
+    def span(self, name, **args):
+        """
+        Times everything inside a with statement.
+
+        Example:
+            with tracer.span("smooth", vert_count=len(vert_indexes)):
+                ...
+        """
+        if not self._enabled:
+            return self._null_context
+        return _SpanContext(self, name, args)
+
+    def traced(self, name=None):
+        """
+        Decorates a function so every call to it is timed.
+
+        Args:
+            name(string): What to call its spans. Leave as None to use the function's name.
+        """
+        def decorator(func):
+            span_name = name or getattr(func, "__qualname__", func.__name__)
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self._enabled:
+                    return func(*args, **kwargs)
+
+                self._open_span(span_name, None)
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self._close_span()
+
+            return wrapper
+
+        return decorator
+
+    def count(self, counter_name, value=1):
+        """
+        Adds to a counter on the innermost open span. Does nothing if no span is open.
+        """
+        if not self._enabled:
+            return
+
+        stack = self._get_stack()
+        if stack:
+            counts = stack[-1].counts
+            counts[counter_name] = counts.get(counter_name, 0) + value
+
+    def finished_count(self):
+        """
+        Returns:
+            How many top-level spans finished so far, to tell when the history changed.
+        """
+        return self._finished_count
+
+    def get_history(self):
+        """
+        Returns:
+            The last top-level spans, oldest first.
+        """
+        with self._lock:
+            return list(self._history)
+
+    def clear(self):
+        with self._lock:
+            self._history.clear()
+            self._finished_count = 0
+
+    def format_span(self, span, indent=0):
+        """
+        Returns:
+            A list of lines with the span's time and counters, and its children indented below it.
+        """
+        counts = ", ".join(
+            "{0} x{1}".format(counter_name, value)
+            for counter_name, value in sorted(span.counts.items())
+        )
+
+        lines = ["{0}{1}  {2:.2f} ms{3}".format(
+            "  " * indent, span.name, span.duration() * 1000, "  ({0})".format(counts) if counts else "")]
+
+        for child in span.children:
+            lines.extend(self.format_span(child, indent + 1))
+
+        return lines
+
+    def to_trace_events(self):
+        """
+        Converts the history to Chrome's trace event format, which chrome://tracing and Perfetto can open.
+
+        Returns:
+            A list of complete events.
+        """
+        pid = os.getpid()
+        events = []
+
+        def add_events(span):
+            args = dict(span.args)
+            args.update(span.counts)
+
+            events.append({
+                "name": span.name,
+                "cat": "weights_editor",
+                "ph": "X",
+                "ts": (span.start - self._origin) * 1000000,
+                "dur": span.duration() * 1000000,
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": args
+            })
+
+            for child in span.children:
+                add_events(child)
+
+        for span in self.get_history():
+            add_events(span)
+
+        return events
+
+    def export_chrome_trace(self, file_path):
+        """
+        Writes the history as a json trace file.
+        """
+        with open(file_path, "w") as f:
+            json.dump({"traceEvents": self.to_trace_events(), "displayTimeUnit": "ms"}, f)
+
+
+# Shared by the whole tool so spans from different modules nest together.
+tracer = Tracer()
@@ -0,0 +1,296 @@
+class TriangleBVH:
+    """
+    A bounding volume hierarchy over triangles to find the closest point on a triangle mesh.
+
+    Triangles are split in half along the longest axis of their centers until a node holds only a few of them.
+    Queries walk down the nearest child first and skip any node whose box is farther than the best hit so far.
+
+    Args:
+        points(float[][]): A list of (x, y, z) positions.
+        triangles(int[]): A flat list of point indexes, 3 per triangle.
+        leaf_size(int): The most triangles a node can hold before it's split.
+    """
+
+    DefaultLeafSize = 4
+
+    def __init__(self, points, triangles, leaf_size=DefaultLeafSize):
+        self._points = [(float(p[0]), float(p[1]), float(p[2])) for p in points]
+        self._triangles = [
+            (triangles[i], triangles[i + 1], triangles[i + 2])
+            for i in range(0, len(triangles) - 2, 3)
+        ]
+        self._leaf_size = max(1, leaf_size)
+
+        # Nodes are [box_min, box_max, left_node, right_node, start, end].
+        # Leaves have no children and own self._order[start:end].
+        self._nodes = []
+        self._order = list(range(len(self._triangles)))
+
+        if self._triangles:
+            self._centers = [self._get_center(tri) for tri in self._triangles]
+            self._build(0, len(self._order))
+            del self._centers
+
+    def __len__(self):
+        return len(self._triangles)
+
+    def get_triangle(self, tri_index):
+        """
+        Returns:
+            A tuple of the triangle's 3 point indexes.
+        """
+        return self._triangles[tri_index]
+
+    def _get_center(self, tri):
+        a, b, c = [self._points[index] for index in tri]
+        return tuple((a[axis] + b[axis] + c[axis]) / 3.0 for axis in range(3))
+
+    def _get_bounds(self, start, end):
+        points = self._points
+        box_min = [float("inf")] * 3
+        box_max = [float("-inf")] * 3
+
+        for tri_index in self._order[start:end]:
+            for point_index in self._triangles[tri_index]:
+                point = points[point_index]
+                for axis in range(3):
+                    if point[axis] < box_min[axis]:
+                        box_min[axis] = point[axis]
+                    if point[axis] > box_max[axis]:
+                        box_max[axis] = point[axis]
+
+        return tuple(box_min), tuple(box_max)
+
+    def _build(self, start, end):
+        """
+        Builds the nodes with an explicit stack so deep trees don't hit the recursion limit.
+
+        Returns:
+            The root node's index.
+        """
+        root = self._add_node(start, end)
+        stack = [root]
+
+        while stack:
+            node_index = stack.pop()
+            node = self._nodes[node_index]
+            start, end = node[4], node[5]
+
+            if end - start <= self._leaf_size:
+                continue
+
+            # Split at the median center along the axis the centers spread the most.
+            centers = self._centers
+            tri_indexes = self._order[start:end]
+            spreads = [
+                max(centers[i][axis] for i in tri_indexes) - min(centers[i][axis] for i in tri_indexes)
+                for axis in range(3)
+            ]
+            axis = spreads.index(max(spreads))
+
+            tri_indexes.sort(key=lambda i: centers[i][axis])
+            self._order[start:end] = tri_indexes
+
+            mid = (start + end) // 2
+            node[2] = self._add_node(start, mid)
+            node[3] = self._add_node(mid, end)
+            stack.extend([node[2], node[3]])
+
+        return root
+
+    def _add_node(self, start, end):
+        box_min, box_max = self._get_bounds(start, end)
+        self._nodes.append([box_min, box_max, None, None, start, end])
+        return len(self._nodes) - 1
+
+    @staticmethod
+    def _box_distance(point, box_min, box_max):
+        """
+        Returns:
+            The squared distance from a point to a box, or 0 if it's inside.
+        """
+        dist = 0.0
+
+        for axis in range(3):
+            value = point[axis]
+            if value < box_min[axis]:
+                dist += (box_min[axis] - value) ** 2
+            elif value > box_max[axis]:
+                dist += (value - box_max[axis]) ** 2
+
+        return dist
+
+    @staticmethod
+    def _closest_on_segment(p, a, b):
+        """
+        Returns:
+            How far along from a to b the closest point is, from 0 to 1.
+        """
+        ab = (b[0] - a[0], b[1] - a[1], b[2] - a[2])
+        length = ab[0] * ab[0] + ab[1] * ab[1] + ab[2] * ab[2]
+        if not length:
+            return 0.0
+
+        t = ((p[0] - a[0]) * ab[0] + (p[1] - a[1]) * ab[1] + (p[2] - a[2]) * ab[2]) / length
+        return min(1.0, max(0.0, t))
+
+    @classmethod
+    def _closest_on_edges(cls, p, a, b, c):
+        """
+        Finds the closest point on a degenerate triangle, where corners are merged or all in a line,
+        by only checking its edges.
+
+        Returns:
+            The (u, v, w) barycentric weights for a, b and c.
+        """
+        best_dist = None
+        best = None
+
+        for start, end, to_bary in [
+                (a, b, lambda t: (1.0 - t, t, 0.0)),
+                (a, c, lambda t: (1.0 - t, 0.0, t)),
+                (b, c, lambda t: (0.0, 1.0 - t, t))]:
+            t = cls._closest_on_segment(p, start, end)
+            closest = [start[axis] + (end[axis] - start[axis]) * t for axis in range(3)]
+            dist = sum((p[axis] - closest[axis]) ** 2 for axis in range(3))
+
+            if best_dist is None or dist < best_dist:
+                best_dist = dist
+                best = to_bary(t)
+
+        return best
+
+    @classmethod
+    def _closest_on_triangle(cls, p, a, b, c):
+        """
+        Finds the closest point on a triangle by checking which of its regions the point projects into.
+        Follows Ericson's Real-Time Collision Detection, 5.1.5.
+
+        Returns:
+            A tuple of the squared distance and the (u, v, w) barycentric weights for a, b and c.
+        """
+        ab = (b[0] - a[0], b[1] - a[1], b[2] - a[2])
+        ac = (c[0] - a[0], c[1] - a[1], c[2] - a[2])
+        ap = (p[0] - a[0], p[1] - a[1], p[2] - a[2])
+
+        d1 = ab[0] * ap[0] + ab[1] * ap[1] + ab[2] * ap[2]
+        d2 = ac[0] * ap[0] + ac[1] * ap[1] + ac[2] * ap[2]
+
+        # The edges' squared lengths and twice the squared area.
+        # Merged corners and zero area faces would divide by zero below.
+        ab_length = ab[0] * ab[0] + ab[1] * ab[1] + ab[2] * ab[2]
+        ac_length = ac[0] * ac[0] + ac[1] * ac[1] + ac[2] * ac[2]
+        ab_dot_ac = ab[0] * ac[0] + ab[1] * ac[1] + ab[2] * ac[2]
+
+        if ab_length * ac_length - ab_dot_ac * ab_dot_ac <= 1e-24 * max(ab_length * ac_length, 1e-300):
+            bary = cls._closest_on_edges(p, a, b, c)
+        elif d1 <= 0 and d2 <= 0:
+            bary = (1.0, 0.0, 0.0)
+        else:
+            bp = (p[0] - b[0], p[1] - b[1], p[2] - b[2])
+            d3 = ab[0] * bp[0] + ab[1] * bp[1] + ab[2] * bp[2]
+            d4 = ac[0] * bp[0] + ac[1] * bp[1] + ac[2] * bp[2]
+
+            cp = (p[0] - c[0], p[1] - c[1], p[2] - c[2])
+            d5 = ab[0] * cp[0] + ab[1] * cp[1] + ab[2] * cp[2]
+            d6 = ac[0] * cp[0] + ac[1] * cp[1] + ac[2] * cp[2]
+
+            vc = d1 * d4 - d3 * d2
+            vb = d5 * d2 - d1 * d6
+            va = d3 * d6 - d5 * d4
+
+            if d3 >= 0 and d4 <= d3:
+                bary = (0.0, 1.0, 0.0)
+            elif d6 >= 0 and d5 <= d6:
+                bary = (0.0, 0.0, 1.0)
+            elif vc <= 0 and d1 >= 0 and d3 <= 0 and d1 - d3 > 0:
+                v = d1 / (d1 - d3)
+                bary = (1.0 - v, v, 0.0)
+            elif vb <= 0 and d2 >= 0 and d6 <= 0 and d2 - d6 > 0:
+                w = d2 / (d2 - d6)
+                bary = (1.0 - w, 0.0, w)
+            elif va <= 0 and (d4 - d3) >= 0 and (d5 - d6) >= 0 and (d4 - d3) + (d5 - d6) > 0:
+                w = (d4 - d3) / ((d4 - d3) + (d5 - d6))
+                bary = (0.0, 1.0 - w, w)
+            else:
+                total = va + vb + vc
+                if total:
+                    v = vb / total
+                    w = vc / total
+                    bary = (1.0 - v - w, v, w)
+                else:
+                    bary = cls._closest_on_edges(p, a, b, c)
+
+        u, v, w = bary
+        closest = (
+            a[0] * u + b[0] * v + c[0] * w,
+            a[1] * u + b[1] * v + c[1] * w,
+            a[2] * u + b[2] * v + c[2] * w
+        )
+        dist = (p[0] - closest[0]) ** 2 + (p[1] - closest[1]) ** 2 + (p[2] - closest[2]) ** 2
+        return dist, bary
+
+    def closest_triangle(self, point):
+        """
+        Finds the triangle closest to a position.
+
+        Args:
+            point(float[]): An (x, y, z) position.
+
+        Returns:
+            A tuple of the triangle's index and the (u, v, w) barycentric weights of its 3 points,
+            or None if there are no triangles.
+        """
+        if not self._triangles:
+            return None
+
+        point = (float(point[0]), float(point[1]), float(point[2]))
+        points = self._points
+        triangles = self._triangles
+        nodes = self._nodes
+        order = self._order
+
+        best_dist = float("inf")
+        best = None
+        stack = [(0.0, 0)]
+
+        while stack:
+            node_dist, node_index = stack.pop()
+            if node_dist >= best_dist:
+                continue
+
+            box_min, box_max, left, right, start, end = nodes[node_index]
+
+            if left is None:
+                for tri_index in order[start:end]:
+                    a, b, c = triangles[tri_index]
+                    dist, bary = self._closest_on_triangle(point, points[a], points[b], points[c])
+                    if dist < best_dist:
+                        best_dist = dist
+                        best = (tri_index, bary)
+                continue
+
+            left_dist = self._box_distance(point, nodes[left][0], nodes[left][1])
+            right_dist = self._box_distance(point, nodes[right][0], nodes[right][1])
+
+            # Push the farther child first so the nearer one gets checked next.
+            if left_dist < right_dist:
+                stack.append((right_dist, right))
+                stack.append((left_dist, left))
+            else:
+                stack.append((left_dist, left))
+                stack.append((right_dist, right))
+
+        return best
+
+    def batch_closest_triangles(self, points):
+        """
+        Runs closest_triangle() on many positions.
+
+        Returns:
+            A list with a result from closest_triangle() for each position.
+        """
+        return [
+            self.closest_triangle(point)
+            for point in points
+        ]
@@ -0,0 +1,135 @@
+import sys
+
+
+class UndoStack:
+    """
+    Undo stack that keeps its commands within a byte budget and a command limit.
+
+    Commands can report their size with nbytes(). Once either limit is exceeded,
+    the oldest commands that can be undone are taken off the stack for good.
+
+    It follows QUndoStack's methods and runs QUndoCommands the same way, including merging with id() and mergeWith(),
+    but isn't one. QUndoStack's C++ slots can't be overridden from Python, so its undo action or a QUndoView
+    would skip the budget. Call undo() and redo() from Python instead.
+
+    Args:
+        byte_budget(int): How many bytes the undo history is allowed to hold.
+        undo_limit(int): Most commands to keep.
+    """
+
+    DefaultByteBudget = 256 * 1024 * 1024
+    DefaultUndoLimit = 100
+
+    def __init__(self, byte_budget=DefaultByteBudget, undo_limit=DefaultUndoLimit):
+        self._byte_budget = byte_budget
+        self._undo_limit = undo_limit
+        self._commands = []
+        self._index = 0
+
+        # Running total of every command's bytes so pushes don't need to add them all up.
+        self._nbytes = 0
+
+    @staticmethod
+    def _get_command_bytes(cmd):
+        if hasattr(cmd, "nbytes"):
+            return cmd.nbytes()
+        return sys.getsizeof(cmd)
+
+    def byte_budget(self):
+        return self._byte_budget
+
+    def set_byte_budget(self, byte_budget):
+        self._byte_budget = byte_budget
+        self._trim()
+
+    def undo_limit(self):
+        return self._undo_limit
+
+    def nbytes(self):
+        """
+        Returns:
+            The total bytes held by all commands in the stack.
+        """
+        return self._nbytes
+
+    def count(self):
+        return len(self._commands)
+
+    def index(self):
+        return self._index
+
+    def command(self, index):
+        return self._commands[index]
+
+    def clear(self):
+        self._commands = []
+        self._index = 0
+        self._nbytes = 0
+
+    def _trim(self):
+        """
+        Removes the oldest undoable commands until the stack fits in its limits.
+        Commands that can still be redone are left alone,
+        and the last command is always kept so the latest edit can be undone.
+        """
+        remove_count = 0
+
+        while remove_count < min(self._index, len(self._commands) - 1) and (
+                self._nbytes > self._byte_budget or len(self._commands) - remove_count > self._undo_limit):
+            self._nbytes -= self._get_command_bytes(self._commands[remove_count])
+            remove_count += 1
+
+        if remove_count:
+            del self._commands[:remove_count]
+            self._index -= remove_count
+
+    def push(self, cmd):
+        """
+        Runs the command's redo() and adds it on top, dropping anything that could be redone.
+        Like QUndoStack, it's merged into the previous command if both share an id() other than -1.
+        """
+        cmd.redo()
+
+        for redo_cmd in self._commands[self._index:]:
+            self._nbytes -= self._get_command_bytes(redo_cmd)
+        del self._commands[self._index:]
+
+        if self._commands and cmd.id() != -1 and cmd.id() == self._commands[-1].id():
+            prev_cmd = self._commands[-1]
+            prev_bytes = self._get_command_bytes(prev_cmd)
+
+            if prev_cmd.mergeWith(cmd):
+                self._nbytes += self._get_command_bytes(prev_cmd) - prev_bytes
+                self._trim()
+                return
+
+        self._commands.append(cmd)
+        self._index += 1
+        self._nbytes += self._get_command_bytes(cmd)
+        self._trim()
+
+    def canUndo(self):
+        return self._index > 0
+
+    def canRedo(self):
+        return self._index < len(self._commands)
+
+    def undoText(self):
+        if not self.canUndo():
+            return ""
+        return self._commands[self._index - 1].text()
+
+    def redoText(self):
+        if not self.canRedo():
+            return ""
+        return self._commands[self._index].text()
+
+    def undo(self):
+        if self.canUndo():
+            self._index -= 1
+            self._commands[self._index].undo()
+
+    def redo(self):
+        if self.canRedo():
+            self._commands[self._index].redo()
+            self._index += 1
@@ -1,4 +1,4 @@
-EXPORT_VERSION = 1.0
+EXPORT_VERSION = 2.0
 COLOR_SET = "weightsEditorCreateColorSet"
 POLY_COLOR_PER_VERT = "weightsEditorPolyColorPerVertex"
 GITHUB_HOME = "https://github.com/theRussetPotato/weights_editor"
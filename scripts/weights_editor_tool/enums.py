@@ -19,6 +19,14 @@ class SmoothOperation:
     AllInfluences = 1
 
 
+class SkinCompression:
+
+    Uncompressed = "none"
+    Zlib = "zlib"
+    Lzma = "lzma"
+    ShuffleZlib = "shuffle_zlib"
+
+
 class Hotkeys:
 
     ToggleTableListViews = "Toggle table / list views"
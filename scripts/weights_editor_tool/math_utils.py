@@ -0,0 +1,131 @@
+"""
+Math helpers that don't need Maya, so the weight math can run in any Python interpreter.
+"""
+
+from weights_editor_tool.enums import ColorTheme
+
+
+def is_close(val1, val2, rel_tol=1e-09, abs_tol=1e-15):
+    """
+    Determines if the two float values are close enough to each other.
+    https://www.python.org/dev/peps/pep-0485/#proposed-implementation
+    """
+    return abs(val1 - val2) <= max(rel_tol * max(abs(val1), abs(val2)), abs_tol)
+
+
+def clamp(min_value, max_value, value):
+    """
+    Clamps a value to the supplied range.
+    """
+    return max(min_value, min(value, max_value))
+
+
+def get_weight_color(weight, start_color=[0, 0, 1], mid_color=[0, 1, 0], end_color=[1, 0, 0], full_color=[1.0, 1.0, 1.0]):
+    """
+    Gets color that represents supplied weight value.
+    A value of 0 will be bias towards start_color, 1.0 will be biased towards end_color.
+    
+    Args:
+        weight(float): A value between 0.0 to 1.0.
+        start_color(float[]): Represents rbg when weight is 0.0.
+        mid_color(float[]): Represents rbg when weight is 0.5.
+        end_color(float[]): Represents rbg when weight is 1.0.
+        full_color(float[]): Represents rbg when weight is equal to 1.0.
+    
+    Returns:
+        An rbg list.
+    """
+    if weight == 1.0:
+        r, g, b = full_color
+    elif weight < 0.5:
+        w = weight * 2
+        r = start_color[0] + w * (mid_color[0] - start_color[0])
+        g = start_color[1] + w * (mid_color[1] - start_color[1])
+        b = start_color[2] + w * (mid_color[2] - start_color[2])
+    else:
+        w = (weight - 0.5) * 2
+        r = mid_color[0] + w * (end_color[0] - mid_color[0])
+        g = mid_color[1] + w * (end_color[1] - mid_color[1])
+        b = mid_color[2] + w * (end_color[2] - mid_color[2])
+
+    return [r, g, b]
+
+
+def get_influence_colors(inf_weights, color_style=ColorTheme.Max):
+    """
+    Gets the vertex colors that visualize one influence's weights.
+
+    Args:
+        inf_weights(iterable): (vert_index, weight_value) pairs from SkinData.iter_inf_weights().
+                               weight_value is None on vertexes that the influence doesn't effect.
+        color_style(int): 0=Max theme, 1=Maya theme.
+
+    Returns:
+        A list of rbg lists and a list of their vertex indexes.
+    """
+    if color_style == ColorTheme.Max:
+        low_rgb = [0, 0, 1]
+        mid_rgb = [0, 1, 0]
+        end_rgb = [1, 0, 0]
+        no_rgb = [0.05, 0.05, 0.05]
+        full_rgb = [1, 1, 1]
+    elif color_style == ColorTheme.Maya:
+        low_rgb = [0.5, 0, 0]
+        mid_rgb = [1, 0.5, 0]
+        end_rgb = [1, 1, 0]
+        no_rgb = [0, 0, 0]
+        full_rgb = [1, 1, 1]
+    else:
+        low_rgb = [0, 0, 0]
+        mid_rgb = [0, 0, 0]
+        end_rgb = [0, 0, 0]
+        no_rgb = [0, 0, 0]
+        full_rgb = [0, 0, 0]
+
+    vert_colors = []
+    vert_indexes = []
+
+    for vert_index, weight_value in inf_weights:
+        if weight_value is not None:
+            rgb = get_weight_color(
+                weight_value,
+                start_color=low_rgb,
+                mid_color=mid_rgb,
+                end_color=end_rgb,
+                full_color=full_rgb)
+        else:
+            rgb = no_rgb
+
+        vert_colors.append(rgb)
+        vert_indexes.append(vert_index)
+
+    return vert_colors, vert_indexes
+
+
+def get_multi_influence_colors(vertex_weights, inf_colors):
+    """
+    Gets vertex colors that blend every influence's own color by its weight, like Softimage.
+
+    Args:
+        vertex_weights(iterable): (vert_index, {inf_name: weight_value...}) pairs from SkinData.iter_vertex_weights().
+        inf_colors(dict): {inf_name: [r, g, b]...}
+
+    Returns:
+        A list of rbg lists and a list of their vertex indexes.
+    """
+    vert_colors = []
+    vert_indexes = []
+
+    for vert_index, weights in vertex_weights:
+        final_color = [0, 0, 0]
+
+        for inf, weight in weights.items():
+            inf_color = inf_colors.get(inf)
+            final_color[0] += inf_color[0] * weight
+            final_color[1] += inf_color[1] * weight
+            final_color[2] += inf_color[2] * weight
+
+        vert_colors.append(final_color)
+        vert_indexes.append(vert_index)
+
+    return vert_colors, vert_indexes
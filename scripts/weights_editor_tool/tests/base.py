@@ -10,21 +10,12 @@ TODO:
         - Flood to closest
 """
 
-import os
 import sys
 
 from unittest import TestCase
 
 # Add tool to PYTHONPATH.
-tests_path = os.path.dirname(os.path.realpath(__file__))
-
-base_path = tests_path.rsplit(os.sep, 1)[0]
-if base_path not in sys.path:
-    sys.path.insert(0, base_path)
-
-root_path = base_path.rsplit(os.sep, 1)[0]
-if root_path not in sys.path:
-    sys.path.insert(0, root_path)
+import paths
 
 # Initialize Maya in batch mode.
 if sys.version_info < (3, 0):
@@ -0,0 +1,16 @@
+"""
+Adds the tool to PYTHONPATH without starting Maya, so tests that don't need the scene can import it on their own.
+"""
+
+import os
+import sys
+
+tests_path = os.path.dirname(os.path.realpath(__file__))
+
+base_path = tests_path.rsplit(os.sep, 1)[0]
+if base_path not in sys.path:
+    sys.path.insert(0, base_path)
+
+root_path = base_path.rsplit(os.sep, 1)[0]
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
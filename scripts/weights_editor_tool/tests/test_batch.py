@@ -0,0 +1,51 @@
+import os
+import tempfile
+
+from base import MayaBaseTestCase
+from maya import cmds
+
+from weights_editor_tool import batch
+from weights_editor_tool.classes.skinned_obj import SkinnedObj
+
+
+class TestBatch(MayaBaseTestCase):
+
+    def test_get_shards(self):
+        scene_paths = ["a.ma", "b.ma", "c.ma", "d.ma", "e.ma"]
+
+        shards = batch.get_shards(scene_paths, 2)
+        self.assertEqual(len(shards), 2)
+        self.assertEqual(sorted(sum(shards, [])), scene_paths)
+
+        self.assertEqual(len(batch.get_shards(scene_paths[:1], 4)), 1)
+
+    def test_process_scenes(self):
+        scn_objs = self.create_skin_scene()
+        skinned_obj = SkinnedObj.create(scn_objs["mesh"])
+        old_weights = skinned_obj.skin_data.to_dict()
+        skinned_obj.remove_callbacks()
+
+        temp_dir = tempfile.mkdtemp()
+        scene_path = os.path.join(temp_dir, "scene.ma")
+        cmds.file(rename=scene_path)
+        cmds.file(save=True, type="mayaAscii", force=True)
+
+        folder = os.path.join(temp_dir, "skins")
+
+        results = batch.process_scenes(batch.ExportMode, [scene_path], folder, {})
+        self.assertIsNone(results[0]["error"])
+        self.assertEqual([result["name"] for result in results[0]["skins"]], [scn_objs["mesh"]])
+        self.assertTrue(os.path.exists(os.path.join(folder, "scene", "mesh.skin")))
+
+        cmds.delete(scn_objs["skinCluster"])
+        cmds.file(save=True, force=True)
+
+        options = {"world_space": False, "create_missing_infs": True, "save": True}
+        results = batch.process_scenes(batch.ImportMode, [scene_path], folder, options)
+        self.assertIsNone(results[0]["error"])
+        self.assertIsNone(results[0]["skins"][0]["error"])
+
+        cmds.file(scene_path, open=True, force=True)
+        skinned_obj = SkinnedObj.create(scn_objs["mesh"])
+        self.compare_dicts(skinned_obj.skin_data.to_dict(), old_weights)
+        skinned_obj.remove_callbacks()
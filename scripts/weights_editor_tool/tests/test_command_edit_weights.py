@@ -0,0 +1,125 @@
+from base import MayaBaseTestCase
+from maya import cmds
+
+from weights_editor_tool.classes.skin_data import SkinData
+from weights_editor_tool.classes.skinned_obj import SkinnedObj
+from weights_editor_tool.classes.undo_stack import UndoStack
+from weights_editor_tool.classes.command_edit_weights import CommandEditWeights
+
+
+class FakeWeightsView:
+    """
+    The parts of a weights view that commands touch, so they can run without opening the tool.
+    """
+
+    def horizontalHeader(self):
+        return self
+
+    def count(self):
+        return 0
+
+    def begin_update(self):
+        pass
+
+    def end_update(self):
+        pass
+
+    def load_table_selection(self, selection_data):
+        pass
+
+    def color_headers(self):
+        pass
+
+
+class FakeEditor:
+
+    instance = None
+
+    def __init__(self, obj):
+        self.obj = obj
+        self._weights_view = FakeWeightsView()
+
+    def get_active_weights_view(self):
+        return self._weights_view
+
+    def update_vert_colors(self, vert_filter=[]):
+        pass
+
+    def collect_display_infs(self):
+        pass
+
+
+class TestCommandEditWeights(MayaBaseTestCase):
+
+    def setUp(self):
+        super(self.__class__, self).setUp()
+
+        self.scn_objs = self.create_skin_scene()
+        self.skinned_obj = SkinnedObj.create(self.scn_objs["mesh"])
+        FakeEditor.instance = FakeEditor(self.skinned_obj)
+
+    def tearDown(self):
+        FakeEditor.instance = None
+        super(self.__class__, self).tearDown()
+
+    def _push_edit(self, undo_stack, vert_indexes, inf, value, merge_key, obj=None):
+        """
+        Edits weights and pushes the command the same way WeightsEditor.add_undo_command() does.
+        """
+        skin_data = self.skinned_obj.skin_data
+        old_rows = skin_data.copy_vertexes(vert_indexes)
+
+        skin_data.update_weight_values(vert_indexes, [inf] * len(vert_indexes), [value] * len(vert_indexes))
+        self.skinned_obj.apply_current_skin_weights(vert_indexes, old_rows=old_rows)
+
+        undo_stack.push(
+            CommandEditWeights(
+                FakeEditor,
+                "Set weights by {0}".format(value),
+                obj or self.skinned_obj.name,
+                old_rows,
+                skin_data.copy_vertexes(vert_indexes),
+                list(vert_indexes),
+                {},
+                skip_first_redo=True,
+                merge_key=merge_key))
+
+    def test_merge(self):
+        original_rows = self.skinned_obj.skin_data.copy_vertexes([15, 16, 22])
+
+        undo_stack = UndoStack()
+        self._push_edit(undo_stack, [15, 16], "left", 0.5, "key")
+        self._push_edit(undo_stack, [16, 22], "left", 0.2, "key")
+
+        # The second edit touched vertex 22 for the first time but still merged.
+        self.assertEqual(undo_stack.count(), 1)
+        self.assertEqual(undo_stack.undoText(), "Set weights by 0.2 (2 edits)")
+
+        edited_rows = self.skinned_obj.skin_data.copy_vertexes([15, 16, 22])
+
+        undo_stack.undo()
+        self.compare_dicts(self.skinned_obj.skin_data.copy_vertexes([15, 16, 22]), original_rows)
+        self.compare_dicts(
+            SkinData.get_bulk(self.scn_objs["skinCluster"]).copy_vertexes([15, 16, 22]), original_rows)
+
+        undo_stack.redo()
+        self.compare_dicts(self.skinned_obj.skin_data.copy_vertexes([15, 16, 22]), edited_rows)
+
+        self.skinned_obj.remove_callbacks()
+
+    def test_no_merge(self):
+        undo_stack = UndoStack()
+        self._push_edit(undo_stack, [15], "left", 0.5, "key")
+        self._push_edit(undo_stack, [15], "left", 0.4, "other key")
+        self.assertEqual(undo_stack.count(), 2)
+
+        self._push_edit(undo_stack, [15], "left", 0.3, None)
+        self._push_edit(undo_stack, [15], "left", 0.2, None)
+        self.assertEqual(undo_stack.count(), 4)
+
+        cmds.duplicate(self.scn_objs["mesh"], name="other_mesh")
+        self._push_edit(undo_stack, [15], "left", 0.1, "key")
+        self._push_edit(undo_stack, [15], "left", 0.6, "key", obj="other_mesh")
+        self.assertEqual(undo_stack.count(), 6)
+
+        self.skinned_obj.remove_callbacks()
@@ -1,4 +1,4 @@
-serialized_data = {'version': 1.0, 'object': 'mesh', 'verts': {0: {'weights': {'left': 0.010955569341675169, 'right': 0.030432152536491272, 'upper': 0.004916091577410523, 'lower': 0.9536961865444231}, 'dq': 0.0, 'world_pos': [0.25000011920928955, -0.8660253882408142, -0.4330126643180847]}, 1: {'weights': {'left': 0.030432133739851715, 'right': 0.010955571516336868, 'upper': 0.004916091004306976, 'lower': 0.9536962037395045}, 'dq': 0.0, 'world_pos': [-0.24999992549419403, -0.8660253882408142, -0.4330127537250519]}, 2: {'weights': {'left': 0.0661764757933798, 'right': 0.007352941490875435, 'upper': 0.004751257085589194, 'lower': 0.9217193256301556}, 'dq': 0.0, 'world_pos': [-0.5, -0.8660253882408142, -7.450580596923828e-08]}, 3: {'weights': {'left': 0.030432147105577064, 'right': 0.010955570149362773, 'upper': 0.004916091465825102, 'lower': 0.953696191279235}, 'dq': 0.0, 'world_pos': [-0.2500000596046448, -0.8660253882408142, 0.4330126941204071]}, 4: {'weights': {'left': 0.010955570708647734, 'right': 0.030432139170759466, 'upper': 0.00491609111589178, 'lower': 0.953696199004701}, 'dq': 0.0, 'world_pos': [0.2499999850988388, -0.8660253882408142, 0.4330127239227295]}, 5: {'weights': {'left': 0.007352941490875178, 'right': 0.06617647579337799, 'upper': 0.004751257085589024, 'lower': 0.9217193256301578}, 'dq': 0.0, 'world_pos': [0.5, -0.8660253882408142, 0.0]}, 6: {'weights': {'left': 0.06055241890920745, 'right': 0.3867989901049619, 'upper': 0.05526487827458192, 'lower': 0.4973837127112488}, 'dq': 0.0, 'world_pos': [0.4330129325389862, -0.4999999701976776, -0.75]}, 7: {'weights': {'left': 0.3867987054235529, 'right': 0.06055246528646995, 'upper': 0.05526489513557172, 'lower': 0.4973839341544054}, 'dq': 0.0, 'world_pos': [-0.43301260471343994, -0.4999999701976776, -0.7500001192092896]}, 8: {'weights': {'left': 0.9217193670261744, 'right': 0.004751255185166019, 'upper': 0.007352939241126313, 'lower': 0.06617643854753309}, 'dq': 0.0, 'world_pos': [-0.866025447845459, -0.4999999701976776, -1.290478479631929e-07]}, 9: {'weights': {'left': 0.38679888677662655, 'right': 0.06055243160705418, 'upper': 0.05526488049109181, 'lower': 0.4973838011252274}, 'dq': 0.0, 'world_pos': [-0.43301281332969666, -0.4999999701976776, 0.75]}, 10: {'weights': {'left': 0.060552450033991706, 'right': 0.3867987831840396, 'upper': 0.05526488809039554, 'lower': 0.4973838786915732}, 'dq': 0.0, 'world_pos': [0.4330126941204071, -0.4999999701976776, 0.7500000596046448]}, 11: {'weights': {'left': 0.0047512551851655056, 'right': 0.9217193670261814, 'upper': 0.0073529392411255355, 'lower': 0.06617643854752753}, 'dq': 0.0, 'world_pos': [0.866025447845459, -0.4999999701976776, 0.0]}, 12: {'weights': {'left': 0.06896546295782344, 'right': 0.6206898662751803, 'upper': 0.15517233538349814, 'lower': 0.15517233538349814}, 'dq': 0.0, 'world_pos': [0.5000002384185791, 0.0, -0.8660253286361694]}, 13: {'weights': {'left': 0.6206894987114218, 'right': 0.06896555747421285, 'upper': 0.1551724719071827, 'lower': 0.1551724719071827}, 'dq': 0.0, 'world_pos': [-0.49999985098838806, 0.0, -0.8660255074501038]}, 14: {'weights': {'left': 1.0}, 'dq': 0.0, 'world_pos': [-1.0, 0.0, -1.4901161193847656e-07]}, 15: {'weights': {'left': 0.62068975119565, 'right': 0.06896549254969266, 'upper': 0.15517237812732873, 'lower': 0.15517237812732873}, 'dq': 0.0, 'world_pos': [-0.5000001192092896, 0.0, 0.8660253882408142]}, 16: {'weights': {'left': 0.06896552788232638, 'right': 0.6206896137909551, 'upper': 0.1551724291633593, 'lower': 0.1551724291633593}, 'dq': 0.0, 'world_pos': [0.4999999701976776, 0.0, 0.866025447845459]}, 17: {'weights': {'right': 1.0}, 'dq': 0.0, 'world_pos': [1.0, 0.0, 0.0]}, 18: {'weights': {'left': 0.06055241890920745, 'right': 0.3867989901049619, 'upper': 0.4973837127112488, 'lower': 0.05526487827458192}, 'dq': 0.0, 'world_pos': [0.4330129325389862, 0.4999999701976776, -0.75]}, 19: {'weights': {'left': 0.3867987054235529, 'right': 0.06055246528646995, 'upper': 0.4973839341544054, 'lower': 0.05526489513557172}, 'dq': 0.0, 'world_pos': [-0.43301260471343994, 0.4999999701976776, -0.7500001192092896]}, 20: {'weights': {'left': 0.9217193670261746, 'right': 0.004751255185166019, 'upper': 0.06617643854753309, 'lower': 0.007352939241126313}, 'dq': 0.0, 'world_pos': [-0.866025447845459, 0.4999999701976776, -1.290478479631929e-07]}, 21: {'weights': {'left': 0.38679888677662655, 'right': 0.06055243160705418, 'upper': 0.4973838011252274, 'lower': 0.05526488049109181}, 'dq': 0.0, 'world_pos': [-0.43301281332969666, 0.4999999701976776, 0.75]}, 22: {'weights': {'left': 0.060552450033991706, 'right': 0.3867987831840396, 'upper': 0.4973838786915732, 'lower': 0.05526488809039554}, 'dq': 0.0, 'world_pos': [0.4330126941204071, 0.4999999701976776, 0.7500000596046448]}, 23: {'weights': {'left': 0.0047512551851655056, 'right': 0.9217193670261814, 'upper': 0.06617643854752753, 'lower': 0.0073529392411255355}, 'dq': 0.0, 'world_pos': [0.866025447845459, 0.4999999701976776, 0.0]}, 24: {'weights': {'left': 0.010955569341675169, 'right': 0.030432152536491272, 'upper': 0.9536961865444231, 'lower': 0.004916091577410523}, 'dq': 0.0, 'world_pos': [0.25000011920928955, 0.8660253882408142, -0.4330126643180847]}, 25: {'weights': {'left': 0.030432133739851715, 'right': 0.010955571516336868, 'upper': 0.9536962037395045, 'lower': 0.004916091004306976}, 'dq': 0.0, 'world_pos': [-0.24999992549419403, 0.8660253882408142, -0.4330127537250519]}, 26: {'weights': {'left': 0.0661764757933798, 'right': 0.007352941490875435, 'upper': 0.9217193256301556, 'lower': 0.004751257085589194}, 'dq': 0.0, 'world_pos': [-0.5, 0.8660253882408142, -7.450580596923828e-08]}, 27: {'weights': {'left': 0.030432147105577064, 'right': 0.010955570149362773, 'upper': 0.953696191279235, 'lower': 0.004916091465825102}, 'dq': 0.0, 'world_pos': [-0.2500000596046448, 0.8660253882408142, 0.4330126941204071]}, 28: {'weights': {'left': 0.010955570708647734, 'right': 0.030432139170759466, 'upper': 0.953696199004701, 'lower': 0.00491609111589178}, 'dq': 0.0, 'world_pos': [0.2499999850988388, 0.8660253882408142, 0.4330127239227295]}, 29: {'weights': {'left': 0.007352941490875178, 'right': 0.06617647579337799, 'upper': 0.9217193256301578, 'lower': 0.004751257085589024}, 'dq': 0.0, 'world_pos': [0.5, 0.8660253882408142, 0.0]}, 30: {'weights': {'lower': 1.0}, 'dq': 0.0, 'world_pos': [0.0, -1.0, 0.0]}, 31: {'weights': {'upper': 1.0}, 'dq': 0.0, 'world_pos': [0.0, 1.0, 0.0]}}, 'influences': {0: {'name': 'left', 'world_matrix': [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, -1.0, 0.0, 0.0, 1.0]}, 1: {'name': 'right', 'world_matrix': [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 1.0, 0.0, 0.0, 1.0]}, 2: {'name': 'upper', 'world_matrix': [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 1.0, 0.0, 1.0]}, 3: {'name': 'lower', 'world_matrix': [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, -1.0, 0.0, 1.0]}}, 'skin_cluster': {'name': 'skinCluster1', 'vert_count': 32, 'influence_count': 4, 'max_influences': 4, 'skinning_method': 0, 'dqs_support_non_rigid': True}}
+serialized_data = {'version': 2.0, 'object': 'mesh', 'verts': {0: {'weights': {'left': 0.010955569341675169, 'right': 0.030432152536491272, 'upper': 0.004916091577410523, 'lower': 0.9536961865444231}, 'dq': 0.0, 'world_pos': [0.25000011920928955, -0.8660253882408142, -0.4330126643180847]}, 1: {'weights': {'left': 0.030432133739851715, 'right': 0.010955571516336868, 'upper': 0.004916091004306976, 'lower': 0.9536962037395045}, 'dq': 0.0, 'world_pos': [-0.24999992549419403, -0.8660253882408142, -0.4330127537250519]}, 2: {'weights': {'left': 0.0661764757933798, 'right': 0.007352941490875435, 'upper': 0.004751257085589194, 'lower': 0.9217193256301556}, 'dq': 0.0, 'world_pos': [-0.5, -0.8660253882408142, -7.450580596923828e-08]}, 3: {'weights': {'left': 0.030432147105577064, 'right': 0.010955570149362773, 'upper': 0.004916091465825102, 'lower': 0.953696191279235}, 'dq': 0.0, 'world_pos': [-0.2500000596046448, -0.8660253882408142, 0.4330126941204071]}, 4: {'weights': {'left': 0.010955570708647734, 'right': 0.030432139170759466, 'upper': 0.00491609111589178, 'lower': 0.953696199004701}, 'dq': 0.0, 'world_pos': [0.2499999850988388, -0.8660253882408142, 0.4330127239227295]}, 5: {'weights': {'left': 0.007352941490875178, 'right': 0.06617647579337799, 'upper': 0.004751257085589024, 'lower': 0.9217193256301578}, 'dq': 0.0, 'world_pos': [0.5, -0.8660253882408142, 0.0]}, 6: {'weights': {'left': 0.06055241890920745, 'right': 0.3867989901049619, 'upper': 0.05526487827458192, 'lower': 0.4973837127112488}, 'dq': 0.0, 'world_pos': [0.4330129325389862, -0.4999999701976776, -0.75]}, 7: {'weights': {'left': 0.3867987054235529, 'right': 0.06055246528646995, 'upper': 0.05526489513557172, 'lower': 0.4973839341544054}, 'dq': 0.0, 'world_pos': [-0.43301260471343994, -0.4999999701976776, -0.7500001192092896]}, 8: {'weights': {'left': 0.9217193670261744, 'right': 0.004751255185166019, 'upper': 0.007352939241126313, 'lower': 0.06617643854753309}, 'dq': 0.0, 'world_pos': [-0.866025447845459, -0.4999999701976776, -1.290478479631929e-07]}, 9: {'weights': {'left': 0.38679888677662655, 'right': 0.06055243160705418, 'upper': 0.05526488049109181, 'lower': 0.4973838011252274}, 'dq': 0.0, 'world_pos': [-0.43301281332969666, -0.4999999701976776, 0.75]}, 10: {'weights': {'left': 0.060552450033991706, 'right': 0.3867987831840396, 'upper': 0.05526488809039554, 'lower': 0.4973838786915732}, 'dq': 0.0, 'world_pos': [0.4330126941204071, -0.4999999701976776, 0.7500000596046448]}, 11: {'weights': {'left': 0.0047512551851655056, 'right': 0.9217193670261814, 'upper': 0.0073529392411255355, 'lower': 0.06617643854752753}, 'dq': 0.0, 'world_pos': [0.866025447845459, -0.4999999701976776, 0.0]}, 12: {'weights': {'left': 0.06896546295782344, 'right': 0.6206898662751803, 'upper': 0.15517233538349814, 'lower': 0.15517233538349814}, 'dq': 0.0, 'world_pos': [0.5000002384185791, 0.0, -0.8660253286361694]}, 13: {'weights': {'left': 0.6206894987114218, 'right': 0.06896555747421285, 'upper': 0.1551724719071827, 'lower': 0.1551724719071827}, 'dq': 0.0, 'world_pos': [-0.49999985098838806, 0.0, -0.8660255074501038]}, 14: {'weights': {'left': 1.0}, 'dq': 0.0, 'world_pos': [-1.0, 0.0, -1.4901161193847656e-07]}, 15: {'weights': {'left': 0.62068975119565, 'right': 0.06896549254969266, 'upper': 0.15517237812732873, 'lower': 0.15517237812732873}, 'dq': 0.0, 'world_pos': [-0.5000001192092896, 0.0, 0.8660253882408142]}, 16: {'weights': {'left': 0.06896552788232638, 'right': 0.6206896137909551, 'upper': 0.1551724291633593, 'lower': 0.1551724291633593}, 'dq': 0.0, 'world_pos': [0.4999999701976776, 0.0, 0.866025447845459]}, 17: {'weights': {'right': 1.0}, 'dq': 0.0, 'world_pos': [1.0, 0.0, 0.0]}, 18: {'weights': {'left': 0.06055241890920745, 'right': 0.3867989901049619, 'upper': 0.4973837127112488, 'lower': 0.05526487827458192}, 'dq': 0.0, 'world_pos': [0.4330129325389862, 0.4999999701976776, -0.75]}, 19: {'weights': {'left': 0.3867987054235529, 'right': 0.06055246528646995, 'upper': 0.4973839341544054, 'lower': 0.05526489513557172}, 'dq': 0.0, 'world_pos': [-0.43301260471343994, 0.4999999701976776, -0.7500001192092896]}, 20: {'weights': {'left': 0.9217193670261746, 'right': 0.004751255185166019, 'upper': 0.06617643854753309, 'lower': 0.007352939241126313}, 'dq': 0.0, 'world_pos': [-0.866025447845459, 0.4999999701976776, -1.290478479631929e-07]}, 21: {'weights': {'left': 0.38679888677662655, 'right': 0.06055243160705418, 'upper': 0.4973838011252274, 'lower': 0.05526488049109181}, 'dq': 0.0, 'world_pos': [-0.43301281332969666, 0.4999999701976776, 0.75]}, 22: {'weights': {'left': 0.060552450033991706, 'right': 0.3867987831840396, 'upper': 0.4973838786915732, 'lower': 0.05526488809039554}, 'dq': 0.0, 'world_pos': [0.4330126941204071, 0.4999999701976776, 0.7500000596046448]}, 23: {'weights': {'left': 0.0047512551851655056, 'right': 0.9217193670261814, 'upper': 0.06617643854752753, 'lower': 0.0073529392411255355}, 'dq': 0.0, 'world_pos': [0.866025447845459, 0.4999999701976776, 0.0]}, 24: {'weights': {'left': 0.010955569341675169, 'right': 0.030432152536491272, 'upper': 0.9536961865444231, 'lower': 0.004916091577410523}, 'dq': 0.0, 'world_pos': [0.25000011920928955, 0.8660253882408142, -0.4330126643180847]}, 25: {'weights': {'left': 0.030432133739851715, 'right': 0.010955571516336868, 'upper': 0.9536962037395045, 'lower': 0.004916091004306976}, 'dq': 0.0, 'world_pos': [-0.24999992549419403, 0.8660253882408142, -0.4330127537250519]}, 26: {'weights': {'left': 0.0661764757933798, 'right': 0.007352941490875435, 'upper': 0.9217193256301556, 'lower': 0.004751257085589194}, 'dq': 0.0, 'world_pos': [-0.5, 0.8660253882408142, -7.450580596923828e-08]}, 27: {'weights': {'left': 0.030432147105577064, 'right': 0.010955570149362773, 'upper': 0.953696191279235, 'lower': 0.004916091465825102}, 'dq': 0.0, 'world_pos': [-0.2500000596046448, 0.8660253882408142, 0.4330126941204071]}, 28: {'weights': {'left': 0.010955570708647734, 'right': 0.030432139170759466, 'upper': 0.953696199004701, 'lower': 0.00491609111589178}, 'dq': 0.0, 'world_pos': [0.2499999850988388, 0.8660253882408142, 0.4330127239227295]}, 29: {'weights': {'left': 0.007352941490875178, 'right': 0.06617647579337799, 'upper': 0.9217193256301578, 'lower': 0.004751257085589024}, 'dq': 0.0, 'world_pos': [0.5, 0.8660253882408142, 0.0]}, 30: {'weights': {'lower': 1.0}, 'dq': 0.0, 'world_pos': [0.0, -1.0, 0.0]}, 31: {'weights': {'upper': 1.0}, 'dq': 0.0, 'world_pos': [0.0, 1.0, 0.0]}}, 'influences': {0: {'name': 'left', 'world_matrix': [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, -1.0, 0.0, 0.0, 1.0]}, 1: {'name': 'right', 'world_matrix': [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 1.0, 0.0, 0.0, 1.0]}, 2: {'name': 'upper', 'world_matrix': [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 1.0, 0.0, 1.0]}, 3: {'name': 'lower', 'world_matrix': [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, -1.0, 0.0, 1.0]}}, 'skin_cluster': {'name': 'skinCluster1', 'vert_count': 32, 'influence_count': 4, 'max_influences': 4, 'skinning_method': 0, 'dqs_support_non_rigid': True}}
 
 add_sub_data = {'weights': {'left': 0.047733523486084256, 'right': 0.30491365404933457, 'upper': 0.3920879343741856, 'lower': 0.25526488809039555}, 'dq': 0.0}
 
@@ -0,0 +1,27 @@
+import paths
+
+from unittest import TestCase
+
+from weights_editor_tool.enums import ColorTheme
+from weights_editor_tool.math_utils import get_influence_colors, get_multi_influence_colors
+
+
+class TestMathUtils(TestCase):
+
+    def test_influence_colors(self):
+        inf_weights = [(0, None), (1, 0.0), (2, 0.5), (3, 1.0)]
+
+        vert_colors, vert_indexes = get_influence_colors(inf_weights)
+        self.assertEqual(vert_indexes, [0, 1, 2, 3])
+        self.assertEqual(vert_colors, [[0.05, 0.05, 0.05], [0, 0, 1], [0, 1, 0], [1, 1, 1]])
+
+        vert_colors, vert_indexes = get_influence_colors(inf_weights, ColorTheme.Maya)
+        self.assertEqual(vert_colors, [[0, 0, 0], [0.5, 0, 0], [1, 0.5, 0], [1, 1, 1]])
+
+    def test_multi_influence_colors(self):
+        vert_colors, vert_indexes = get_multi_influence_colors(
+            [(4, {"left": 0.25, "right": 0.75}), (7, {"left": 1.0})],
+            {"left": [1, 0, 0], "right": [0, 0, 1]})
+
+        self.assertEqual(vert_indexes, [4, 7])
+        self.assertEqual(vert_colors, [[0.25, 0, 0.75], [1.0, 0, 0]])
@@ -0,0 +1,126 @@
+import paths
+
+import os
+import tempfile
+
+from unittest import TestCase
+
+from weights_editor_tool.classes.skin_file import SkinFile
+from weights_editor_tool.classes.skin_backend import MemorySkinBackend
+
+
+class TestMemorySkinBackend(TestCase):
+
+    GridSize = 4
+
+    def _save_grid_skin(self):
+        """
+        Saves a flat grid centered on the YZ plane, weighted from left to right.
+
+        Returns:
+            The file's path.
+        """
+        size = self.GridSize
+        verts = {}
+        triangles = []
+
+        for row in range(size):
+            for column in range(size):
+                left = column / float(size - 1)
+                verts[row * size + column] = {
+                    "weights": {"L_arm": left * 0.9, "R_arm": (1.0 - left) * 0.9, "spine": 0.1},
+                    "dq": 0.0,
+                    "world_pos": [column - (size - 1) / 2.0, row, 0.0]
+                }
+
+        for row in range(size - 1):
+            for column in range(size - 1):
+                a = row * size + column
+                triangles.extend([a, a + 1, a + size + 1, a, a + size + 1, a + size])
+
+        def get_matrix(x):
+            return [1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, x, 0, 0, 1]
+
+        file_path = os.path.join(tempfile.mkdtemp(), "grid.skin")
+
+        SkinFile.save(file_path, {
+            "version": 2.0,
+            "object": "grid",
+            "verts": verts,
+            "triangles": triangles,
+            "influences": {
+                0: {"name": "L_arm", "world_matrix": get_matrix(1)},
+                1: {"name": "R_arm", "world_matrix": get_matrix(-1)},
+                2: {"name": "spine", "world_matrix": get_matrix(0)}
+            },
+            "skin_cluster": {
+                "name": "skinCluster1",
+                "vert_count": len(verts),
+                "influence_count": 3,
+                "max_influences": 4,
+                "skinning_method": 0,
+                "dqs_support_non_rigid": False
+            }
+        })
+
+        return file_path
+
+    def test_from_file(self):
+        file_path = self._save_grid_skin()
+        backend = MemorySkinBackend.from_file(file_path)
+
+        self.assertEqual(len(backend.get_points()), self.GridSize ** 2)
+        self.assertEqual(backend.get_influences(), ["L_arm", "R_arm", "spine"])
+        self.assertEqual(backend.get_adjacency().get_neighbours(0), [1, self.GridSize, self.GridSize + 1])
+
+        backend.save(file_path)
+        self.assertEqual(
+            MemorySkinBackend.from_file(file_path).get_skin_data().to_dict(),
+            backend.get_skin_data().to_dict())
+
+    def test_prune_weights(self):
+        backend = MemorySkinBackend.from_file(self._save_grid_skin())
+        skin_data = backend.get_skin_data()
+
+        changed = backend.prune_weights(0.2, range(self.GridSize ** 2))
+        self.assertTrue(changed)
+
+        for vert_index in changed:
+            weights = skin_data.get_vertex_weights(vert_index)
+            self.assertNotIn("spine", weights)
+            self.assertAlmostEqual(sum(weights.values()), 1.0)
+
+    def test_prune_weights_with_locks(self):
+        backend = MemorySkinBackend.from_file(self._save_grid_skin())
+        backend.get_inf_locks().set_locked("spine", True)
+
+        self.assertEqual(backend.prune_weights(0.35, [1]), {1})
+
+        weights = backend.get_skin_data().get_vertex_weights(1)
+        self.assertEqual(sorted(weights), ["R_arm", "spine"])
+        self.assertAlmostEqual(weights["spine"], 0.1)
+        self.assertAlmostEqual(weights["R_arm"], 0.9)
+
+    def test_smooth_weights(self):
+        backend = MemorySkinBackend.from_file(self._save_grid_skin())
+        skin_data = backend.get_skin_data()
+
+        vert_indexes = list(range(self.GridSize ** 2))
+        backend.smooth_weights(vert_indexes, 1.0, iterations=2)
+
+        for vert_index in vert_indexes:
+            self.assertAlmostEqual(sum(skin_data.get_vertex_weights(vert_index).values()), 1.0)
+
+    def test_mirror_weights(self):
+        backend = MemorySkinBackend.from_file(self._save_grid_skin())
+        skin_data = backend.get_skin_data()
+
+        for inf_association in ["name", "closestJoint"]:
+            targets = backend.mirror_weights("YZ", False, inf_association)
+            self.assertEqual(len(targets), self.GridSize ** 2 // 2)
+
+            for vert_index in targets:
+                mirror_index = backend.get_symmetry_map("YZ").get_mirror_index(vert_index)
+                self.assertAlmostEqual(
+                    skin_data.get_weight(vert_index, "R_arm", 0.0),
+                    skin_data.get_weight(mirror_index, "L_arm", 0.0))
@@ -1,6 +1,7 @@
 from base import MayaBaseTestCase
 
 from weights_editor_tool.enums import WeightOperation
+from weights_editor_tool.classes.skin_data import SkinData
 from weights_editor_tool.classes.skinned_obj import SkinnedObj
 
 
@@ -73,3 +74,80 @@ class TestSkinData(MayaBaseTestCase):
             self.get_test_data("scale_data_2"))
 
         skinned_obj.apply_current_skin_weights([10])
+
+    def test_compact(self):
+        scn_objs = self.create_skin_scene()
+        skinned_obj = SkinnedObj.create(scn_objs["mesh"])
+        old_data = skinned_obj.skin_data.to_dict()
+
+        skinned_obj.skin_data.update_weight_value(15, "left", 0.5)
+        skinned_obj.skin_data.compact()
+
+        self.compare_dicts(skinned_obj.skin_data[15], self.get_test_data("set_data"))
+
+        for vert_index in skinned_obj.skin_data:
+            if vert_index != 15:
+                self.compare_dicts(skinned_obj.skin_data[vert_index], old_data[vert_index])
+
+    def test_bulk_read(self):
+        scn_objs = self.create_skin_scene()
+        bulk_data = SkinData.get_bulk(scn_objs["skinCluster"])
+        plug_data = SkinData.from_dict(SkinData.get_data(scn_objs["skinCluster"]))
+        self.compare_dicts(bulk_data.to_dict(), plug_data.to_dict())
+
+    def test_bulk_write(self):
+        scn_objs = self.create_skin_scene()
+        skinned_obj = SkinnedObj.create(scn_objs["mesh"])
+
+        skinned_obj.skin_data.update_weight_value(15, "left", 0.5)
+        skinned_obj.skin_data.update_weight_value(22, "upper", 1.0)
+        skinned_obj.apply_current_skin_weights([15, 22])
+
+        new_data = SkinData.get_bulk(scn_objs["skinCluster"])
+        self.compare_dicts(new_data.to_dict(), skinned_obj.skin_data.to_dict())
+
+    def test_copy_vertexes(self):
+        scn_objs = self.create_skin_scene()
+        skinned_obj = SkinnedObj.create(scn_objs["mesh"])
+        old_data = skinned_obj.skin_data.to_dict()
+        old_rows = skinned_obj.skin_data.copy_vertexes([15])
+
+        skinned_obj.skin_data.update_weight_value(15, "left", 0.5)
+        self.compare_dicts(skinned_obj.skin_data.copy_vertexes([15])[15], self.get_test_data("set_data"))
+
+        skinned_obj.skin_data.set_vertexes(old_rows)
+        self.compare_dicts(skinned_obj.skin_data.to_dict(), old_data)
+
+    def test_diff_write(self):
+        scn_objs = self.create_skin_scene()
+        skinned_obj = SkinnedObj.create(scn_objs["mesh"])
+        old_rows = skinned_obj.skin_data.copy_vertexes([15, 22])
+
+        skinned_obj.skin_data.update_weight_value(15, "left", 0.5)
+        new_rows = skinned_obj.skin_data.copy_vertexes([15, 22])
+
+        changed_weights, changed_dq = SkinData.diff_vertexes(old_rows, new_rows)
+        self.assertEqual(list(changed_weights.keys()), [15])
+        self.assertEqual(changed_dq, {})
+
+        skinned_obj.apply_current_skin_weights([15, 22], old_rows=old_rows)
+
+        new_data = SkinData.get_bulk(scn_objs["skinCluster"])
+        self.compare_dicts(new_data.to_dict(), skinned_obj.skin_data.to_dict())
+
+    def test_batch_edit(self):
+        scn_objs = self.create_skin_scene()
+        skinned_obj = SkinnedObj.create(scn_objs["mesh"])
+        batch_data = skinned_obj.skin_data.copy()
+
+        cells = [(15, "left", 0.5), (15, "upper", 0.0), (15, "lower", 1.0), (22, "lower", 0.3)]
+
+        for vert_index, inf, value in cells:
+            skinned_obj.skin_data.update_weight_value(vert_index, inf, value)
+
+        batch_data.update_weight_values(
+            [cell[0] for cell in cells],
+            [cell[1] for cell in cells],
+            [cell[2] for cell in cells])
+
+        self.compare_dicts(batch_data.to_dict(), skinned_obj.skin_data.to_dict())
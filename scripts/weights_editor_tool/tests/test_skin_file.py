@@ -0,0 +1,75 @@
+import paths
+
+import os
+import shutil
+import tempfile
+
+from unittest import TestCase
+
+from weights_editor_tool.classes.skin_file import SkinFile
+
+
+class TestSkinFile(TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _save_skin(self):
+        verts = {
+            0: {"weights": {"|root|L_arm": 1.0}, "dq": 0.0},
+            1: {"weights": {"|root|L_arm": 0.5, "|root|R_arm": 0.5}, "dq": 0.5},
+            2: {"weights": {"|root|R_arm": 0.25, "spine": 0.75}, "dq": 1.0}
+        }
+
+        file_path = os.path.join(self.temp_dir, "test.skin")
+
+        SkinFile.save(file_path, {
+            "version": 2.0,
+            "object": "mesh",
+            "verts": verts,
+            "triangles": [0, 1, 2],
+            "influences": {
+                0: {"name": "|root|L_arm", "world_matrix": [0.0] * 16},
+                1: {"name": "|root|R_arm", "world_matrix": [0.0] * 16},
+                2: {"name": "spine", "world_matrix": [0.0] * 16}
+            },
+            "skin_cluster": {
+                "name": "skinCluster1",
+                "vert_count": len(verts),
+                "influence_count": 3,
+                "max_influences": 4,
+                "skinning_method": 0,
+                "dqs_support_non_rigid": False
+            }
+        })
+
+        return file_path, verts
+
+    def test_to_skin_data(self):
+        file_path, verts = self._save_skin()
+
+        with SkinFile(file_path) as skin_file:
+            skin_data = skin_file.to_skin_data()
+            self.assertEqual(skin_data.to_dict(), skin_file.to_dict()["verts"])
+
+        self.assertEqual(skin_data.to_dict(), verts)
+
+    def test_rename_infs(self):
+        file_path, verts = self._save_skin()
+
+        with SkinFile(file_path) as skin_file:
+            skin_data = skin_file.to_skin_data()
+
+        skin_data.rename_infs({"|root|L_arm": "L_arm", "|root|R_arm": "R_arm"})
+        self.assertEqual(skin_data.inf_names, ["L_arm", "R_arm", "spine"])
+        self.assertEqual(skin_data[1]["weights"], {"L_arm": 0.5, "R_arm": 0.5})
+
+        # Influences that end up with the same name are merged.
+        skin_data.rename_infs({"R_arm": "spine"})
+        self.assertEqual(skin_data.inf_names, ["L_arm", "spine"])
+        self.assertEqual(skin_data[1]["weights"], {"L_arm": 0.5, "spine": 0.5})
+        self.assertEqual(skin_data[2]["weights"], {"spine": 1.0})
+        self.assertEqual(skin_data.get_inf_id("spine"), 1)
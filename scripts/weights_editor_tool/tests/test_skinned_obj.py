@@ -1,4 +1,13 @@
+import os
+import tempfile
+
 from base import MayaBaseTestCase
+from maya import cmds
+
+from weights_editor_tool import weights_editor_utils as utils
+from weights_editor_tool.enums import SkinCompression
+from weights_editor_tool.classes.skin_data import SkinData
+from weights_editor_tool.classes.skin_file import SkinFile
 from weights_editor_tool.classes.skinned_obj import SkinnedObj
 
 
@@ -27,8 +36,235 @@ class TestSkinnedObj(MayaBaseTestCase):
         skinned_obj = SkinnedObj.create(scn_objs["mesh"])
         self.assertEqual(skinned_obj.infs, ['left', 'lower', 'right', 'upper'])
 
+    def test_inf_locks(self):
+        scn_objs = self.create_skin_scene()
+        skinned_obj = SkinnedObj.create(scn_objs["mesh"])
+        self.assertFalse(skinned_obj.inf_locks.is_locked("left"))
+
+        # Lock changes in the scene are only picked up once the object has callbacks.
+        cmds.setAttr("left.lockInfluenceWeights", True)
+        self.assertFalse(skinned_obj.inf_locks.is_locked("left"))
+
+        skinned_obj.add_callbacks()
+        cmds.setAttr("left.lockInfluenceWeights", False)
+        cmds.setAttr("left.lockInfluenceWeights", True)
+        self.assertTrue(skinned_obj.inf_locks.is_locked("left"))
+        self.assertTrue(skinned_obj.inf_locks[skinned_obj.infs.index("left")])
+
+        old_value = skinned_obj.skin_data.get_weight(15, "left")
+        skinned_obj.skin_data.update_weight_value(15, "left", 0.5, locks=skinned_obj.inf_locks)
+        self.assertEqual(skinned_obj.skin_data.get_weight(15, "left"), old_value)
+
+        skinned_obj.remove_callbacks()
+
     def test_serialize(self):
         scn_objs = self.create_skin_scene()
         skinned_obj = SkinnedObj.create(scn_objs["mesh"])
         skin_data = skinned_obj.serialize()
+
+        # Triangulation is left to Maya, so only check that every face made it.
+        triangles = skin_data.pop("triangles")
+        self.assertEqual(len(triangles), 60 * 3)
+
         self.compare_dicts(skin_data, self.get_test_data("serialized_data"))
+
+    def test_adjacency(self):
+        scn_objs = self.create_skin_scene()
+        skinned_obj = SkinnedObj.create(scn_objs["mesh"])
+        adjacency = skinned_obj.get_adjacency()
+
+        self.assertEqual(len(adjacency), skinned_obj.vert_count)
+
+        for vert_index in [0, 10, 22]:
+            self.assertEqual(
+                adjacency.get_neighbours(vert_index),
+                sorted(utils.get_vert_neighbours(skinned_obj.name, vert_index)))
+
+        skinned_obj.remove_callbacks()
+
+    def test_smooth_iterations(self):
+        scn_objs = self.create_skin_scene()
+        skinned_obj = SkinnedObj.create(scn_objs["mesh"])
+        vert_indexes = list(range(10, 22))
+
+        skinned_obj.smooth_weights(vert_indexes, 1.0, iterations=5)
+
+        for vert_index in vert_indexes:
+            self.assertAlmostEqual(sum(skinned_obj.skin_data.get_vertex_weights(vert_index).values()), 1.0)
+
+        skinned_obj.remove_callbacks()
+
+    def test_map_to_closest_vertexes(self):
+        scn_objs = self.create_skin_scene()
+        skinned_obj = SkinnedObj.create(scn_objs["mesh"])
+        verts_data = skinned_obj.serialize()["verts"]
+
+        closest_vertexes = skinned_obj.backend.map_to_closest_vertexes(verts_data)
+        self.assertEqual(closest_vertexes, {index: index for index in verts_data})
+
+        closest_vertexes = skinned_obj.backend.map_to_closest_vertexes(verts_data, vert_filter=[3, 4])
+        self.assertEqual(closest_vertexes, {3: 3, 4: 4})
+
+        skinned_obj.remove_callbacks()
+
+    def test_map_to_closest_triangles(self):
+        scn_objs = self.create_skin_scene()
+        skinned_obj = SkinnedObj.create(scn_objs["mesh"])
+        skin_data = skinned_obj.serialize()
+
+        # Every vertex lands on a triangle's corner, so it should get its own weights back.
+        weights_data = skinned_obj.backend.map_to_closest_triangles(skin_data["verts"], skin_data["triangles"])
+        self.assertEqual(sorted(weights_data), sorted(skin_data["verts"]))
+
+        for vert_index, data in weights_data.items():
+            for inf, weight_value in skin_data["verts"][vert_index]["weights"].items():
+                self.assertAlmostEqual(data["weights"].get(inf, 0.0), weight_value)
+
+        skinned_obj.remove_callbacks()
+
+    def test_flood_weights_to_closest(self):
+        scn_objs = self.create_skin_scene()
+        skinned_obj = SkinnedObj.create(scn_objs["mesh"])
+
+        skinned_obj.flood_weights_to_closest()
+
+        # The sphere's poles sit right next to the upper and lower joints.
+        self.assertEqual(skinned_obj.skin_data.get_vertex_weights(30), {"lower": 1.0})
+        self.assertEqual(skinned_obj.skin_data.get_vertex_weights(31), {"upper": 1.0})
+        self.assertEqual(skinned_obj.skin_data.get_vertex_weights(14), {"left": 1.0})
+
+        scene_weights = SkinData.get(skinned_obj.skin_cluster)
+        self.assertAlmostEqual(scene_weights.get_weight(17, "right"), 1.0)
+
+        skinned_obj.remove_callbacks()
+
+    def test_mirror_in_memory(self):
+        scn_objs = self.create_skin_scene()
+        skinned_obj = SkinnedObj.create(scn_objs["mesh"])
+
+        # Push the right side off so the mirror has something to fix.
+        skinned_obj.skin_data.update_weight_value(11, "right", 0.2)
+        skinned_obj.apply_current_skin_weights([11])
+
+        self.assertTrue(skinned_obj.mirror_skin_weights("YZ", True, "closestPoint", "closestJoint"))
+
+        # Vertex 8 is on the left, the mirror of vertex 11.
+        left_weights = skinned_obj.skin_data.get_vertex_weights(8)
+        right_weights = skinned_obj.skin_data.get_vertex_weights(11)
+        self.assertAlmostEqual(right_weights["right"], left_weights["left"])
+        self.assertAlmostEqual(right_weights["left"], left_weights["right"])
+
+        scene_weights = SkinData.get(skinned_obj.skin_cluster)
+        self.assertAlmostEqual(scene_weights.get_weight(11, "right"), right_weights["right"])
+
+        skinned_obj.remove_callbacks()
+
+    def test_export_import(self):
+        scn_objs = self.create_skin_scene()
+        skinned_obj = SkinnedObj.create(scn_objs["mesh"])
+        old_weights = skinned_obj.skin_data.to_dict()
+
+        file_path = os.path.join(tempfile.mkdtemp(), "mesh.skin")
+        skinned_obj.export_skin(file_path)
+        self.assertTrue(SkinFile.is_v2(file_path))
+
+        cmds.select(clear=True)
+        self.assertTrue(skinned_obj.import_skin(file_path))
+        self.compare_dicts(skinned_obj.skin_data.to_dict(), old_weights)
+
+        skinned_obj.remove_callbacks()
+
+    def test_export_compression(self):
+        scn_objs = self.create_skin_scene()
+        skinned_obj = SkinnedObj.create(scn_objs["mesh"])
+        old_weights = skinned_obj.skin_data.to_dict()
+        temp_dir = tempfile.mkdtemp()
+
+        for codec in [SkinCompression.Zlib, SkinCompression.Lzma, SkinCompression.ShuffleZlib]:
+            # Python 2 doesn't have lzma.
+            if not SkinFile.is_codec_available(codec):
+                continue
+
+            file_path = os.path.join(temp_dir, "{0}.skin".format(codec))
+            skinned_obj.export_skin(file_path, compression=codec)
+
+            with SkinFile(file_path) as skin_file:
+                self.assertEqual(skin_file.get_codec(), codec)
+
+            cmds.select(clear=True)
+            self.assertTrue(skinned_obj.import_skin(file_path))
+            self.compare_dicts(skinned_obj.skin_data.to_dict(), old_weights)
+
+        skinned_obj.remove_callbacks()
+
+    def test_import_selection(self):
+        scn_objs = self.create_skin_scene()
+        skinned_obj = SkinnedObj.create(scn_objs["mesh"])
+        old_weights = skinned_obj.skin_data.to_dict()
+
+        file_path = os.path.join(tempfile.mkdtemp(), "mesh.skin")
+        skinned_obj.export_skin(file_path)
+
+        with SkinFile(file_path) as skin_file:
+            self.assertEqual(sorted(skin_file.to_dict([3, 4])["verts"]), [3, 4])
+
+            mesh_points = skinned_obj._get_world_points()
+            self.assertEqual(skin_file.get_indexes_near([mesh_points[3], mesh_points[4]]), [3, 4])
+
+        skinned_obj.skin_data.update_weight_value(3, "left", 1.0)
+        skinned_obj.apply_current_skin_weights([3])
+
+        cmds.select(["mesh.vtx[3]", "mesh.vtx[4]"])
+        self.assertTrue(skinned_obj.import_skin(file_path, world_space=True))
+        self.compare_dicts(skinned_obj.skin_data.get_vertex_weights(3), old_weights[3]["weights"])
+
+        skinned_obj.remove_callbacks()
+
+    def test_export_all_skins(self):
+        scn_objs = self.create_skin_scene()
+        export_folder = tempfile.mkdtemp()
+
+        results = SkinnedObj.export_all_skins(False, export_folder=export_folder)
+
+        self.assertEqual([result["name"] for result in results], [scn_objs["mesh"]])
+        self.assertIsNone(results[0]["error"])
+        self.assertTrue(os.path.exists(os.path.join(export_folder, "mesh.skin")))
+
+    def test_import_all_skins(self):
+        scn_objs = self.create_skin_scene()
+        skinned_obj = SkinnedObj.create(scn_objs["mesh"])
+        old_weights = skinned_obj.skin_data.to_dict()
+        skinned_obj.remove_callbacks()
+
+        export_folder = tempfile.mkdtemp()
+        SkinnedObj.export_all_skins(True, export_folder=export_folder)
+        self.assertFalse(cmds.ls(type="skinCluster"))
+
+        cmds.select(clear=True)
+        SkinnedObj.import_all_skins(False, False, import_folder=export_folder)
+
+        skinned_obj = SkinnedObj.create(scn_objs["mesh"])
+        self.compare_dicts(skinned_obj.skin_data.to_dict(), old_weights)
+        skinned_obj.remove_callbacks()
+
+    def test_export_all_skins_incremental(self):
+        scn_objs = self.create_skin_scene()
+        export_folder = tempfile.mkdtemp()
+
+        results = SkinnedObj.export_all_skins(False, export_folder=export_folder, incremental=True)
+        self.assertFalse(results[0]["skipped"])
+
+        results = SkinnedObj.export_all_skins(False, export_folder=export_folder, incremental=True)
+        self.assertTrue(results[0]["skipped"])
+
+        cmds.skinPercent(
+            scn_objs["skinCluster"], "{0}.vtx[0]".format(scn_objs["mesh"]),
+            transformValue=[(scn_objs["joints"][0], 1.0)])
+
+        results = SkinnedObj.export_all_skins(False, export_folder=export_folder, incremental=True)
+        self.assertFalse(results[0]["skipped"])
+
+        # A full export overwrites the file without a hash, so it can't be skipped afterwards.
+        SkinnedObj.export_all_skins(False, export_folder=export_folder)
+        results = SkinnedObj.export_all_skins(False, export_folder=export_folder, incremental=True)
+        self.assertFalse(results[0]["skipped"])
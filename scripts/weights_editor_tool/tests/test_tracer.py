@@ -0,0 +1,93 @@
+import paths
+
+import os
+import json
+import types
+import tempfile
+
+from unittest import TestCase
+
+from weights_editor_tool.classes.tracer import Tracer
+
+
+class TestTracer(TestCase):
+
+    def test_disabled(self):
+        tracer = Tracer()
+
+        with tracer.span("edit"):
+            tracer.count("cmds.skinPercent")
+
+        self.assertEqual(tracer.get_history(), [])
+
+    def test_nested_spans(self):
+        tracer = Tracer()
+        tracer.set_enabled(True)
+
+        @tracer.traced("apply")
+        def apply_weights():
+            tracer.count("cmds.setAttr", 2)
+
+        with tracer.span("edit", vert_count=3):
+            apply_weights()
+            apply_weights()
+
+        history = tracer.get_history()
+        self.assertEqual(len(history), 1)
+
+        span = history[0]
+        self.assertEqual(span.name, "edit")
+        self.assertEqual([child.name for child in span.children], ["apply", "apply"])
+        self.assertEqual(span.children[0].counts, {"cmds.setAttr": 2})
+        self.assertEqual(span.counts, {"cmds.setAttr": 4})
+        self.assertGreaterEqual(span.self_duration(), 0.0)
+
+    def test_history_size(self):
+        tracer = Tracer(history_size=2)
+        tracer.set_enabled(True)
+
+        for name in ["a", "b", "c"]:
+            with tracer.span(name):
+                pass
+
+        self.assertEqual([span.name for span in tracer.get_history()], ["b", "c"])
+        self.assertEqual(tracer.finished_count(), 3)
+
+    def test_count_calls(self):
+        module = types.ModuleType("fake_cmds")
+        module.ls = lambda *args: list(args)
+        original_ls = module.ls
+
+        tracer = Tracer()
+        cmds = tracer.count_calls(module, "cmds")
+        self.assertIs(cmds.ls, original_ls)
+
+        tracer.set_enabled(True)
+
+        with tracer.span("select"):
+            self.assertEqual(cmds.ls("a", "b"), ["a", "b"])
+            cmds.ls()
+            module.ls()
+
+        # Only calls through the wrapper are counted, and the module is left alone.
+        self.assertEqual(tracer.get_history()[0].counts, {"cmds.ls": 2})
+        self.assertIs(module.ls, original_ls)
+
+    def test_export_chrome_trace(self):
+        tracer = Tracer()
+        tracer.set_enabled(True)
+
+        with tracer.span("edit", vert_count=3):
+            with tracer.span("apply"):
+                tracer.count("cmds.setAttr")
+
+        file_path = os.path.join(tempfile.mkdtemp(), "trace.json")
+        tracer.export_chrome_trace(file_path)
+
+        with open(file_path, "r") as f:
+            events = json.load(f)["traceEvents"]
+
+        self.assertEqual([event["name"] for event in events], ["edit", "apply"])
+        self.assertEqual(events[0]["ph"], "X")
+        self.assertEqual(events[0]["args"], {"vert_count": 3, "cmds.setAttr": 1})
+        self.assertLessEqual(events[0]["ts"], events[1]["ts"])
@@ -0,0 +1,46 @@
+import paths
+
+from unittest import TestCase
+
+from weights_editor_tool.classes.triangle_bvh import TriangleBVH
+
+
+class TestTriangleBVH(TestCase):
+
+    def _assert_bary(self, bary, expected):
+        for value, expected_value in zip(bary, expected):
+            self.assertAlmostEqual(value, expected_value)
+
+    def test_closest_triangle(self):
+        bvh = TriangleBVH([(0, 0, 0), (1, 0, 0), (0, 1, 0), (1, 1, 0)], [0, 1, 2, 1, 3, 2])
+
+        tri_index, bary = bvh.closest_triangle((0.2, 0.2, 1.0))
+        self.assertEqual(tri_index, 0)
+        self._assert_bary(bary, (0.6, 0.2, 0.2))
+
+        tri_index, bary = bvh.closest_triangle((2.0, 2.0, 0.0))
+        self.assertEqual(tri_index, 1)
+        self._assert_bary(bary, (0.0, 1.0, 0.0))
+
+    def test_degenerate_triangles(self):
+        # Merged corners.
+        bvh = TriangleBVH([(0, 0, 0), (0, 0, 0), (1, 0, 0)], [0, 1, 2])
+        tri_index, bary = bvh.closest_triangle((0.5, -1, 0))
+        self.assertAlmostEqual(bary[2], 0.5)
+        self.assertAlmostEqual(sum(bary), 1.0)
+
+        # Corners all in a line.
+        bvh = TriangleBVH([(0, 0, 0), (1, 0, 0), (2, 0, 0)], [0, 1, 2])
+        tri_index, bary = bvh.closest_triangle((1.5, 1, 0))
+        self.assertAlmostEqual(bary[1] * 1.0 + bary[2] * 2.0, 1.5)
+
+        # Collapsed to a point.
+        bvh = TriangleBVH([(0, 0, 0), (0, 0, 0), (0, 0, 0)], [0, 1, 2])
+        self._assert_bary(bvh.closest_triangle((1, 1, 1))[1], (1.0, 0.0, 0.0))
+
+        # A degenerate triangle next to a valid one.
+        bvh = TriangleBVH([(0, 0, 0), (0, 0, 0), (1, 0, 0), (0, 1, 0)], [0, 1, 2, 1, 2, 3])
+        tri_index, bary = bvh.closest_triangle((0.5, -1, 0))
+        point_indexes = bvh.get_triangle(tri_index)
+        x = sum([0.0, 0.0, 1.0, 0.0][point_indexes[i]] * bary[i] for i in range(3))
+        self.assertAlmostEqual(x, 0.5)
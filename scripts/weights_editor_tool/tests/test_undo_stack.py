@@ -0,0 +1,115 @@
+import paths
+
+from unittest import TestCase
+
+from weights_editor_tool.classes.undo_stack import UndoStack
+
+
+class FakeCommand:
+    """
+    Stands in for a QUndoCommand so the stack can be tested without Qt.
+    """
+
+    def __init__(self, name, size, log, merge_id=-1):
+        self._name = name
+        self._size = size
+        self._log = log
+        self._merge_id = merge_id
+
+    def text(self):
+        return self._name
+
+    def nbytes(self):
+        return self._size
+
+    def id(self):
+        return self._merge_id
+
+    def mergeWith(self, other):
+        self._name = "{0}+{1}".format(self._name, other.text())
+        self._size += other.nbytes()
+        return True
+
+    def redo(self):
+        self._log.append(("redo", self._name))
+
+    def undo(self):
+        self._log.append(("undo", self._name))
+
+
+class TestUndoStack(TestCase):
+
+    def _push(self, stack, log, names, size=10, merge_id=-1):
+        for name in names:
+            stack.push(FakeCommand(name, size, log, merge_id=merge_id))
+
+    def test_byte_budget(self):
+        log = []
+        stack = UndoStack(byte_budget=30)
+        self._push(stack, log, ["a", "b", "c", "d", "e"])
+
+        # The oldest commands are gone for good, not just emptied.
+        self.assertEqual(stack.count(), 3)
+        self.assertEqual(stack.nbytes(), 30)
+        self.assertEqual([stack.command(i).text() for i in range(stack.count())], ["c", "d", "e"])
+
+        stack.set_byte_budget(15)
+        self.assertEqual(stack.count(), 1)
+        self.assertEqual(stack.nbytes(), 10)
+
+        # The latest edit can still be undone even if it's over the budget on its own.
+        stack.set_byte_budget(0)
+        self.assertEqual(stack.count(), 1)
+        self.assertTrue(stack.canUndo())
+
+    def test_undo_stops_at_trimmed_commands(self):
+        log = []
+        stack = UndoStack(byte_budget=20)
+        self._push(stack, log, ["a", "b", "c"])
+        del log[:]
+
+        while stack.canUndo():
+            stack.undo()
+
+        self.assertEqual(log, [("undo", "c"), ("undo", "b")])
+        self.assertEqual(stack.undoText(), "")
+        self.assertEqual(stack.redoText(), "b")
+
+    def test_redo_commands_are_kept(self):
+        log = []
+        stack = UndoStack(byte_budget=20)
+        self._push(stack, log, ["a", "b"])
+
+        stack.undo()
+        stack.undo()
+        stack.set_byte_budget(5)
+
+        # Nothing can be undone, so there's nothing to trim.
+        self.assertEqual(stack.count(), 2)
+
+        stack.redo()
+        self.assertEqual(stack.index(), 1)
+
+        # Pushing drops what could be redone.
+        self._push(stack, log, ["c"])
+        self.assertEqual(stack.count(), 1)
+        self.assertEqual(stack.command(0).text(), "c")
+        self.assertEqual(stack.nbytes(), 10)
+
+    def test_undo_limit(self):
+        log = []
+        stack = UndoStack(undo_limit=3)
+        self._push(stack, log, ["a", "b", "c", "d"], size=0)
+
+        self.assertEqual(stack.count(), 3)
+        self.assertEqual(stack.undoText(), "d")
+
+    def test_merge(self):
+        log = []
+        stack = UndoStack(byte_budget=100)
+        self._push(stack, log, ["a", "b"], merge_id=1)
+        self._push(stack, log, ["c"])
+
+        self.assertEqual(stack.count(), 2)
+        self.assertEqual(stack.command(0).text(), "a+b")
+        self.assertEqual(stack.nbytes(), 30)
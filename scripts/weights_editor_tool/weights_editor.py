@@ -15,15 +15,13 @@ Example of usage:
 """
 
 import os
-import copy
 import json
 import traceback
 import shiboken2
 import webbrowser
 from functools import partial
 
-from maya import cmds
-from maya import mel
+from weights_editor_tool.weights_editor_utils import cmds, mel
 from maya import OpenMaya
 
 from PySide2 import QtGui
@@ -32,12 +30,16 @@ from PySide2 import QtWidgets
 from PySide2 import QtNetwork
 
 from weights_editor_tool import constants
-from weights_editor_tool.enums import ColorTheme, WeightOperation, SmoothOperation, Hotkeys
+from weights_editor_tool.enums import ColorTheme, WeightOperation, SmoothOperation, SkinCompression, Hotkeys
 from weights_editor_tool import weights_editor_utils as utils
 from weights_editor_tool.classes.skinned_obj import SkinnedObj
+from weights_editor_tool.classes.skin_file import SkinFile
+from weights_editor_tool.classes.export_pipeline import ExportPipeline
 from weights_editor_tool.classes import hotkey as hotkey_module
 from weights_editor_tool.classes import command_edit_weights
 from weights_editor_tool.classes import command_lock_infs
+from weights_editor_tool.classes.undo_stack import UndoStack
+from weights_editor_tool.classes.tracer import tracer
 from weights_editor_tool.widgets import custom_double_spinbox
 from weights_editor_tool.widgets import inf_list_view
 from weights_editor_tool.widgets import weights_list_view
@@ -45,6 +47,7 @@ from weights_editor_tool.widgets import weights_table_view
 from weights_editor_tool.widgets import hotkeys_dialog
 from weights_editor_tool.widgets import presets_dialog
 from weights_editor_tool.widgets import about_dialog
+from weights_editor_tool.widgets import trace_dialog
 
 
 class WeightsEditor(QtWidgets.QWidget):
@@ -68,14 +71,14 @@ class WeightsEditor(QtWidgets.QWidget):
         self.setAttribute(QtCore.Qt.WA_DeleteOnClose)
         self.setObjectName("weightsEditor")
         
-        self._undo_stack = QtWidgets.QUndoStack(parent=self)
-        self._undo_stack.setUndoLimit(30)
+        self._undo_stack = UndoStack()
         self._copied_vertex = None
         self._in_component_mode = utils.is_in_component_mode()
         self._settings_path = os.path.join(os.getenv("HOME"), "maya", "weights_editor.json")
         self._add_preset_values = presets_dialog.PresetsDialog.Defaults["add"]
         self._scale_preset_values = presets_dialog.PresetsDialog.Defaults["scale"]
         self._set_preset_values = presets_dialog.PresetsDialog.Defaults["set"]
+        self._trace_dialog = None
 
         self.block_selection_cb = False
         self.ignore_cell_selection_event = False
@@ -294,6 +297,10 @@ class WeightsEditor(QtWidgets.QWidget):
         self._set_limit_action.triggered.connect(self._set_limit_on_triggered)
         self._options_menu.addAction(self._set_limit_action)
 
+        self._set_undo_budget_action = QtWidgets.QAction("Set undo memory budget", self)
+        self._set_undo_budget_action.triggered.connect(self._set_undo_budget_on_triggered)
+        self._options_menu.addAction(self._set_undo_budget_action)
+
         self._color_separator = QtWidgets.QAction("[ Settings ]", self)
         self._color_separator.setEnabled(False)
         self._options_menu.addAction(self._color_separator)
@@ -332,6 +339,40 @@ class WeightsEditor(QtWidgets.QWidget):
         self._delete_skin_on_export_all_action.setChecked(True)
         self._options_menu.addAction(self._delete_skin_on_export_all_action)
 
+        self._incremental_export_all_action = QtWidgets.QAction("Skip unchanged skins on `Export all`", self)
+        self._incremental_export_all_action.setToolTip(
+            "Only rewrites skins that changed since they were last exported to the same folder.")
+        self._incremental_export_all_action.setCheckable(True)
+        self._options_menu.addAction(self._incremental_export_all_action)
+
+        self._compression_sub_menu = self._options_menu.addMenu("Export compression")
+        self._compression_action_group = QtWidgets.QActionGroup(self)
+
+        self._compression_actions = {}
+
+        for codec, caption in [
+                (SkinCompression.Uncompressed, "None"),
+                (SkinCompression.Zlib, "zlib"),
+                (SkinCompression.Lzma, "lzma"),
+                (SkinCompression.ShuffleZlib, "Byte shuffle + zlib")]:
+            compression_action = QtWidgets.QAction(caption, self)
+            compression_action.setCheckable(True)
+            compression_action.setChecked(codec == SkinCompression.Uncompressed)
+
+            if not SkinFile.is_codec_available(codec):
+                compression_action.setEnabled(False)
+                compression_action.setText("{0} (not available in this version of Python)".format(caption))
+
+            self._compression_action_group.addAction(compression_action)
+            self._compression_sub_menu.addAction(compression_action)
+            self._compression_actions[codec] = compression_action
+
+        self._flood_to_bone_segments_action = QtWidgets.QAction("Use bone segments on `Flood to closest`", self)
+        self._flood_to_bone_segments_action.setToolTip(
+            "Measures distances to the bones between joints and their children instead of to joint pivots.")
+        self._flood_to_bone_segments_action.setCheckable(True)
+        self._options_menu.addAction(self._flood_to_bone_segments_action)
+
         self._prefs_menu = self._menu_bar.addMenu("&Preferences")
 
         self._enable_hotkeys_action = QtWidgets.QAction("Enable hotkeys", self)
@@ -348,6 +389,11 @@ class WeightsEditor(QtWidgets.QWidget):
         self._launch_presets_action.triggered.connect(self._launch_presets_on_clicked)
         self._prefs_menu.addAction(self._launch_presets_action)
 
+        self._show_trace_action = QtWidgets.QAction("Show performance trace", self)
+        self._show_trace_action.setToolTip("Records how long each operation takes to find what's slowing the tool down.")
+        self._show_trace_action.triggered.connect(self._show_trace_on_triggered)
+        self._prefs_menu.addAction(self._show_trace_action)
+
         self._about_action = QtWidgets.QAction("About this tool", self)
         self._about_action.triggered.connect(self._about_on_triggered)
 
@@ -432,6 +478,12 @@ class WeightsEditor(QtWidgets.QWidget):
         self._smooth_strength_spinbox.setMaximum(1)
         self._smooth_strength_spinbox.setSingleStep(0.1)
 
+        self._smooth_iterations_spinbox = QtWidgets.QSpinBox(value=1)
+        self._smooth_iterations_spinbox.setFixedWidth(50)
+        self._smooth_iterations_spinbox.setToolTip("Number of smoothing passes.")
+        self._smooth_iterations_spinbox.setMinimum(1)
+        self._smooth_iterations_spinbox.setMaximum(100)
+
         self._smooth_button = self._create_button(
             "Smooth", "interface/smooth.png",
             click_event=partial(self._run_smooth, SmoothOperation.Normal))
@@ -470,6 +522,7 @@ class WeightsEditor(QtWidgets.QWidget):
 
         self._prune_layout = utils.wrap_layout(
             [self._smooth_strength_spinbox,
+             self._smooth_iterations_spinbox,
              self._smooth_button,
              self._smooth_br_button,
              15,
@@ -563,6 +616,13 @@ class WeightsEditor(QtWidgets.QWidget):
             click_event=partial(self._import_weights_on_clicked, True))
         self._import_weights_world_button.setObjectName("importButton")
 
+        self._import_weights_interpolated_button = self._create_button(
+            "Import (Interpolated)", "interface/import_weights.png",
+            tool_tip="Import skin weights onto the selected object by blending weights from the closest triangles in the file<br><br>"
+                     "Useful to apply a low resolution skin onto a denser mesh.",
+            click_event=partial(self._import_weights_on_clicked, True, True))
+        self._import_weights_interpolated_button.setObjectName("importButton")
+
         self._import_all_weights_button = self._create_button(
             "Import All", "interface/import_weights.png",
             tool_tip="Pick a folder with skin files and try to import them all.<br><br>"
@@ -582,6 +642,7 @@ class WeightsEditor(QtWidgets.QWidget):
              15,
              self._import_weights_button,
              self._import_weights_world_button,
+             self._import_weights_interpolated_button,
              self._import_all_weights_button,
              15,
              self._flood_to_closest_button],
@@ -662,11 +723,20 @@ class WeightsEditor(QtWidgets.QWidget):
             click_event=self._redo_on_clicked)
         self._redo_button.setFixedHeight(40)
 
-        self._undo_layout = utils.wrap_layout(
+        self._undo_buttons_layout = utils.wrap_layout(
             [self._undo_button,
              self._redo_button],
             QtCore.Qt.Horizontal)
 
+        self._undo_memory_label = QtWidgets.QLabel()
+        self._undo_memory_label.setAlignment(QtCore.Qt.AlignRight)
+
+        self._undo_layout = utils.wrap_layout(
+            [self._undo_buttons_layout,
+             self._undo_memory_label],
+            QtCore.Qt.Vertical,
+            spacing=1)
+
         widgets = [
             self._show_all_button,
             self._hide_colors_button,
@@ -782,7 +852,7 @@ class WeightsEditor(QtWidgets.QWidget):
             button.setToolTip(tool_tip)
 
         if click_event is not None:
-            button.clicked.connect(click_event)
+            button.clicked.connect(lambda: self._run_traced(caption.replace("\n", " "), click_event))
 
         return button
 
@@ -919,13 +989,21 @@ class WeightsEditor(QtWidgets.QWidget):
                 self.toggle_inf_lock_key_codes.append(hotkey.key_code())
             else:
                 shortcut = utils.create_shortcut(
-                    QtGui.QKeySequence(hotkey.key_code()), hotkey.func)
+                    QtGui.QKeySequence(hotkey.key_code()), partial(self._run_traced, hotkey.caption, hotkey.func))
 
                 if shortcut:
                     self.__class__.shortcuts.append(shortcut)
 
         self._update_tooltips()
 
+    @staticmethod
+    def _run_traced(span_name, func):
+        """
+        Runs a button or hotkey's function inside a span, so its whole operation shows up as one entry in the trace.
+        """
+        with tracer.span(span_name):
+            func()
+
     def _set_undo_buttons_enabled_state(self):
         """
         Checks the undo stack and determines enabled state and labels on undo/redo buttons.
@@ -946,6 +1024,11 @@ class WeightsEditor(QtWidgets.QWidget):
             self._redo_button.setText("Redo\n({0})".format(redo_text))
         else:
             self._redo_button.setText("No redos available")
+
+        self._undo_memory_label.setText(
+            "Undo memory: {0:.1f} / {1:.0f} MB".format(
+                self._undo_stack.nbytes() / 1048576.0,
+                self._undo_stack.byte_budget() / 1048576.0))
     
     def _save_state(self):
         """
@@ -959,9 +1042,11 @@ class WeightsEditor(QtWidgets.QWidget):
             "height": self.height(),
             "splitter.sizes": self._splitter.sizes(),
             "color_style": self.color_style,
+            "export_compression": self._get_export_compression(),
             "prune_spinbox.value": self._prune_by_value_spinbox.value(),
             "prune_max_infs_spinbox.value": self._prune_max_infs_spinbox.value(),
             "smooth_strength_spinbox.value": self._smooth_strength_spinbox.value(),
+            "smooth_iterations_spinbox.value": self._smooth_iterations_spinbox.value(),
             "mirror_mode.currentIndex": self._mirror_mode.currentIndex(),
             "mirror_surface.currentIndex": self._mirror_surface.currentIndex(),
             "mirror_inf.currentIndex": self._mirror_inf.currentIndex(),
@@ -982,7 +1067,10 @@ class WeightsEditor(QtWidgets.QWidget):
             "show_inf_button.isChecked": self._show_inf_button.isChecked(),
             "hide_long_names_action.isChecked": self._hide_long_names_action.isChecked(),
             "delete_skin_on_export_all_action.isChecked": self._delete_skin_on_export_all_action.isChecked(),
+            "incremental_export_all_action.isChecked": self._incremental_export_all_action.isChecked(),
+            "flood_to_bone_segments_action.isChecked": self._flood_to_bone_segments_action.isChecked(),
             "weights_table.max_display_count": self._weights_table.table_model.max_display_count,
+            "undo_stack.byte_budget": self._undo_stack.byte_budget(),
             "add_presets_values": self._add_preset_values,
             "scale_presets_values": self._scale_preset_values,
             "set_presets_values": self._set_preset_values,
@@ -1024,6 +1112,10 @@ class WeightsEditor(QtWidgets.QWidget):
             for i, widget in enumerate(color_actions):
                 widget.setChecked(i == self.color_style)
 
+        compression_action = self._compression_actions.get(data.get("export_compression"))
+        if compression_action is not None and compression_action.isEnabled():
+            compression_action.setChecked(True)
+
         if "mirror_mode.currentIndex" in data:
             self._mirror_mode.setCurrentIndex(data["mirror_mode.currentIndex"])
 
@@ -1036,10 +1128,14 @@ class WeightsEditor(QtWidgets.QWidget):
         if "weights_table.max_display_count" in data:
             self._weights_table.table_model.max_display_count = data["weights_table.max_display_count"]
 
+        if "undo_stack.byte_budget" in data:
+            self._undo_stack.set_byte_budget(data["undo_stack.byte_budget"])
+
         spinboxes = {
             "prune_spinbox.value": self._prune_by_value_spinbox,
             "prune_max_infs_spinbox.value": self._prune_max_infs_spinbox,
             "smooth_strength_spinbox.value": self._smooth_strength_spinbox,
+            "smooth_iterations_spinbox.value": self._smooth_iterations_spinbox,
             "add_spinbox.value": self._add_spinbox,
             "scale_spinbox.value": self._scale_spinbox,
             "set_spinbox.value": self._set_spinbox
@@ -1063,7 +1159,9 @@ class WeightsEditor(QtWidgets.QWidget):
             "show_set_button.isChecked": self._show_set_button,
             "show_inf_button.isChecked": self._show_inf_button,
             "hide_long_names_action.isChecked": self._hide_long_names_action,
-            "delete_skin_on_export_all_action.isChecked": self._delete_skin_on_export_all_action
+            "delete_skin_on_export_all_action.isChecked": self._delete_skin_on_export_all_action,
+            "incremental_export_all_action.isChecked": self._incremental_export_all_action,
+            "flood_to_bone_segments_action.isChecked": self._flood_to_bone_segments_action
         }
 
         for key, checkbox in checkboxes.items():
@@ -1097,6 +1195,7 @@ class WeightsEditor(QtWidgets.QWidget):
         if path and os.path.exists(path):
             SkinnedObj.last_browsing_path = path
     
+    @tracer.traced()
     def _update_obj(self, obj):
         """
         Re-points tool to work on another object and re-collect its skin data.
@@ -1109,9 +1208,11 @@ class WeightsEditor(QtWidgets.QWidget):
 
         try:
             self.obj.hide_vert_colors()
+            self.obj.remove_callbacks()
 
             # Reset values
             self.obj = SkinnedObj.create(obj)
+            self.obj.add_callbacks()
             self._in_component_mode = utils.is_in_component_mode()
 
             # Reset undo stack.
@@ -1151,12 +1252,9 @@ class WeightsEditor(QtWidgets.QWidget):
     
     def _collect_inf_locks(self):
         """
-        Collects a list of bools from active influences.
+        Points to the object's cached lock states, which are indexed the same as its influences.
         """
-        self.locks = [
-            cmds.getAttr("{0}.lockInfluenceWeights".format(inf_name))
-            for inf_name in self.obj.infs
-        ]
+        self.locks = self.obj.inf_locks
     
     def _get_infs_by_selected_verts(self):
         """
@@ -1171,6 +1269,7 @@ class WeightsEditor(QtWidgets.QWidget):
         
         return sorted(list(infs))
     
+    @tracer.traced()
     def _recollect_table_data(
             self, update_skin_data=True, update_verts=True,
             update_infs=True, update_headers=True, load_selection=True):
@@ -1205,19 +1304,23 @@ class WeightsEditor(QtWidgets.QWidget):
             if update_headers:
                 weights_view.color_headers()
         finally:
-            weights_view.end_update()
-            weights_view.emit_header_data_changed()
+            with tracer.span("Qt layout"):
+                weights_view.end_update()
+                weights_view.emit_header_data_changed()
 
         if load_selection:
-            if self._auto_select_infs_action.isChecked():
-                weights_view.select_items_by_inf(self.color_inf)
-            else:
-                weights_view.load_table_selection(selection_data)
+            with tracer.span("Restore table selection"):
+                if self._auto_select_infs_action.isChecked():
+                    weights_view.select_items_by_inf(self.color_inf)
+                else:
+                    weights_view.load_table_selection(selection_data)
 
-        weights_view.fit_headers_to_contents()
+        with tracer.span("Fit headers"):
+            weights_view.fit_headers_to_contents()
 
         self.ignore_cell_selection_event = False
     
+    @tracer.traced()
     def _edit_weights(self, input_value, weight_operation):
         """
         Sets new weight value while distributing the difference.
@@ -1237,16 +1340,12 @@ class WeightsEditor(QtWidgets.QWidget):
             OpenMaya.MGlobal.displayWarning("Select cells inside the table to edit.")
             return
 
-        sel_vert_indexes = set()
-        old_skin_data = self.obj.skin_data.copy()
+        vert_indexes = [vert_index for vert_index, inf in verts_and_infs]
+        infs = [inf for vert_index, inf in verts_and_infs]
+        old_rows = self.obj.skin_data.copy_vertexes(set(vert_indexes))
 
-        for vert_index, inf in verts_and_infs:
-            old_value, new_value = self.obj.skin_data.calculate_new_value(input_value, vert_index, inf, weight_operation)
-            if utils.is_close(old_value, new_value):  # Skip it if the new value is too similar.
-                continue
-
-            self.obj.skin_data.update_weight_value(vert_index, inf, new_value)
-            sel_vert_indexes.add(vert_index)
+        sel_vert_indexes = self.obj.skin_data.edit_weight_values(
+            vert_indexes, infs, input_value, weight_operation, locks=self.obj.inf_locks)
         
         if not sel_vert_indexes:
             return
@@ -1266,10 +1365,10 @@ class WeightsEditor(QtWidgets.QWidget):
         self.add_undo_command(
             description,
             self.obj.name,
-            old_skin_data,
-            self.obj.skin_data.copy(),
+            old_rows,
             list(sel_vert_indexes),
-            weights_view.save_table_selection())
+            weights_view.save_table_selection(),
+            merge_key=(weight_operation, frozenset(verts_and_infs)))
     
     def _switch_color_style(self, color_theme):
         """
@@ -1307,37 +1406,36 @@ class WeightsEditor(QtWidgets.QWidget):
             OpenMaya.MGlobal.displayError("No vertexes are selected.")
             return
 
-        old_skin_data = self.obj.skin_data.copy()
-
         weights_view = self.get_active_weights_view()
         table_selection = weights_view.save_table_selection()
 
         sel_vert_indexes = utils.extract_indexes(
             utils.get_vert_indexes(self.obj.name))
 
+        old_rows = self.obj.skin_data.copy_vertexes(sel_vert_indexes)
+
         if smooth_operation == SmoothOperation.Normal:
             self.obj.smooth_weights(
                 selected_vertexes,
-                self._smooth_strength_spinbox.value())
+                self._smooth_strength_spinbox.value(),
+                iterations=self._smooth_iterations_spinbox.value())
 
             self._recollect_table_data(update_skin_data=False, update_verts=False)
 
             undo_caption = "Smooth weights"
         else:
             # Re-collects all data since this smooth doesn't change internal data.
-            utils.br_smooth_verts(self._smooth_strength_spinbox.value(), True)
+            for i in range(self._smooth_iterations_spinbox.value()):
+                utils.br_smooth_verts(self._smooth_strength_spinbox.value(), True)
             self._recollect_table_data()
             undo_caption = "Smooth weights (all influences)"
 
         self.update_vert_colors(vert_filter=selected_vertexes)
 
-        new_skin_data = self.obj.skin_data.copy()
-
         self.add_undo_command(
             undo_caption,
             self.obj.name,
-            old_skin_data,
-            new_skin_data,
+            old_rows,
             sel_vert_indexes,
             table_selection,
             skip_first_redo=True)
@@ -1390,22 +1488,14 @@ class WeightsEditor(QtWidgets.QWidget):
     def _apply_filter_to_inf_list(self):
         self.inf_list.apply_filter("*" + self._inf_filter_edit.text() + "*")
 
+    @tracer.traced()
     def _mirror_weights(self, selection_only):
         if not self.obj.is_valid():
             return
 
-        old_skin_data = self.obj.skin_data.copy()
-
         weights_view = self.get_active_weights_view()
         table_selection = weights_view.save_table_selection()
 
-        if selection_only:
-            vert_indexes = utils.extract_indexes(
-                utils.get_vert_indexes(self.obj.name))
-        else:
-            vert_indexes = utils.extract_indexes(
-                utils.get_all_vert_indexes(self.obj.name))
-
         mirror_mode = self._mirror_mode.currentText().lstrip("-")
         mirror_inverse = self._mirror_mode.currentText().startswith("-")
 
@@ -1427,6 +1517,23 @@ class WeightsEditor(QtWidgets.QWidget):
 
         inf_association = inf_options[self._mirror_inf.currentText()]
 
+        if selection_only:
+            vert_indexes = utils.extract_indexes(
+                utils.get_vert_indexes(self.obj.name))
+        else:
+            vert_indexes = utils.extract_indexes(
+                utils.get_all_vert_indexes(self.obj.name))
+
+        in_memory = self.obj.can_mirror_in_memory(surface_association, inf_association)
+
+        if in_memory:
+            # Only the vertexes that receive weights change.
+            vert_indexes = self.obj.get_mirror_targets(mirror_mode, mirror_inverse, vert_indexes)
+            if not vert_indexes:
+                return
+
+        old_rows = self.obj.skin_data.copy_vertexes(vert_indexes)
+
         self.obj.mirror_skin_weights(
             mirror_mode,
             mirror_inverse,
@@ -1434,18 +1541,18 @@ class WeightsEditor(QtWidgets.QWidget):
             inf_association,
             vert_filter=vert_indexes)
 
-        self._recollect_table_data(update_verts=False)
+        if in_memory:
+            self._recollect_table_data(update_skin_data=False, update_verts=False)
+        else:
+            self._recollect_table_data(update_verts=False)
 
-        vert_filter = vert_indexes if selection_only else []
+        vert_filter = vert_indexes if selection_only or in_memory else []
         self.update_vert_colors(vert_filter=vert_filter)
 
-        new_skin_data = self.obj.skin_data.copy()
-
         self.add_undo_command(
             "Mirror weights",
             self.obj.name,
-            old_skin_data,
-            new_skin_data,
+            old_rows,
             vert_indexes,
             table_selection,
             skip_first_redo=True)
@@ -1489,6 +1596,7 @@ class WeightsEditor(QtWidgets.QWidget):
 # Callbacks
 #
 
+    @tracer.traced()
     def _selection_on_changed(self, *args):
         """
         Triggers when user selects a new vertex in the viewport.
@@ -1531,6 +1639,10 @@ class WeightsEditor(QtWidgets.QWidget):
                 utils.toggle_display_colors(self.obj.name, False)
                 utils.delete_temp_inputs(self.obj.name)
         finally:
+            # Nothing is left recording once the tool is gone.
+            tracer.set_enabled(False)
+
+            self.obj.remove_callbacks()
             self._remove_selection_callback()
             self._remove_shortcuts()
             self._del_prev_instance()
@@ -1582,6 +1694,21 @@ class WeightsEditor(QtWidgets.QWidget):
             self._weights_table.table_model.max_display_count = dialog.intValue()
             self._weights_table.end_update()
 
+    def _set_undo_budget_on_triggered(self):
+        dialog = QtWidgets.QInputDialog(parent=self)
+        dialog.setInputMode(QtWidgets.QInputDialog.IntInput)
+        dialog.setIntRange(1, 99999)
+        dialog.setIntValue(self._undo_stack.byte_budget() // 1048576)
+        dialog.setWindowTitle("Enter undo memory budget")
+        dialog.setLabelText(
+            "Megabytes the undo history can hold.\n"
+            "The oldest undos are dropped once it's over this.\n")
+        dialog.exec_()
+
+        if dialog.result() == QtWidgets.QDialog.Accepted:
+            self._undo_stack.set_byte_budget(dialog.intValue() * 1048576)
+            self._set_undo_buttons_enabled_state()
+
     def _header_on_middle_clicked(self, inf):
         """
         Sets active influence to color with.
@@ -1626,10 +1753,10 @@ class WeightsEditor(QtWidgets.QWidget):
         if not self.obj.is_valid():
             return
         
-        old_skin_data = self.obj.skin_data.copy()
         weights_view = self.get_active_weights_view()
         table_selection = weights_view.save_table_selection()
         sel_vert_indexes = utils.extract_indexes(utils.get_vert_indexes(self.obj.name))
+        old_rows = self.obj.skin_data.copy_vertexes(sel_vert_indexes)
 
         result = self.obj.prune_weights(self._prune_by_value_spinbox.value())
         if not result:
@@ -1639,13 +1766,10 @@ class WeightsEditor(QtWidgets.QWidget):
         
         self.update_vert_colors(vert_filter=sel_vert_indexes)
         
-        new_skin_data = self.obj.skin_data.copy()
-        
         self.add_undo_command(
             "Prune weights",
             self.obj.name,
-            old_skin_data,
-            new_skin_data,
+            old_rows,
             sel_vert_indexes,
             table_selection,
             skip_first_redo=True)
@@ -1658,22 +1782,19 @@ class WeightsEditor(QtWidgets.QWidget):
         if not self.obj.is_valid():
             return
 
-        old_skin_data = self.obj.skin_data.copy()
         weights_view = self.get_active_weights_view()
         table_selection = weights_view.save_table_selection()
         sel_vert_indexes = utils.extract_indexes(utils.get_vert_indexes(self.obj.name))
+        old_rows = self.obj.skin_data.copy_vertexes(sel_vert_indexes)
 
         result = self.obj.prune_max_infs(self._prune_max_infs_spinbox.value(), vert_filter=sel_vert_indexes)
         if not result:
             return
 
-        new_skin_data = self.obj.skin_data.copy()
-
         self.add_undo_command(
             "Prune maximum influences",
             self.obj.name,
-            old_skin_data,
-            new_skin_data,
+            old_rows,
             sel_vert_indexes,
             table_selection)
 
@@ -1723,29 +1844,33 @@ class WeightsEditor(QtWidgets.QWidget):
 
         weights_view = self.get_active_weights_view()
         table_selection = weights_view.save_table_selection()
-        old_skin_data = self.obj.skin_data.copy()
 
         for inf in self._copied_vertex["weights"]:
             if inf not in self.obj.infs:
                 OpenMaya.MGlobal.displayError("Unable to paste vertex because the skin is missing influence `{}`".format(inf))
                 return
 
-        for vert_index in vert_indexes:
-            self.obj.skin_data[vert_index] = copy.deepcopy(self._copied_vertex)
+        old_rows = self.obj.skin_data.copy_vertexes(vert_indexes)
 
-        new_skin_data = self.obj.skin_data.copy()
+        for vert_index in vert_indexes:
+            self.obj.skin_data[vert_index] = self._copied_vertex
 
         self.add_undo_command(
             "Paste vertex",
             self.obj.name,
-            old_skin_data,
-            new_skin_data,
+            old_rows,
             vert_indexes,
             table_selection)
 
+    def _get_export_compression(self):
+        for codec, compression_action in self._compression_actions.items():
+            if compression_action.isChecked():
+                return codec
+        return SkinCompression.Uncompressed
+
     def _export_weights_on_clicked(self):
         try:
-            self.obj.export_skin()
+            self.obj.export_skin(compression=self._get_export_compression())
         except Exception as err:
             print(traceback.format_exc())
             OpenMaya.MGlobal.displayError(str(err))
@@ -1753,12 +1878,18 @@ class WeightsEditor(QtWidgets.QWidget):
     def _export_all_weights_on_clicked(self):
         try:
             delete_skin_clusters = self._delete_skin_on_export_all_action.isChecked()
-            SkinnedObj.export_all_skins(delete_skin_clusters)
+            results = SkinnedObj.export_all_skins(
+                delete_skin_clusters,
+                compression=self._get_export_compression(),
+                incremental=self._incremental_export_all_action.isChecked())
+
+            if results:
+                print(ExportPipeline.format_report(results))
         except Exception as err:
             print(traceback.format_exc())
             OpenMaya.MGlobal.displayError(str(err))
 
-    def _import_weights_on_clicked(self, use_world_positions):
+    def _import_weights_on_clicked(self, use_world_positions, interpolate=False):
         try:
             msg_box = QtWidgets.QMessageBox(
                 QtWidgets.QMessageBox.Warning,
@@ -1772,7 +1903,7 @@ class WeightsEditor(QtWidgets.QWidget):
             if msg_box.exec_() == QtWidgets.QMessageBox.Cancel:
                 return False
 
-            status = self.obj.import_skin(world_space=use_world_positions)
+            status = self.obj.import_skin(world_space=use_world_positions, interpolate=interpolate)
             if status and self.obj.is_valid():
                 self._update_obj(self.obj.name)
         except Exception as err:
@@ -1833,26 +1964,24 @@ class WeightsEditor(QtWidgets.QWidget):
             OpenMaya.MGlobal.displayError("Must have a picked object with a valid skin.")
             return
 
-        old_skin_data = self.obj.skin_data.copy()
-
         weights_view = self.get_active_weights_view()
         table_selection = weights_view.save_table_selection()
 
         vert_indexes = utils.extract_indexes(
             utils.get_all_vert_indexes(self.obj.name))
 
-        self.obj.flood_weights_to_closest()
+        old_rows = self.obj.skin_data.copy_vertexes(vert_indexes)
+
+        self.obj.flood_weights_to_closest(
+            use_bone_segments=self._flood_to_bone_segments_action.isChecked())
 
         self._recollect_table_data(update_verts=False)
         self.update_vert_colors()
 
-        new_skin_data = self.obj.skin_data.copy()
-
         self.add_undo_command(
             "Flood weights to closest",
             self.obj.name,
-            old_skin_data,
-            new_skin_data,
+            old_rows,
             vert_indexes,
             table_selection,
             skip_first_redo=True)
@@ -1908,6 +2037,13 @@ class WeightsEditor(QtWidgets.QWidget):
         dialog = about_dialog.AboutDialog.launch(self.version, self)
         dialog.deleteLater()
 
+    def _show_trace_on_triggered(self):
+        if self._trace_dialog is None:
+            self._trace_dialog = trace_dialog.TraceDialog.launch(self)
+        else:
+            self._trace_dialog.show()
+            self._trace_dialog.raise_()
+
     def _github_page_on_triggered(self):
         webbrowser.open(constants.GITHUB_HOME)
 
@@ -2002,7 +2138,7 @@ class WeightsEditor(QtWidgets.QWidget):
             OpenMaya.MGlobal.displayError("Nothing is selected in the influence list.")
             return
         
-        old_skin_data = self.obj.skin_data.copy()
+        old_rows = self.obj.skin_data.copy_vertexes(sel_vert_indexes)
 
         weights_view = self.get_active_weights_view()
         table_selection = weights_view.save_table_selection()
@@ -2010,17 +2146,13 @@ class WeightsEditor(QtWidgets.QWidget):
         # Add infs by setting a very low value so it doesn't effect other weights too much.
         for inf in sel_infs:
             for vert_index in sel_vert_indexes:
-                weight_data = self.obj.skin_data[vert_index]["weights"]
-                if weight_data.get(inf) is None:
-                    self.obj.skin_data.update_weight_value(vert_index, inf, 0.001)
-
-        new_skin_data = self.obj.skin_data.copy()
+                if self.obj.skin_data.get_weight(vert_index, inf) is None:
+                    self.obj.skin_data.update_weight_value(vert_index, inf, 0.001, locks=self.obj.inf_locks)
 
         self.add_undo_command(
             "Add influence to verts",
             self.obj.name,
-            old_skin_data,
-            new_skin_data,
+            old_rows,
             sel_vert_indexes,
             table_selection)
         
@@ -2064,6 +2196,7 @@ class WeightsEditor(QtWidgets.QWidget):
 
         self._collect_inf_locks()
 
+    @tracer.traced()
     def toggle_inf_locks(self, infs, enabled):
         """
         Sets lock on influences by table's columns.
@@ -2099,6 +2232,7 @@ class WeightsEditor(QtWidgets.QWidget):
 
         return True
 
+    @tracer.traced()
     def update_vert_colors(self, vert_filter=[]):
         """
         Displays active influence.
@@ -2130,20 +2264,41 @@ class WeightsEditor(QtWidgets.QWidget):
 
         utils.toggle_display_colors(self.obj.name, show_colors)
 
+    @tracer.traced()
     def add_undo_command(
-            self, description, obj, old_skin_data, new_skin_data, vert_indexes,
-            table_selection, skip_first_redo=False):
+            self, description, obj, old_rows, vert_indexes,
+            table_selection, skip_first_redo=False, merge_key=None):
+        """
+        Pushes an edit onto the undo stack.
+        Only the rows of the edited vertexes are kept, and the new rows are copied from the current skin data.
+
+        Args:
+            description(string): The label to show up to describe this action.
+            obj(string): Object that was edited.
+            old_rows(dict): Rows from SkinData.copy_vertexes() before the edit. Can include extra vertexes.
+            vert_indexes(int[]): Vertexes that were edited.
+            table_selection(dict): Selection data to revert back to.
+            skip_first_redo(bool): Enable if the edit was already applied to the skin.
+            merge_key(object): Merges with the previous command if it was pushed with the same key.
+        """
+        old_rows = {
+            vert_index: old_rows[vert_index]
+            for vert_index in vert_indexes
+        }
+
+        new_rows = self.obj.skin_data.copy_vertexes(vert_indexes)
 
         self._undo_stack.push(
             command_edit_weights.CommandEditWeights(
                 self.__class__,
                 description,
                 obj,
-                old_skin_data,
-                new_skin_data,
+                old_rows,
+                new_rows,
                 vert_indexes,
                 table_selection,
-                skip_first_redo=skip_first_redo))
+                skip_first_redo=skip_first_redo,
+                merge_key=merge_key))
 
         self._set_undo_buttons_enabled_state()
 
@@ -7,6 +7,8 @@ from maya import mel
 from maya import OpenMaya
 from maya import OpenMayaUI
 from maya import OpenMayaAnim
+from maya.api import OpenMaya as om2
+from maya.api import OpenMayaAnim as oma2
 
 from PySide2 import QtCore
 from PySide2 import QtGui
@@ -14,6 +16,14 @@ from PySide2 import QtWidgets
 
 
 from weights_editor_tool import constants
+from weights_editor_tool.math_utils import is_close, clamp, get_weight_color
+from weights_editor_tool.classes.tracer import tracer
+
+
+# The tool's modules import these instead of maya.cmds and maya.mel,
+# so the performance trace counts their Maya commands without touching anyone else's.
+cmds = tracer.count_calls(cmds, "cmds")
+mel = tracer.count_calls(mel, "mel")
 
 
 if sys.version_info > (3, 0):
@@ -169,21 +179,6 @@ def get_vert_count(obj):
         return cmds.polyEvaluate(obj, vertex=True)
 
 
-def is_close(val1, val2, rel_tol=1e-09, abs_tol=1e-15):
-    """
-    Determines if the two float values are close enough to each other.
-    https://www.python.org/dev/peps/pep-0485/#proposed-implementation
-    """
-    return abs(val1 - val2) <= max(rel_tol * max(abs(val1), abs(val2)), abs_tol)
-
-
-def clamp(min_value, max_value, value):
-    """
-    Clamps a value to the supplied range.
-    """
-    return max(min_value, min(value, max_value))
-
-
 def remap_range(old_min, old_max, new_min, new_max, old_value):
     """
     Converts a value from one range to another.
@@ -327,6 +322,67 @@ def get_influence_ids(skin_cluster):
     return inf_ids
 
 
+def to_mfn_skin_cluster(skin_cluster):
+    """
+    Gets a skinCluster as an api 2.0 function set.
+
+    Args:
+        skin_cluster(string)
+
+    Returns:
+        An MFnSkinCluster.
+    """
+    msel_list = om2.MSelectionList()
+    msel_list.add(skin_cluster)
+    return oma2.MFnSkinCluster(msel_list.getDependNode(0))
+
+
+def get_skin_geometry_path(mfn_skin_cluster):
+    """
+    Gets the shape that the skinCluster deforms.
+
+    Args:
+        mfn_skin_cluster(api 2.0 MFnSkinCluster)
+
+    Returns:
+        An MDagPath.
+    """
+    output_objs = mfn_skin_cluster.getOutputGeometry()
+    if not output_objs:
+        raise RuntimeError("The skinCluster isn't deforming any geometry.")
+
+    return om2.MDagPath.getAPathTo(output_objs[0])
+
+
+def create_vert_components(dag_path, vert_indexes=None):
+    """
+    Builds a single component object of vertexes (or cvs on curves) to pass to the api.
+
+    Args:
+        dag_path(MDagPath): The shape the components are on.
+        vert_indexes(int[]): Vertexes to include, or None to include all of them.
+
+    Returns:
+        An MObject.
+    """
+    if dag_path.hasFn(om2.MFn.kNurbsCurve):
+        component_type = om2.MFn.kCurveCVComponent
+        vert_count = om2.MFnNurbsCurve(dag_path).numCVs
+    else:
+        component_type = om2.MFn.kMeshVertComponent
+        vert_count = om2.MFnMesh(dag_path).numVertices
+
+    mfn_components = om2.MFnSingleIndexedComponent()
+    components = mfn_components.create(component_type)
+
+    if vert_indexes is None:
+        mfn_components.setCompleteData(vert_count)
+    else:
+        mfn_components.addElements(list(vert_indexes))
+
+    return components
+
+
 def toggle_display_colors(obj, enabled):
     """
     Sets attribute to show vertex colors.
@@ -341,37 +397,6 @@ def toggle_display_colors(obj, enabled):
             cmds.setAttr("{0}.displayColors".format(obj), enabled)
 
 
-def get_weight_color(weight, start_color=[0, 0, 1], mid_color=[0, 1, 0], end_color=[1, 0, 0], full_color=[1.0, 1.0, 1.0]):
-    """
-    Gets color that represents supplied weight value.
-    A value of 0 will be bias towards start_color, 1.0 will be biased towards end_color.
-    
-    Args:
-        weight(float): A value between 0.0 to 1.0.
-        start_color(float[]): Represents rbg when weight is 0.0.
-        mid_color(float[]): Represents rbg when weight is 0.5.
-        end_color(float[]): Represents rbg when weight is 1.0.
-        full_color(float[]): Represents rbg when weight is equal to 1.0.
-    
-    Returns:
-        An rbg list.
-    """
-    if weight == 1.0:
-        r, g, b = full_color
-    elif weight < 0.5:
-        w = weight * 2
-        r = start_color[0] + w * (mid_color[0] - start_color[0])
-        g = start_color[1] + w * (mid_color[1] - start_color[1])
-        b = start_color[2] + w * (mid_color[2] - start_color[2])
-    else:
-        w = (weight - 0.5) * 2
-        r = mid_color[0] + w * (end_color[0] - mid_color[0])
-        g = mid_color[1] + w * (end_color[1] - mid_color[1])
-        b = mid_color[2] + w * (end_color[2] - mid_color[2])
-
-    return [r, g, b]
-
-
 def apply_vert_colors(obj, colors, vert_indexes):
     """
     Sets vert colors on the supplied mesh.
@@ -1,4 +1,4 @@
-from maya import cmds
+from weights_editor_tool.weights_editor_utils import cmds
 
 from PySide2 import QtGui
 from PySide2 import QtCore
@@ -28,7 +28,7 @@ class AbstractWeightsView(QtWidgets.QTableView):
         self._orientation = header_orientation
         self._font = QtGui.QFont(system_font.family(), system_font.pixelSize())
         self._editor_inst = editor_inst
-        self._old_skin_data = None  # Need to store this to work with undo/redo.
+        self._old_rows = None  # Need to store this to work with undo/redo.
         self.table_model = None
 
         self._header = None
@@ -154,7 +154,7 @@ class AbstractWeightsView(QtWidgets.QTableView):
         # Begins edit on current cell.
         if event.button() == QtCore.Qt.MouseButton.RightButton:
             # Save this prior to any changes.
-            self._old_skin_data = self._editor_inst.obj.skin_data.copy()
+            self._old_rows = self._editor_inst.obj.skin_data.copy_vertexes(self._editor_inst.vert_indexes)
             self.edit(self.currentIndex())
 
     def _get_last_clicked_inf(self):
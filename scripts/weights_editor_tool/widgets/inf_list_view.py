@@ -1,7 +1,7 @@
 import fnmatch
 from functools import partial
 
-from maya import cmds
+from weights_editor_tool.weights_editor_utils import cmds
 from maya import OpenMaya
 
 from PySide2 import QtGui
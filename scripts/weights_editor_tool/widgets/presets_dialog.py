@@ -1,4 +1,4 @@
-from maya import cmds
+from weights_editor_tool.weights_editor_utils import cmds
 
 from PySide2 import QtCore
 from PySide2 import QtGui
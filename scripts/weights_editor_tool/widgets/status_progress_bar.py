@@ -1,5 +1,4 @@
-from maya import cmds
-from maya import mel
+from weights_editor_tool.weights_editor_utils import cmds, mel
 
 
 class StatusProgressBar:
@@ -7,11 +6,16 @@ class StatusProgressBar:
     """
     Creates a progress bar in Maya's status bar.
 
+    Maya only has one, so a bar that starts while another is running leaves it alone
+    and only forwards cancelling, which keeps the outer bar's overall progress on screen.
+
     Args:
         name(str): What is to be displayed.
         count(int): The length to iterate over.
     """
 
+    _active_count = 0
+
     def __init__(self, name, count, interruptable=True):
         if count <= 0:
             raise ValueError("Progress bar count cannot be set to 0.")
@@ -21,6 +25,7 @@ class StatusProgressBar:
         self._progress_bar = None
         self._in_gui_mode = not cmds.about(batch=True)
         self._interruptable = interruptable
+        self._is_nested = False
 
         if self._in_gui_mode:
             self._progress_bar = mel.eval("$tmp = $gMainProgressBar")
@@ -37,7 +42,10 @@ class StatusProgressBar:
         cmds.progressBar(self._progress_bar, edit=True, endProgress=True)
 
     def start(self):
-        if self._in_gui_mode:
+        self._is_nested = StatusProgressBar._active_count > 0
+        StatusProgressBar._active_count += 1
+
+        if self._in_gui_mode and not self._is_nested:
             self._reset()
 
             cmds.progressBar(
@@ -52,7 +60,9 @@ class StatusProgressBar:
         return self
 
     def end(self):
-        if self._in_gui_mode:
+        StatusProgressBar._active_count = max(0, StatusProgressBar._active_count - 1)
+
+        if self._in_gui_mode and not self._is_nested:
             cmds.progressBar(self._progress_bar, edit=True, endProgress=True)
 
     def was_cancelled(self):
@@ -62,5 +72,5 @@ class StatusProgressBar:
             return False
 
     def next(self):
-        if self._in_gui_mode:
+        if self._in_gui_mode and not self._is_nested:
             cmds.progressBar(self._progress_bar, edit=True, step=1)
@@ -0,0 +1,139 @@
+import os
+
+from PySide2 import QtCore
+from PySide2 import QtWidgets
+
+from weights_editor_tool.classes.tracer import tracer
+
+
+class TraceDialog(QtWidgets.QDialog):
+    """
+    Lists the last recorded operations with a breakdown of where their time went.
+    Stays open next to the tool and refreshes as new operations finish.
+    """
+
+    RefreshInterval = 500
+
+    def __init__(self, parent=None):
+        QtWidgets.QDialog.__init__(self, parent=parent)
+
+        self._last_finished_count = None
+
+        self._create_gui()
+
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.setInterval(self.RefreshInterval)
+        self._refresh_timer.timeout.connect(self._refresh_if_changed)
+
+    def _create_gui(self):
+        self._record_checkbox = QtWidgets.QCheckBox("Record", parent=self)
+        self._record_checkbox.setToolTip(
+            "Times the tool's operations and counts Maya commands.\n"
+            "Leave this off when not needed since it adds a bit of overhead.")
+        self._record_checkbox.setChecked(tracer.is_enabled())
+        self._record_checkbox.toggled.connect(self._record_on_toggled)
+
+        self._clear_button = QtWidgets.QPushButton("Clear", parent=self)
+        self._clear_button.clicked.connect(self._clear_on_clicked)
+
+        self._copy_button = QtWidgets.QPushButton("Copy as text", parent=self)
+        self._copy_button.clicked.connect(self._copy_on_clicked)
+
+        self._export_button = QtWidgets.QPushButton("Export trace", parent=self)
+        self._export_button.setToolTip("Saves a json file that chrome://tracing or Perfetto can open.")
+        self._export_button.clicked.connect(self._export_on_clicked)
+
+        self._buttons_layout = QtWidgets.QHBoxLayout()
+        self._buttons_layout.addWidget(self._record_checkbox)
+        self._buttons_layout.addStretch()
+        self._buttons_layout.addWidget(self._clear_button)
+        self._buttons_layout.addWidget(self._copy_button)
+        self._buttons_layout.addWidget(self._export_button)
+
+        self._tree = QtWidgets.QTreeWidget(parent=self)
+        self._tree.setHeaderLabels(["Operation", "Total (ms)", "Self (ms)", "Maya commands"])
+        self._tree.setAlternatingRowColors(True)
+        self._tree.header().setSectionResizeMode(0, QtWidgets.QHeaderView.Stretch)
+
+        self._main_layout = QtWidgets.QVBoxLayout()
+        self._main_layout.addLayout(self._buttons_layout)
+        self._main_layout.addWidget(self._tree)
+        self.setLayout(self._main_layout)
+
+        self.setWindowTitle("Performance trace")
+        self.resize(600, 500)
+
+    @staticmethod
+    def _format_counts(span):
+        return ", ".join(
+            "{0} x{1}".format(counter_name.split(".")[-1], value)
+            for counter_name, value in sorted(span.counts.items(), key=lambda item: -item[1])
+        )
+
+    def _create_item(self, span, parent):
+        item = QtWidgets.QTreeWidgetItem(parent, [
+            span.name,
+            "{0:.2f}".format(span.duration() * 1000),
+            "{0:.2f}".format(span.self_duration() * 1000),
+            self._format_counts(span)
+        ])
+
+        for column in [1, 2]:
+            item.setTextAlignment(column, QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+
+        for child in span.children:
+            self._create_item(child, item)
+
+        return item
+
+    def _refresh_if_changed(self):
+        if tracer.finished_count() != self._last_finished_count:
+            self.refresh()
+
+    def refresh(self):
+        self._last_finished_count = tracer.finished_count()
+
+        self._tree.clear()
+
+        # Newest operations go on top.
+        for span in reversed(tracer.get_history()):
+            self._create_item(span, self._tree)
+
+        self._tree.resizeColumnToContents(1)
+        self._tree.resizeColumnToContents(2)
+
+    def _record_on_toggled(self, enabled):
+        tracer.set_enabled(enabled)
+
+    def _clear_on_clicked(self):
+        tracer.clear()
+        self.refresh()
+
+    def _copy_on_clicked(self):
+        lines = []
+        for span in tracer.get_history():
+            lines.extend(tracer.format_span(span))
+
+        QtWidgets.QApplication.clipboard().setText("\n".join(lines))
+
+    def _export_on_clicked(self):
+        file_path, _ = QtWidgets.QFileDialog.getSaveFileName(
+            self, "Export trace", os.path.join(os.path.expanduser("~"), "weights_editor_trace.json"), "Trace (*.json)")
+
+        if file_path:
+            tracer.export_chrome_trace(file_path)
+
+    def showEvent(self, *args):
+        self.refresh()
+        self._refresh_timer.start()
+        QtWidgets.QDialog.showEvent(self, *args)
+
+    def closeEvent(self, *args):
+        self._refresh_timer.stop()
+        QtWidgets.QDialog.closeEvent(self, *args)
+
+    @classmethod
+    def launch(cls, parent):
+        dialog = cls(parent=parent)
+        dialog.show()
+        return dialog
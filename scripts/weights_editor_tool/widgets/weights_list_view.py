@@ -39,12 +39,11 @@ class ListView(abstract_weights_view.AbstractWeightsView):
             self._editor_inst.add_undo_command(
                 "Set skin weights",
                 self._editor_inst.obj.name,
-                self._old_skin_data,
-                self._editor_inst.obj.skin_data.copy(),
+                self._old_rows,
                 self._editor_inst.vert_indexes,
                 self.save_table_selection())
         
-        self._old_skin_data = None
+        self._old_rows = None
 
     def _sort_ascending_on_triggered(self):
         self._reorder_by_values(QtCore.Qt.DescendingOrder)
@@ -249,9 +248,13 @@ class ListModel(abstract_weights_view.AbstractModel):
         # Distribute the weights.
         inf = self.get_inf(index.row())
 
-        for vert_index in self._editor_inst.vert_indexes:
-            self._editor_inst.obj.skin_data.update_weight_value(
-                vert_index, inf, value)
+        vert_indexes = self._editor_inst.vert_indexes
+
+        self._editor_inst.obj.skin_data.update_weight_values(
+            vert_indexes,
+            [inf] * len(vert_indexes),
+            [value] * len(vert_indexes),
+            locks=self._editor_inst.obj.inf_locks)
 
         return True
     
@@ -304,7 +307,7 @@ class ListModel(abstract_weights_view.AbstractModel):
 
         if inf not in self.average_weights:
             values = [
-                self._editor_inst.obj.skin_data[vert_index]["weights"].get(inf) or 0
+                self._editor_inst.obj.skin_data.get_weight(vert_index, inf) or 0
                 for vert_index in self._editor_inst.vert_indexes
             ]
 
@@ -1,4 +1,4 @@
-from maya import cmds
+from weights_editor_tool.weights_editor_utils import cmds
 
 from PySide2 import QtCore
 from PySide2 import QtWidgets
@@ -37,11 +37,11 @@ class TableView(abstract_weights_view.AbstractWeightsView):
         is_cancelled = (hint == QtWidgets.QAbstractItemDelegate.RevertModelCache)
         
         if not is_cancelled:
-            for index in self.selectedIndexes():
-                if index == self.currentIndex():
-                    continue
-                
-                self.model().setData(index, None, QtCore.Qt.EditRole)
+            self.model().set_input_value_on_indexes([
+                index
+                for index in self.selectedIndexes()
+                if index != self.currentIndex()
+            ])
         
         QtWidgets.QTableView.closeEditor(self, editor, hint)
         
@@ -55,12 +55,11 @@ class TableView(abstract_weights_view.AbstractWeightsView):
             self._editor_inst.add_undo_command(
                 "Set skin weights",
                 self._editor_inst.obj.name,
-                self._old_skin_data,
-                self._editor_inst.obj.skin_data.copy(),
+                self._old_rows,
                 vert_indexes,
                 self.save_table_selection())
         
-        self._old_skin_data = None
+        self._old_rows = None
 
     def _sort_ascending_on_triggered(self):
         self._reorder_rows(self._header.last_index, QtCore.Qt.DescendingOrder)
@@ -124,7 +123,7 @@ class TableView(abstract_weights_view.AbstractWeightsView):
         else:
             self._editor_inst.vert_indexes = sorted(
                 self._editor_inst.vert_indexes,
-                key=lambda x: self._editor_inst.obj.skin_data[x]["weights"].get(inf) or 0.0,
+                key=lambda x: self._editor_inst.obj.skin_data.get_weight(x, inf) or 0.0,
                 reverse=order)
 
         self.end_update()
@@ -316,10 +315,25 @@ class TableModel(abstract_weights_view.AbstractModel):
         inf = self.get_inf(index.column())
         vert_index = self.get_vert_index(index.row())
         self._editor_inst.obj.skin_data.update_weight_value(
-            vert_index, inf, value)
+            vert_index, inf, value, locks=self._editor_inst.obj.inf_locks)
         
         return True
     
+    def set_input_value_on_indexes(self, indexes):
+        """
+        Sets the value the user entered in setData() on the rest of the cells in one batch.
+        """
+        if self.input_value is None:
+            return
+
+        indexes = [index for index in indexes if index.isValid()]
+
+        self._editor_inst.obj.skin_data.update_weight_values(
+            [self.get_vert_index(index.row()) for index in indexes],
+            [self.get_inf(index.column()) for index in indexes],
+            [self.input_value] * len(indexes),
+            locks=self._editor_inst.obj.inf_locks)
+
     def headerData(self, column, orientation, role):
         """
         Deterimines the header's labels and style.
@@ -368,7 +382,7 @@ class TableModel(abstract_weights_view.AbstractModel):
     def _get_value_by_index(self, index):
         inf = self.get_inf(index.column())
         vert_index = self.get_vert_index(index.row())
-        return self._editor_inst.obj.skin_data[vert_index]["weights"].get(inf) or 0
+        return self._editor_inst.obj.skin_data.get_weight(vert_index, inf) or 0
 
     def get_vert_index(self, row):
         return self._editor_inst.vert_indexes[row]